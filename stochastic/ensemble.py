@@ -0,0 +1,200 @@
+"""Parallel generation of ensembles of realizations."""
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from inspect import signature
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from stochastic.utils.validation import check_positive_integer
+
+# Default maximum number of chunks an ensemble is split into
+MAX_CHUNKS = 64
+
+
+def _sample_paths(process, m, n, kwargs):
+    """Generate m realizations, as a batch if the process supports it."""
+    if hasattr(process, "sample_batch"):
+        return process.sample_batch(m, n, **kwargs)
+    return [process.sample(n, **kwargs) for _ in range(m)]
+
+
+def _fill_paths(process, out, n, kwargs):
+    """Fill ``out`` with realizations, in place if the process supports it.
+
+    Gives the same realizations as :py:func:`_sample_paths`.
+    """
+    if hasattr(process, "sample_batch"):
+        if "out" in signature(process.sample_batch).parameters:
+            process.sample_batch(len(out), n, out=out, **kwargs)
+        else:
+            out[...] = process.sample_batch(len(out), n, **kwargs)
+    elif "out" in signature(process.sample).parameters:
+        for path in out:
+            process.sample(n, out=path, **kwargs)
+    else:
+        for path in out:
+            path[...] = process.sample(n, **kwargs)
+
+
+def _seed_process(process, seed):
+    """Copy a process, giving it its own generator seeded from ``seed``.
+
+    The copy is deep so that composite processes, which pass their generator
+    on to the processes they contain, leave the caller's processes untouched
+    and share no generators between workers.
+    """
+    process = copy.deepcopy(process)
+    # Fix the floating point type of processes without their own, since
+    # worker processes do not share the caller's stochastic.random.dtype.
+    process.dtype = process.dtype
+    process.rng = np.random.default_rng(seed)
+    return process
+
+
+def _fill_chunk(process, seed, out, n, kwargs):
+    """Fill ``out`` with realizations using a generator seeded from ``seed``."""
+    _fill_paths(_seed_process(process, seed), out, n, kwargs)
+
+
+def _fill_shared_chunk(process, seed, start, stop, n, kwargs, name, shape, dtype):
+    """Write realizations start to stop of an ensemble to shared memory."""
+    shared = SharedMemory(name=name)
+    try:
+        ensemble = np.ndarray(shape, dtype=dtype, buffer=shared.buf)
+        _fill_chunk(process, seed, ensemble[start:stop], n, kwargs)
+    finally:
+        # The buffer cannot be released while arrays still refer to it
+        ensemble = None
+        shared.close()
+
+
+def _chunks(m, chunk_size, seed):
+    """Split m realizations into chunks, each with its own child seed."""
+    if chunk_size is None:
+        chunk_size = -(-m // MAX_CHUNKS)
+    check_positive_integer(chunk_size, "Chunk size")
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    starts = range(0, m, chunk_size)
+    return [
+        (child, start, min(start + chunk_size, m))
+        for child, start in zip(seed.spawn(len(starts)), starts)
+    ]
+
+
+def sample_ensemble(
+    process,
+    m,
+    n,
+    workers=None,
+    chunk_size=None,
+    seed=None,
+    backend="processes",
+    **kwargs,
+):
+    """Generate m independent realizations of a process in parallel.
+
+    The realizations are split into chunks of ``chunk_size``, and each chunk
+    is generated by a worker with its own generator seeded by a child of
+    :py:class:`numpy.random.SeedSequence` ``seed``. Realizations depend on
+    the seed and chunk size, but not on the number of workers or the
+    backend, so results are bit-identical for any ``workers``. The process'
+    own generator is not used.
+
+    With the ``"processes"`` backend, chunks are generated in a process pool
+    and written directly into a shared memory array. With the ``"threads"``
+    backend, chunks are generated in a thread pool, each thread filling its
+    slice of the output array in place, without pickling or copying. Since
+    numpy releases the GIL while drawing random numbers and in FFTs, threads
+    suit array-heavy processes such as
+    :py:class:`~stochastic.processes.noise.GaussianNoise`,
+    :py:class:`~stochastic.processes.continuous.BrownianMotion`,
+    :py:class:`~stochastic.processes.noise.FractionalGaussianNoise` and
+    :py:class:`~stochastic.processes.noise.ColoredNoise`, while processes
+    with Python loops per step are better served by processes.
+
+    Chunks are generated with the process' ``sample_batch`` method if it has
+    one and otherwise with repeated calls to ``sample``, with their ``out``
+    arguments where available. Realizations must all have the same shape.
+
+    :param process: the process instance to generate realizations of
+    :param int m: the number of realizations to generate
+    :param int n: the number of increments of each realization
+    :param int workers: the number of worker processes. Default is the number
+        of processors. With 1 worker, chunks are generated in the current
+        process.
+    :param int chunk_size: the number of realizations per chunk. Default
+        splits the realizations into at most 64 chunks.
+    :param seed: an int, a sequence of ints or a
+        :py:class:`numpy.random.SeedSequence`. Default is fresh entropy.
+    :param str backend: either ``"processes"`` or ``"threads"``
+    :param kwargs: further arguments to the process' sampling method
+    :returns: an array of shape ``(m,)`` plus the shape of a realization
+    """
+    check_positive_integer(m, "Number of realizations")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    check_positive_integer(workers, "Workers")
+    if backend not in ["processes", "threads"]:
+        raise ValueError("Backend must be one of 'processes' or 'threads'.")
+    chunks = _chunks(m, chunk_size, seed)
+
+    # The first chunk is generated here to find the shape and type of the
+    # ensemble, and to keep its realizations.
+    child, start, stop = chunks[0]
+    seeded = _seed_process(process, child)
+    first = np.asarray(_sample_paths(seeded, stop, n, kwargs))
+    shape = (m,) + first.shape[1:]
+
+    if workers == 1 or len(chunks) == 1:
+        ensemble = np.empty(shape, dtype=first.dtype)
+        ensemble[:stop] = first
+        for child, start, stop in chunks[1:]:
+            _fill_chunk(process, child, ensemble[start:stop], n, kwargs)
+        return ensemble
+
+    if backend == "threads":
+        ensemble = np.empty(shape, dtype=first.dtype)
+        ensemble[:stop] = first
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _fill_chunk, process, child, ensemble[start:stop], n, kwargs
+                )
+                for child, start, stop in chunks[1:]
+            ]
+            for future in futures:
+                future.result()
+        return ensemble
+
+    size = int(np.prod(shape)) * first.dtype.itemsize
+    shared = SharedMemory(create=True, size=max(size, 1))
+    try:
+        ensemble = np.ndarray(shape, dtype=first.dtype, buffer=shared.buf)
+        ensemble[:stop] = first
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _fill_shared_chunk,
+                    process,
+                    child,
+                    start,
+                    stop,
+                    n,
+                    kwargs,
+                    shared.name,
+                    shape,
+                    first.dtype,
+                )
+                for child, start, stop in chunks[1:]
+            ]
+            for future in futures:
+                future.result()
+        return ensemble.copy()
+    finally:
+        ensemble = None
+        shared.close()
+        shared.unlink()
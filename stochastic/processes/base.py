@@ -1,18 +1,24 @@
 """Base classes."""
 from abc import ABC
 from abc import abstractmethod
+from functools import lru_cache
 
 import numpy as np
 
 from stochastic import random
 from stochastic.utils import generate_times
+from stochastic.utils.validation import check_float_dtype
 from stochastic.utils.validation import check_positive_integer
 from stochastic.utils.validation import check_positive_number
 
 
 class BaseProcess(ABC):
+    # Whether realizations are generated in the floating point type dtype
+    _supports_dtype = False
+
     def __init__(self, rng=None):
         self.rng = rng
+        self._dtype = None
 
     @property
     def rng(self):
@@ -29,6 +35,47 @@ class BaseProcess(ABC):
         else:
             raise TypeError("rng must be of type `numpy.random.Generator`")
 
+    @property
+    def dtype(self):
+        """Floating point type of realizations, for processes supporting it.
+
+        Processes which do not support single precision are always
+        ``numpy.float64``, regardless of :py:func:`stochastic.random.use_dtype`.
+        """
+        if self._dtype is None:
+            return random.dtype if self._supports_dtype else np.dtype(np.float64)
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        if value is not None:
+            value = check_float_dtype(value)
+            if value != np.float64 and not self._supports_dtype:
+                raise ValueError(
+                    "{c} does not support single precision.".format(
+                        c=type(self).__name__
+                    )
+                )
+        self._dtype = value
+
+    def __getstate__(self):
+        """Replace per instance function caches, which cannot be pickled."""
+        state = self.__dict__.copy()
+        cached = {}
+        for name, value in self.__dict__.items():
+            if hasattr(value, "cache_info"):
+                cached[name] = (value.__wrapped__, value.cache_info().maxsize)
+                del state[name]
+        state["_cached_functions"] = cached
+        return state
+
+    def __setstate__(self, state):
+        """Restore state with empty function caches."""
+        cached = state.pop("_cached_functions", {})
+        self.__dict__.update(state)
+        for name, (function, maxsize) in cached.items():
+            setattr(self, name, lru_cache(maxsize)(function))
+
     @abstractmethod
     def sample(self, n):  # pragma: no cover
         pass
@@ -12,11 +12,27 @@ from stochastic.processes.continuous.geometric_brownian_motion import (
     GeometricBrownianMotion,
 )
 from stochastic.processes.continuous.inverse_gaussian import InverseGaussianProcess
+from stochastic.processes.continuous.jump_diffusion import JumpDiffusionProcess
+from stochastic.processes.continuous.jump_diffusion import KouJumpDiffusion
+from stochastic.processes.continuous.jump_diffusion import MertonJumpDiffusion
+from stochastic.processes.continuous.levy import LevySubordinator
 from stochastic.processes.continuous.mixed_poisson import MixedPoissonProcess
 from stochastic.processes.continuous.multifractional_brownian_motion import (
     MultifractionalBrownianMotion,
 )
+from stochastic.processes.continuous.multivariate_brownian_motion import (
+    MultivariateBrownianMotion,
+)
+from stochastic.processes.continuous.multivariate_geometric_brownian_motion import (
+    MultivariateGeometricBrownianMotion,
+)
+from stochastic.processes.continuous.normal_inverse_gaussian import (
+    NormalInverseGaussianProcess,
+)
 from stochastic.processes.continuous.poisson import PoissonProcess
+from stochastic.processes.continuous.rough_bergomi import RoughBergomiProcess
 from stochastic.processes.continuous.squared_bessel import SquaredBesselProcess
+from stochastic.processes.continuous.stable import StableProcess
+from stochastic.processes.continuous.subordinated import SubordinatedProcess
 from stochastic.processes.continuous.variance_gamma import VarianceGammaProcess
 from stochastic.processes.continuous.wiener import WienerProcess
@@ -1,8 +1,12 @@
 """Bessel process."""
+from numbers import Integral
+from numbers import Number
+
 import numpy as np
 
 from stochastic.processes.continuous.brownian_motion import BrownianMotion
 from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import times_to_increments
 
 
 class BesselProcess(BrownianMotion):
@@ -15,15 +19,24 @@ class BesselProcess(BrownianMotion):
     Wiener process, e.g. :math:`\|\mathbf{W}_t\|`
 
     Generate Bessel process realizations using :py:attr:`dim` independent
-    Brownian motion processes on the interval :math:`[0,t]`
-
-    :param int dim: the number of underlying independent Brownian motions to
-        use
+    Brownian motion processes on the interval :math:`[0,t]`, or using the
+    exact transition distribution of the squared Bessel process, which is a
+    scaled noncentral chi-square distribution with :py:attr:`dim` degrees of
+    freedom. The latter supports real-valued dimensions and its cost does not
+    depend on the dimension. Since each transition depends on the previous
+    value, it draws one variate per increment in a Python loop, which is
+    slower than the vectorized Brownian algorithm for small integer
+    dimensions.
+
+    :param float dim: the number of underlying independent Brownian motions to
+        use, or a positive real dimension
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
     """
 
+    _supports_dtype = False
+
     def __init__(self, dim=1, t=1, rng=None):
         super().__init__(t=t, rng=rng)
         self.dim = dim
@@ -43,34 +56,73 @@ class BesselProcess(BrownianMotion):
 
     @dim.setter
     def dim(self, value):
-        if not isinstance(value, int):
-            raise TypeError("Dimension must be a positive integer.")
-        if value < 1:
+        if not isinstance(value, Number) or isinstance(value, bool):
+            raise TypeError("Dimension must be a positive number.")
+        if value <= 0:
             raise ValueError("Dimension must be positive.")
         self._dim = value
 
-    def _sample_bessel_process(self, n):
+    def _sample_squared_bessel(self, deltas, algorithm=None):
+        """Generate a squared Bessel realization over intervals from zero."""
+        if algorithm is None:
+            algorithm = "brownian" if isinstance(self.dim, Integral) else "chisquare"
+
+        if algorithm == "brownian":
+            if not isinstance(self.dim, Integral):
+                raise ValueError("Brownian algorithm requires an integer dimension.")
+            bm = np.zeros((self.dim, len(deltas) + 1))
+            increments = self._sample_increments(deltas, (self.dim, len(deltas)))
+            np.cumsum(increments, axis=1, out=bm[:, 1:])
+            return np.einsum("ij,ij->j", bm, bm)
+        elif algorithm == "chisquare":
+            # X_{t+h} / h is noncentral chi-square with dim degrees of freedom
+            # and noncentrality X_t / h. Transitions are sequential, so they
+            # cannot be drawn in one call.
+            s = np.zeros(len(deltas) + 1)
+            for k, delta in enumerate(deltas):
+                s[k + 1] = delta * self.rng.noncentral_chisquare(self.dim, s[k] / delta)
+            return s
+        else:
+            raise ValueError("Algorithm must be brownian or chisquare.")
+
+    def _sample_squared_bessel_at(self, times, algorithm=None):
+        """Generate a squared Bessel realization at times."""
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        s = self._sample_squared_bessel(times_to_increments(times), algorithm)
+        if zero:
+            return s
+        return s[1:]
+
+    def _sample_bessel_process(self, n, algorithm=None):
         """Generate a realization of a Bessel process."""
         check_positive_integer(n)
-        samples = [self._sample_brownian_motion(n) for _ in range(self.dim)]
-        return np.array([np.linalg.norm(coord) for coord in zip(*samples)])
+        deltas = np.full(n, 1.0 * self.t / n)
+        return np.sqrt(self._sample_squared_bessel(deltas, algorithm))
 
-    def _sample_bessel_process_at(self, times):
+    def _sample_bessel_process_at(self, times, algorithm=None):
         """Generate a realization of a Bessel process."""
-        samples = [self._sample_brownian_motion_at(times) for _ in range(self.dim)]
-        return np.array([np.linalg.norm(coord) for coord in zip(*samples)])
+        return np.sqrt(self._sample_squared_bessel_at(times, algorithm))
 
-    def sample(self, n):
+    def sample(self, n, algorithm=None):
         """Generate a realization.
 
         :param int n: the number of increments to generate
+        :param str algorithm: either 'brownian' (norm of :py:attr:`dim`
+            Brownian motions, integer dimensions only) or 'chisquare' (exact
+            noncentral chi-square transitions, one draw per increment).
+            Defaults to 'brownian' for integer dimensions and 'chisquare'
+            otherwise.
         """
-        return self._sample_bessel_process(n)
+        return self._sample_bessel_process(n, algorithm)
 
-    def sample_at(self, times):
+    def sample_at(self, times, algorithm=None):
         """Generate a realization using specified times.
 
         :param times: a vector of increasing time values at which to generate
             the realization
+        :param str algorithm: either 'brownian' or 'chisquare'; see
+            :py:meth:`sample`
         """
-        return self._sample_bessel_process_at(times)
+        return self._sample_bessel_process_at(times, algorithm)
@@ -3,6 +3,8 @@ import numpy as np
 
 from stochastic.processes.continuous.brownian_motion import BrownianMotion
 from stochastic.utils.validation import check_numeric
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import times_to_increments
 
 
 class BrownianBridge(BrownianMotion):
@@ -20,6 +22,8 @@ class BrownianBridge(BrownianMotion):
     :param numpy.random.Generator rng: a custom random number generator
     """
 
+    _supports_dtype = False
+
     def __init__(self, b=0, t=1, rng=None):
         super().__init__(drift=0, scale=1, t=t, rng=rng)
         self.b = b
@@ -56,6 +60,36 @@ class BrownianBridge(BrownianMotion):
         bm = self._sample_brownian_motion_at(times)
         return bm + np.array(times) * (b - bm[-1]) / times[-1]
 
+    def _sample_brownian_bridge_batch(self, shape, n, b=None):
+        """Generate Brownian bridge realizations with leading dimensions shape."""
+        check_positive_integer(n)
+        if b is None:
+            b = self.b
+        bm = np.zeros(shape + (n + 1,))
+        increments = self._sample_increments(1.0 * self.t / n, shape + (n,))
+        np.cumsum(increments, axis=-1, out=bm[..., 1:])
+        bm += self.times(n) * ((b - bm[..., -1:]) / self.t)
+        return bm
+
+    def _sample_brownian_bridge_batch_at(self, shape, times, b=None):
+        """Generate Brownian bridge realizations at times with leading shape."""
+        if b is None:
+            b = self.b
+        times = np.asarray(times, dtype=float)
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        bm = np.zeros(shape + (len(times),))
+        increments = self._sample_increments(deltas, shape + (len(deltas),))
+        np.cumsum(increments, axis=-1, out=bm[..., 1:])
+        if not zero:
+            bm = bm[..., 1:]
+            times = times[1:]
+        bm += times * ((b - bm[..., -1:]) / times[-1])
+        return bm
+
     def sample(self, n):
         """Generate a realization.
 
@@ -2,6 +2,20 @@
 import numpy as np
 
 from stochastic.processes.continuous import BrownianBridge
+from stochastic.utils.validation import check_positive_integer
+
+
+def _vervaat(bridge):
+    """Rotate Brownian bridges to start at their minima (Vervaat transform).
+
+    Bridges are rotated along the last axis, each about its own minimum.
+    """
+    n = bridge.shape[-1] - 1
+    idx_min = np.argmin(bridge, axis=-1)[..., np.newaxis]
+    idx = (idx_min + np.arange(n + 1)) % n
+    rotated = np.take_along_axis(bridge, idx, axis=-1)
+    rotated -= np.take_along_axis(bridge, idx_min, axis=-1)
+    return rotated
 
 
 class BrownianExcursion(BrownianBridge):
@@ -37,36 +51,34 @@ class BrownianExcursion(BrownianBridge):
 
     def _sample_brownian_excursion(self, n):
         """Generate a Brownian excursion."""
-        brownian_bridge = self._sample_brownian_bridge(n)
-        idx_min = np.argmin(brownian_bridge)
-        s = np.array(
-            [
-                brownian_bridge[(idx_min + idx) % n] - brownian_bridge[idx_min]
-                for idx in range(n + 1)
-            ]
-        )
-        return s
+        return _vervaat(self._sample_brownian_bridge(n))
 
     def _sample_brownian_excursion_at(self, times):
         """Generate a Brownian excursion."""
-        if times[0] != 0:
-            zero = False
-            times = np.array([0] + list(times))
-        else:
-            zero = True
-        brownian_bridge = self._sample_brownian_bridge_at(times)
-        idx_min = np.argmin(brownian_bridge)
-        n = len(brownian_bridge)
-        s = np.array(
-            [
-                brownian_bridge[(idx_min + idx) % (n - 1)] - brownian_bridge[idx_min]
-                for idx in range(n)
-            ]
-        )
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        s = _vervaat(self._sample_brownian_bridge_at(times))
         if zero:
             return s
-        else:
-            return s[1:]
+        return s[1:]
+
+    def _sample_brownian_excursion_batch(self, m, n):
+        """Generate m Brownian excursions."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        return _vervaat(self._sample_brownian_bridge_batch((m,), n))
+
+    def _sample_brownian_excursion_batch_at(self, m, times):
+        """Generate m Brownian excursions at times."""
+        check_positive_integer(m, "Number of realizations")
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        s = _vervaat(self._sample_brownian_bridge_batch_at((m,), times))
+        if zero:
+            return s
+        return s[:, 1:]
 
     def sample(self, n):
         """Generate a realization.
@@ -82,3 +94,22 @@ class BrownianExcursion(BrownianBridge):
             the realization
         """
         return self._sample_brownian_excursion_at(times)
+
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_brownian_excursion_batch(m, n)
+
+    def sample_batch_at(self, m, times):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_brownian_excursion_batch_at(m, times)
@@ -3,6 +3,19 @@ import numpy as np
 
 from stochastic.processes.continuous import BrownianBridge
 from stochastic.utils.validation import check_nonnegative_number
+from stochastic.utils.validation import check_positive_integer
+
+
+def _combine_bridges(bridges, line):
+    """Combine three Brownian bridges into meanders, in place.
+
+    ``bridges`` has shape ``(3, ...)`` and ``line`` is the linear path to the
+    right endpoint, broadcast against the first bridge.
+    """
+    bridges[0] += line
+    np.square(bridges, out=bridges)
+    meander = bridges.sum(axis=0)
+    return np.sqrt(meander, out=meander)
 
 
 class BrownianMeander(BrownianBridge):
@@ -46,30 +59,46 @@ class BrownianMeander(BrownianBridge):
         else:
             check_nonnegative_number(b, "Right endpoint")
 
-        bridge_1 = self._sample_brownian_bridge(n)
-        bridge_2 = self._sample_brownian_bridge(n)
-        bridge_3 = self._sample_brownian_bridge(n)
-        return np.sqrt(
-            (b * self.times(n) / self.t + bridge_1) ** 2 + bridge_2**2 + bridge_3**2
-        )
+        bridges = self._sample_brownian_bridge_batch((3,), n)
+        return _combine_bridges(bridges, b * self.times(n) / self.t)
 
     def _sample_brownian_meander_at(self, times, b=None):
         """Generate a Brownian meander realization.
 
         Williams, 1970, or Imhof, 1984.
         """
+        times = np.asarray(times, dtype=float)
         if b is None:
             b = np.sqrt(2 * times[-1] * self.rng.exponential())
         else:
             check_nonnegative_number(b, "Right endpoint")
 
-        bridge_1 = self._sample_brownian_bridge_at(times)
-        bridge_2 = self._sample_brownian_bridge_at(times)
-        bridge_3 = self._sample_brownian_bridge_at(times)
+        bridges = self._sample_brownian_bridge_batch_at((3,), times)
+        return _combine_bridges(bridges, b * times / times[-1])
+
+    def _sample_brownian_meander_batch(self, m, n, b=None):
+        """Generate m Brownian meander realizations."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        if b is None:
+            b = np.sqrt(2 * self.t * self.rng.exponential(size=(m, 1)))
+        else:
+            check_nonnegative_number(b, "Right endpoint")
+
+        bridges = self._sample_brownian_bridge_batch((3, m), n)
+        return _combine_bridges(bridges, b * self.times(n) / self.t)
+
+    def _sample_brownian_meander_batch_at(self, m, times, b=None):
+        """Generate m Brownian meander realizations at times."""
+        check_positive_integer(m, "Number of realizations")
+        times = np.asarray(times, dtype=float)
+        if b is None:
+            b = np.sqrt(2 * times[-1] * self.rng.exponential(size=(m, 1)))
+        else:
+            check_nonnegative_number(b, "Right endpoint")
 
-        return np.sqrt(
-            (b * times / times[-1] + bridge_1) ** 2 + bridge_2**2 + bridge_3**2
-        )
+        bridges = self._sample_brownian_bridge_batch_at((3, m), times)
+        return _combine_bridges(bridges, b * times / times[-1])
 
     def sample(self, n, b=None):
         r"""Generate a realization.
@@ -92,3 +121,28 @@ class BrownianMeander(BrownianBridge):
             :py:attr:`times` [-1].
         """
         return self._sample_brownian_meander_at(times, b)
+
+    def sample_batch(self, m, n, b=None):
+        r"""Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :param float b: the nonnegative right hand endpoint of the meanders. If
+            not provided, one is randomly selected for each realization; see
+            :py:meth:`sample`.
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_brownian_meander_batch(m, n, b)
+
+    def sample_batch_at(self, m, times, b=None):
+        r"""Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :param float b: the right endpoint value for :py:attr:`times` [-1]. If
+            not provided, one is randomly selected for each realization; see
+            :py:meth:`sample_at`.
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_brownian_meander_batch_at(m, times, b)
@@ -2,8 +2,13 @@
 import numpy as np
 
 from stochastic.processes.noise.gaussian_noise import GaussianNoise
-from stochastic.utils import generate_times
+from stochastic.utils import ensure_output
+from stochastic.utils import fill_standard_normal
+from stochastic.utils import merge_times
+from stochastic.utils import unpack_continuation_state
+from stochastic.utils import write_chunked_path
 from stochastic.utils.validation import check_numeric
+from stochastic.utils.validation import check_positive_integer
 from stochastic.utils.validation import check_positive_number
 
 
@@ -23,14 +28,14 @@ class BrownianMotion(GaussianNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, drift=0, scale=1, t=1, rng=None):
-        super().__init__(t=t, rng=rng)
+    def __init__(self, drift=0, scale=1, t=1, rng=None, dtype=None):
+        super().__init__(t=t, rng=rng, dtype=dtype)
         self.drift = drift
         self.scale = scale
-        self._line = None
-        self._n = None
 
     def __str__(self):
         if self.drift == 0 and self.scale == 1:
@@ -64,31 +69,38 @@ class BrownianMotion(GaussianNoise):
         check_positive_number(value, "Scale")
         self._scale = value
 
-    def _sample_brownian_motion(self, n):
+    def _sample_increments(self, deltas, size):
+        """Generate increments over intervals of lengths ``deltas``."""
+        noise = self.rng.normal(size=size)
+        return self.drift * deltas + self.scale * np.sqrt(deltas) * noise
+
+    def _sample_brownian_motion(self, n, out=None):
         """Generate a realization of Brownian Motion.
 
-        Generate a Brownian motion realization with n increments. If zero is
-        True then include W_0 = 0.
+        Generate a Brownian motion realization with n increments, written
+        into ``out`` if provided.
         """
-        # Some opt for repeats
-        if self.drift != 0 and (self._line is None or len(self._line) != n):
-            self._n = n
-            self._line = generate_times(self.drift, n)
-
-        bm = np.cumsum(self.scale * self._sample_gaussian_noise(n))
-        bm = np.insert(bm, [0], 0)
+        check_positive_integer(n)
+        delta_t = 1.0 * self.t / n
 
+        bm = ensure_output(out, (n + 1,), self.dtype)
+        bm[0] = 0
+        increments = fill_standard_normal(self.rng, bm[1:])
+        increments *= self.scale * np.sqrt(delta_t)
         if self.drift != 0:
-            return self._line + bm
-        else:
-            return bm
+            increments += self.drift * delta_t
+        np.cumsum(increments, out=increments)
+
+        return bm
 
-    def sample(self, n):
+    def sample(self, n, out=None):
         """Generate a realization.
 
         :param int n: the number of increments to generate
+        :param out: an optional array of shape ``(n + 1,)`` to write the
+            realization into
         """
-        return self._sample_brownian_motion(n)
+        return self._sample_brownian_motion(n, out)
 
     def _sample_brownian_motion_at(self, times):
         """Generate a Brownian motion at specified times."""
@@ -109,3 +121,116 @@ class BrownianMotion(GaussianNoise):
             the realization
         """
         return self._sample_brownian_motion_at(times)
+
+    def _continue_brownian_motion(self, state, k, step):
+        """Extend a Brownian motion from a (time, value, step) state by k steps."""
+        check_positive_integer(k)
+        time, value, delta_t = unpack_continuation_state(state, 0, step, self.t, k)
+
+        values = fill_standard_normal(self.rng, np.empty(k, self.dtype))
+        values *= self.scale * np.sqrt(delta_t)
+        if self.drift != 0:
+            values += self.drift * delta_t
+        np.cumsum(values, out=values)
+        values += value
+        return values, (time + k * delta_t, values[-1], delta_t)
+
+    def continue_from(self, state, k, step=None):
+        """Extend a realization by k steps from its last time and value.
+
+        Only the new values are generated, in O(k) work, and the returned
+        state can be passed back to keep extending the same path. Random
+        numbers continue from the instance :py:attr:`rng`.
+
+        :param tuple state: the ``(time, value, step)`` state returned by a
+            previous call, the ``(time, value)`` of the last point of a
+            realization, or None to start from ``(0, 0)``
+        :param int k: the number of increments to generate
+        :param float step: the length of each increment. Default is the step
+            of the state, so that continuations keep the same resolution, or
+            ``t / k`` for states without one.
+        :returns: a tuple of the k new values and the new
+            ``(time, value, step)`` state
+        """
+        return self._continue_brownian_motion(state, k, step)
+
+    def sample_to_file(self, filename, n, chunk_size=2**20):
+        """Generate a realization chunk by chunk into a ``.npy`` file.
+
+        For realizations too large to hold in memory. Increments are
+        generated ``chunk_size`` at a time, continuing from the last value of
+        the previous chunk, and written directly to the file, so memory use
+        is bounded by the chunk size.
+
+        :param filename: the path of the ``.npy`` file to write
+        :param int n: the number of increments to generate
+        :param int chunk_size: the number of increments per chunk
+        :returns: a memory map of the realization in the file
+        """
+        check_positive_integer(n)
+        delta_t = 1.0 * self.t / n
+        return write_chunked_path(
+            filename,
+            n,
+            chunk_size,
+            lambda state, k: self._continue_brownian_motion(state, k, delta_t),
+            (0, 0),
+            0,
+            dtype=self.dtype,
+        )
+
+    def _sample_bridge_noise(self, deltas, size):
+        """Generate driftless increments over intervals of lengths ``deltas``."""
+        noise = self.rng.normal(size=size + deltas.shape)
+        return self.scale * np.sqrt(deltas) * noise
+
+    def _refine_brownian_motion(self, times, path, new_times):
+        """Insert new times into Brownian motion realizations using bridges."""
+        path = np.asarray(path, dtype=float)
+        if path.shape[-1] != len(times):
+            raise ValueError("Path and times must have the same length.")
+        merged, old, new, intervals = merge_times(times, new_times)
+        new_times = merged[new]
+
+        # New times are grouped by the interval of times which contains them.
+        # A free Brownian motion is generated across each group's subintervals
+        # and pinned to the interval's endpoints, giving the Brownian bridge
+        # jointly for all new times in the interval. The drift cancels.
+        starts = np.flatnonzero(np.diff(intervals, prepend=-1))
+        ends = np.append(starts[1:], len(intervals)) - 1
+        groups = np.cumsum(np.diff(intervals, prepend=-1) != 0) - 1
+
+        size = path.shape[:-1]
+        heads = self._sample_bridge_noise(new_times - merged[new - 1], size)
+        tails = self._sample_bridge_noise(merged[new[ends] + 1] - new_times[ends], size)
+
+        partial = np.cumsum(heads, axis=-1)
+        offsets = (partial - heads)[..., starts]
+        totals = partial[..., ends] - offsets + tails
+        partial -= offsets[..., groups]
+
+        coarse = merged[old]
+        fractions = (new_times - coarse[intervals]) / np.diff(coarse)[intervals]
+        left = path[..., intervals]
+        gaps = path[..., intervals + 1] - left - totals[..., groups]
+
+        refined = np.empty(size + (len(merged),))
+        refined[..., old] = path
+        refined[..., new] = left + partial + fractions * gaps
+        return merged, refined
+
+    def refine(self, times, path, new_times):
+        """Insert new times into existing realizations.
+
+        Values at the new times are drawn from the Brownian bridge conditional
+        on the neighboring values of the existing realization, so the existing
+        values are unchanged and only the new points are generated.
+
+        :param times: the increasing time values of the existing realization
+        :param path: an existing realization at :py:attr:`times`, or an array
+            of shape ``(m, len(times))`` of realizations
+        :param new_times: time values to insert, strictly between the first and
+            last of :py:attr:`times`
+        :returns: a tuple of the merged times and the refined realization(s)
+        """
+        return self._refine_brownian_motion(times, path, new_times)
@@ -2,6 +2,7 @@
 import numpy as np
 
 from stochastic.processes.noise import FractionalGaussianNoise
+from stochastic.utils import ensure_output
 
 
 class FractionalBrownianMotion(FractionalGaussianNoise):
@@ -30,10 +31,12 @@ class FractionalBrownianMotion(FractionalGaussianNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, hurst=0.5, t=1, rng=None):
-        super().__init__(hurst=hurst, t=t, rng=rng)
+    def __init__(self, hurst=0.5, t=1, rng=None, dtype=None):
+        super().__init__(hurst=hurst, t=t, rng=rng, dtype=dtype)
 
     def __str__(self):
         return "Fractional Brownian motion with Hurst {h} on [0, {t}].".format(
@@ -45,16 +48,19 @@ class FractionalBrownianMotion(FractionalGaussianNoise):
             t=str(self.t), h=str(self.hurst)
         )
 
-    def _sample_fractional_brownian_motion(self, n):
+    def _sample_fractional_brownian_motion(self, n, out=None):
         """Generate a realization of fractional Brownian motion."""
         fgn = self._sample_fractional_gaussian_noise(n)
-        fbm = fgn.cumsum()
-        fbm = np.insert(fbm, [0], 0)
+        fbm = ensure_output(out, (n + 1,), self.dtype)
+        fbm[0] = 0
+        np.cumsum(fgn, out=fbm[1:])
         return fbm
 
-    def sample(self, n):
+    def sample(self, n, out=None):
         """Generate a realization.
 
         :param int n: the number of increments to generate
+        :param out: an optional array of shape ``(n + 1,)`` to write the
+            realization into
         """
-        return self._sample_fractional_brownian_motion(n)
+        return self._sample_fractional_brownian_motion(n, out)
@@ -2,6 +2,7 @@
 import numpy as np
 
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils import merge_times
 from stochastic.utils.validation import check_positive_integer
 from stochastic.utils.validation import check_positive_number
 from stochastic.utils.validation import times_to_increments
@@ -96,33 +97,116 @@ class GammaProcess(BaseTimeProcess):
         check_positive_number(value, "Variance parameter")
         self._variance = value
 
+    def _sample_increments(self, deltas, size):
+        """Generate gamma increments over intervals of lengths ``deltas``."""
+        shape = self.mean**2 * deltas / self.variance
+        scale = self.variance / self.mean
+        return self.rng.gamma(shape=shape, scale=scale, size=size)
+
     def _sample_gamma_process(self, n):
         """Sample a Gamma process."""
         check_positive_integer(n)
         delta_t = 1.0 * self.t / n
 
-        shape = 1.0 * self.mean**2 * delta_t / self.variance
-        scale = 1.0 * self.variance / self.mean
-
-        samples = np.cumsum(self.rng.gamma(shape=shape, scale=scale, size=n))
+        samples = np.cumsum(self._sample_increments(delta_t, n))
         return np.concatenate(([0], samples))
 
     def _sample_gamma_process_at(self, times):
         """Sample a Gamma process at specific times."""
-        s = []
-        if times[0] != 0:
-            times = np.insert(times, 0, [0])
-        else:
-            s.append(0)
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
         increments = times_to_increments(times)
 
-        scale = self.variance / self.mean
-        shape_coef = self.mean**2 / self.variance
+        samples = np.cumsum(self._sample_increments(increments, len(increments)))
+        if zero:
+            samples = np.insert(samples, 0, [0])
+        return samples
 
-        for inc in increments:
-            s.append(self.rng.gamma(shape=shape_coef * inc, scale=scale))
+    def _sample_gamma_process_batch(self, m, n):
+        """Sample m realizations of a Gamma process."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        delta_t = 1.0 * self.t / n
 
-        return np.cumsum(s)
+        samples = np.zeros((m, n + 1))
+        np.cumsum(self._sample_increments(delta_t, (m, n)), axis=1, out=samples[:, 1:])
+        return samples
+
+    def _sample_gamma_process_batch_at(self, m, times):
+        """Sample m realizations of a Gamma process at specific times."""
+        check_positive_integer(m, "Number of realizations")
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        increments = times_to_increments(times)
+
+        samples = np.zeros((m, len(times)))
+        np.cumsum(
+            self._sample_increments(increments, (m, len(increments))),
+            axis=1,
+            out=samples[:, 1:],
+        )
+        if zero:
+            return samples
+        return samples[:, 1:]
+
+    def _refine_gamma_process(self, times, path, new_times):
+        """Insert new times into Gamma process realizations using bridges."""
+        path = np.asarray(path, dtype=float)
+        if path.shape[-1] != len(times):
+            raise ValueError("Path and times must have the same length.")
+        merged, old, new, intervals = merge_times(times, new_times)
+        new_times = merged[new]
+
+        # New times are grouped by the interval of times which contains them.
+        # Within a group, the increments over the subintervals divided by the
+        # interval's increment are Dirichlet distributed (the multivariate
+        # gamma bridge), generated by normalizing gamma variates.
+        starts = np.flatnonzero(np.diff(intervals, prepend=-1))
+        ends = np.append(starts[1:], len(intervals)) - 1
+        groups = np.cumsum(np.diff(intervals, prepend=-1) != 0) - 1
+
+        size = path.shape[:-1]
+        heads = self._sample_increments(
+            new_times - merged[new - 1], size + (len(new_times),)
+        )
+        tails = self._sample_increments(
+            merged[new[ends] + 1] - new_times[ends], size + (len(starts),)
+        )
+
+        partial = np.cumsum(heads, axis=-1)
+        offsets = (partial - heads)[..., starts]
+        totals = partial[..., ends] - offsets + tails
+        partial -= offsets[..., groups]
+        fractions = np.divide(
+            partial,
+            totals[..., groups],
+            out=np.zeros_like(partial),
+            where=totals[..., groups] > 0,
+        )
+
+        left = path[..., intervals]
+        refined = np.empty(size + (len(merged),))
+        refined[..., old] = path
+        refined[..., new] = left + fractions * (path[..., intervals + 1] - left)
+        return merged, refined
+
+    def refine(self, times, path, new_times):
+        """Insert new times into existing realizations.
+
+        Values at the new times are drawn from the gamma bridge conditional on
+        the neighboring values of the existing realization, so the existing
+        values are unchanged and only the new points are generated.
+
+        :param times: the increasing time values of the existing realization
+        :param path: an existing realization at :py:attr:`times`, or an array
+            of shape ``(m, len(times))`` of realizations
+        :param new_times: time values to insert, strictly between the first and
+            last of :py:attr:`times`
+        :returns: a tuple of the merged times and the refined realization(s)
+        """
+        return self._refine_gamma_process(times, path, new_times)
 
     def sample(self, n):
         """Generate a realization.
@@ -138,3 +222,22 @@ class GammaProcess(BaseTimeProcess):
             the realization
         """
         return self._sample_gamma_process_at(times)
+
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_gamma_process_batch(m, n)
+
+    def sample_batch_at(self, m, times):
+        """Generate a batch of independent realizations at specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_gamma_process_batch_at(m, times)
@@ -2,11 +2,13 @@
 import numpy as np
 
 from stochastic.processes.base import BaseTimeProcess
-from stochastic.processes.continuous.brownian_motion import BrownianMotion
-from stochastic.utils import generate_times
+from stochastic.utils import ensure_output
+from stochastic.utils import fill_standard_normal
+from stochastic.utils import unpack_continuation_state
 from stochastic.utils.validation import check_numeric
 from stochastic.utils.validation import check_positive_integer
 from stochastic.utils.validation import check_positive_number
+from stochastic.utils.validation import times_to_increments
 
 
 class GeometricBrownianMotion(BaseTimeProcess):
@@ -38,10 +40,8 @@ class GeometricBrownianMotion(BaseTimeProcess):
 
     def __init__(self, drift=0, volatility=1, t=1, rng=None):
         super().__init__(t=t, rng=rng)
-        self._brownian_motion = BrownianMotion(t=t, rng=rng)
         self.drift = drift
         self.volatility = volatility
-        self._n = None
 
     def __str__(self):
         return "Geometric Brownian motion with drift {d} and volatility {v} on [0, {t}].".format(
@@ -73,34 +73,102 @@ class GeometricBrownianMotion(BaseTimeProcess):
         check_positive_number(value, "Volatility")
         self._volatility = value
 
-    def _sample_geometric_brownian_motion(self, n, initial=1.0):
+    def _log_drift(self):
+        """Drift of the logarithm of the process."""
+        return self.drift - self.volatility**2 / 2.0
+
+    def _sample_log_increments(self, deltas, out):
+        """Fill ``out`` with zero drift log increments over ``deltas``."""
+        fill_standard_normal(self.rng, out)
+        out *= self.volatility * np.sqrt(deltas)
+        return out
+
+    def _fill_log_paths(self, deltas, paths):
+        """Fill paths with exponentiated log paths over ``deltas`` from zero."""
+        paths[..., 0] = 0
+        increments = self._sample_log_increments(deltas, paths[..., 1:])
+        increments += self._log_drift() * deltas
+        np.cumsum(increments, axis=-1, out=increments)
+        np.exp(paths, out=paths)
+        return paths
+
+    def _sample_log_paths(self, times, size):
+        """Generate log paths of shape ``size`` at times, exponentiated."""
+        times = np.asarray(times, dtype=float)
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        paths = self._fill_log_paths(deltas, np.empty(size + (len(times),)))
+        if zero:
+            return paths
+        return paths[..., 1:]
+
+    def _sample_geometric_brownian_motion(self, n, initial=1.0, out=None):
         """Generate a realization of geometric Brownian motion."""
         check_positive_integer(n)
         check_positive_number(initial, "Initial")
-
-        # Opt for repeated use
-        if self._n != n:
-            self._n = n
-            self._line = generate_times(self.drift - self.volatility**2 / 2.0, n)
-
-        noise = self.volatility * self._brownian_motion.sample(n)
-
-        return initial * np.exp(self._line + noise)
+        paths = self._fill_log_paths(self.t / n, ensure_output(out, (n + 1,)))
+        paths *= initial
+        return paths
 
     def _sample_geometric_brownian_motion_at(self, times, initial=1.0):
         """Generate a realization of geometric Brownian motion."""
-        line = [(self.drift - self.volatility**2 / 2.0) * t for t in times]
-        noise = self.volatility * self._brownian_motion.sample_at(times)
+        check_positive_number(initial, "Initial")
+        paths = self._sample_log_paths(times, ())
+        paths *= initial
+        return paths
+
+    def _sample_geometric_brownian_motion_batch(self, m, n, initial=1.0, out=None):
+        """Generate m realizations of geometric Brownian motion."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        check_positive_number(initial, "Initial")
+        paths = self._fill_log_paths(self.t / n, ensure_output(out, (m, n + 1)))
+        paths *= initial
+        return paths
 
-        return initial * np.exp(line + noise)
+    def _sample_geometric_brownian_motion_batch_at(self, m, times, initial=1.0):
+        """Generate m realizations of geometric Brownian motion at times."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_number(initial, "Initial")
+        paths = self._sample_log_paths(times, (m,))
+        paths *= initial
+        return paths
 
-    def sample(self, n, initial=1):
+    def _sample_geometric_brownian_motion_terminal(self, m, initial=1.0):
+        """Generate m values of geometric Brownian motion at time t."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_number(initial, "Initial")
+        values = self._sample_log_increments(self.t, np.empty(m))
+        values += self._log_drift() * self.t
+        np.exp(values, out=values)
+        values *= initial
+        return values
+
+    def _continue_geometric_brownian_motion(self, state, k, step):
+        """Extend a geometric Brownian motion from a (time, value, step) state."""
+        check_positive_integer(k)
+        time, value, delta_t = unpack_continuation_state(state, 1.0, step, self.t, k)
+        check_positive_number(value, "Value")
+
+        values = self._sample_log_increments(delta_t, np.empty(k))
+        values += self._log_drift() * delta_t
+        np.cumsum(values, out=values)
+        np.exp(values, out=values)
+        values *= value
+        return values, (time + k * delta_t, values[-1], delta_t)
+
+    def sample(self, n, initial=1, out=None):
         """Generate a realization.
 
         :param int n: the number of increments to generate.
         :param float initial: the initial value of the process :math:`S_0`.
+        :param out: an optional array of shape ``(n + 1,)`` to write the
+            realization into
         """
-        return self._sample_geometric_brownian_motion(n, initial)
+        return self._sample_geometric_brownian_motion(n, initial, out)
 
     def sample_at(self, times, initial=1):
         """Generate a realization using specified times.
@@ -110,3 +178,57 @@ class GeometricBrownianMotion(BaseTimeProcess):
         :param float initial: the initial value of the process :math:`S_0`.
         """
         return self._sample_geometric_brownian_motion_at(times, initial)
+
+    def sample_batch(self, m, n, initial=1, out=None):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :param float initial: the initial value of the process :math:`S_0`.
+        :param out: an optional array of shape ``(m, n + 1)`` to write the
+            realizations into
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_geometric_brownian_motion_batch(m, n, initial, out)
+
+    def sample_batch_at(self, m, times, initial=1):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :param float initial: the initial value of the process :math:`S_0`.
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_geometric_brownian_motion_batch_at(m, times, initial)
+
+    def continue_from(self, state, k, step=None):
+        """Extend a realization by k steps from its last time and value.
+
+        Only the new values are generated, in O(k) work, and the returned
+        state can be passed back to keep extending the same path. Random
+        numbers continue from the instance :py:attr:`rng`.
+
+        :param tuple state: the ``(time, value, step)`` state returned by a
+            previous call, the ``(time, value)`` of the last point of a
+            realization, or None to start from ``(0, 1.0)``
+        :param int k: the number of increments to generate
+        :param float step: the length of each increment. Default is the step
+            of the state, so that continuations keep the same resolution, or
+            ``t / k`` for states without one.
+        :returns: a tuple of the k new values and the new
+            ``(time, value, step)`` state
+        """
+        return self._continue_geometric_brownian_motion(state, k, step)
+
+    def sample_terminal(self, m, initial=1):
+        """Generate independent values of the process at time :py:attr:`t`.
+
+        Values of :math:`S_t` are drawn directly from a single increment over
+        :math:`[0, t]` without generating paths.
+
+        :param int m: the number of values to generate
+        :param float initial: the initial value of the process :math:`S_0`.
+        :returns: an array of shape ``(m,)``
+        """
+        return self._sample_geometric_brownian_motion_terminal(m, initial)
@@ -4,9 +4,34 @@ import inspect
 import numpy as np
 
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils.validation import check_positive_integer
 from stochastic.utils.validation import check_positive_number
 
 
+def _sample_inverse_gaussian(rng, mean, shape, size):
+    """Generate inverse Gaussian variates.
+
+    Uses the transformation with multiple roots of Michael, Schucany and Haas,
+    selecting the root for every variate at once. ``mean`` and ``shape`` must
+    broadcast to ``size``.
+    """
+    ys = rng.normal(size=size) ** 2
+
+    xs = (
+        mean
+        + mean**2 * ys / 2 / shape
+        - mean / 2 / shape * np.sqrt(4 * mean * shape * ys + mean**2 * ys**2)
+    )
+
+    zs = rng.uniform(size=size)
+    return np.where(zs <= mean / (mean + xs), xs, mean**2 / xs)
+
+
+def _identity(x):
+    """Default mean function."""
+    return x
+
+
 class InverseGaussianProcess(BaseTimeProcess):
     r"""Inverse Gaussian process.
 
@@ -38,12 +63,10 @@ class InverseGaussianProcess(BaseTimeProcess):
     def __init__(self, mean=None, scale=1, t=1, rng=None):
         super().__init__(t=t, rng=rng)
         if mean is None:
-            self.mean = lambda x: x
+            self.mean = _identity
         else:
             self.mean = mean
         self.scale = scale
-        self._n = None
-        self._ms = None
 
     def __str__(self):
         s = "Inverse Gaussian process with mean {m} and scale {s} on interval [0, {t}]."
@@ -68,6 +91,8 @@ class InverseGaussianProcess(BaseTimeProcess):
         if not callable(value) or num_args != 1:
             raise ValueError("Mean must be a function of one argument.")
         self._mean = value
+        self._grid = None
+        self._ms = None
 
     @property
     def scale(self):
@@ -79,51 +104,49 @@ class InverseGaussianProcess(BaseTimeProcess):
         check_positive_number(value, "Scale")
         self._scale = value
 
-    def _check_mean(self, left, right):
-        """Check the validity of the mean function."""
-        delta = self.mean(right) - self.mean(left)
-        if delta <= 0:
+    def _mean_at(self, times):
+        """Evaluate the mean function over a grid of times.
+
+        The mean function is called once on the whole array when it supports
+        it, otherwise it is evaluated elementwise.
+        """
+        try:
+            values = np.asarray(self.mean(times), dtype=float)
+        except (TypeError, ValueError):
+            values = None
+        if values is None or values.shape != times.shape:
+            values = np.array([self.mean(t) for t in times], dtype=float)
+        return values
+
+    def _mean_increments(self, times):
+        """Get the mean function increments over a grid, cached by grid."""
+        if self._grid is not None and np.array_equal(self._grid, times):
+            return self._ms
+        ms = np.diff(self._mean_at(times))
+        if np.any(ms <= 0):
             raise ValueError("Mean must be monotonically increasing.")
-        return delta
+        self._grid = times.copy()
+        self._ms = ms
+        return ms
+
+    def _sample_increments(self, ms, size):
+        """Generate inverse Gaussian increments with means ``ms``.
+
+        These are increments over intervals of lengths ``ms`` for the identity
+        mean function, which processes subordinated by this one require.
+        """
+        return _sample_inverse_gaussian(self.rng, ms, self.scale * ms**2, size)
 
     def _sample_inverse_gaussian_process(self, n):
         """Generate a realization of the inverse Gaussian process.
 
         Generate an inverse Gaussian process realization with n increments.
         """
-        if self._n != n:
-            self._set_times(n)
-            self._ms = []
-            for k in range(n):
-                self._ms.append(self._check_mean(self._times[k], self._times[k + 1]))
-            self._ms = np.array(self._ms)
-
-        ls = np.array([self.scale * m**2 for m in self._ms])
-
-        gn = self.rng.normal(size=n)
-        ys = gn**2
-
-        xs = (
-            self._ms
-            + self._ms**2 * ys / 2 / ls
-            - self._ms
-            / 2
-            / ys
-            * np.sqrt(4 * self._ms * ls * ys + self._ms**2 * ys**2)
-        )
-
-        zs = self.rng.uniform(size=n)
+        check_positive_integer(n)
+        ms = self._mean_increments(self.times(n))
 
-        ign = []
-        for z, x, m in zip(zs, xs, self._ms):
-            if z <= m / (m + x):
-                ign.append(x)
-            else:
-                ign.append(m**2 / x)
-
-        ig = np.array(ign).cumsum()
-        ig = np.insert(ig, [0], 0)
-        return ig
+        ig = np.cumsum(self._sample_increments(ms, n))
+        return np.insert(ig, [0], 0)
 
     def sample(self, n):
         """Generate a realization.
@@ -134,37 +157,15 @@ class InverseGaussianProcess(BaseTimeProcess):
 
     def _sample_inverse_gaussian_process_at(self, times):
         """Generate an inverse Gaussian process at specified times."""
-        n = len(times) - 1
-        if times[0] != 0:
+        times = np.asarray(times, dtype=float)
+        zero = times[0] == 0
+        if not zero:
             times = np.concatenate(([0], times))
 
-        ms = []
-        for k in range(n):
-            ms.append(self._check_mean(times[k], times[k + 1]))
-        ms = np.array(ms)
+        ms = self._mean_increments(times)
 
-        ls = np.array([self.scale * m**2 for m in ms])
-
-        gn = self.rng.normal(size=n)
-        ys = gn**2
-
-        xs = (
-            ms
-            + ms**2 * ys / 2 / ls
-            - ms / 2 / ys * np.sqrt(4 * ms * ls * ys + ms**2 * ys**2)
-        )
-
-        zs = self.rng.uniform(size=n)
-
-        ign = []
-        for z, x, m in zip(zs, xs, ms):
-            if z <= m / (m + x):
-                ign.append(x)
-            else:
-                ign.append(m**2 / x)
-
-        ig = np.array(ign).cumsum()
-        if times[0] == 0:
+        ig = np.cumsum(self._sample_increments(ms, len(ms)))
+        if zero:
             ig = np.insert(ig, 0, [0])
 
         return ig
@@ -176,3 +177,48 @@ class InverseGaussianProcess(BaseTimeProcess):
             the realization
         """
         return self._sample_inverse_gaussian_process_at(times)
+
+    def _sample_inverse_gaussian_process_batch(self, m, n):
+        """Generate m realizations of the inverse Gaussian process."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        ms = self._mean_increments(self.times(n))
+
+        ig = np.zeros((m, n + 1))
+        np.cumsum(self._sample_increments(ms, (m, n)), axis=1, out=ig[:, 1:])
+        return ig
+
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_inverse_gaussian_process_batch(m, n)
+
+    def _sample_inverse_gaussian_process_batch_at(self, m, times):
+        """Generate m realizations of the inverse Gaussian process at times."""
+        check_positive_integer(m, "Number of realizations")
+        times = np.asarray(times, dtype=float)
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+
+        ms = self._mean_increments(times)
+
+        ig = np.zeros((m, len(times)))
+        np.cumsum(self._sample_increments(ms, (m, len(ms))), axis=1, out=ig[:, 1:])
+        if zero:
+            return ig
+        return ig[:, 1:]
+
+    def sample_batch_at(self, m, times):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_inverse_gaussian_process_batch_at(m, times)
@@ -0,0 +1,273 @@
+"""Jump diffusion processes."""
+from abc import ABC
+from abc import abstractmethod
+
+import numpy as np
+
+from stochastic.processes.continuous.geometric_brownian_motion import (
+    GeometricBrownianMotion,
+)
+from stochastic.utils.validation import check_numeric
+from stochastic.utils.validation import check_positive_number
+
+
+class JumpDiffusionProcess(GeometricBrownianMotion, ABC):
+    r"""Jump diffusion process.
+
+    A base process for geometric Brownian motions with multiplicative jumps
+    arriving as a Poisson process :math:`N_t` with rate :math:`\lambda`:
+
+    .. math::
+
+        S_t = S_0 \exp \left( \left( \mu - \frac{\sigma^2}{2} - \lambda k
+        \right) t + \sigma W_t + \sum_{i=1}^{N_t} J_i \right)
+
+    where :math:`J_i` are independent log jump sizes and
+    :math:`k = E[e^{J_i}] - 1` compensates the jumps so that
+    :math:`E[S_t] = S_0 e^{\mu t}`.
+
+    The number of jumps in every interval of every realization is drawn with
+    a single Poisson call, and the sums of the log jump sizes in each
+    interval are drawn together given those counts. This is an abstract base
+    class; subclasses define the jump size distribution by implementing
+    ``_sample_jump_sums`` and ``_jump_compensator``.
+
+    :param float drift: the parameter :math:`\mu`
+    :param float volatility: the parameter :math:`\sigma`
+    :param float rate: the jump rate :math:`\lambda`
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, drift=0, volatility=1, rate=1, t=1, rng=None):
+        super().__init__(drift=drift, volatility=volatility, t=t, rng=rng)
+        self.rate = rate
+
+    @property
+    def rate(self):
+        """Jump rate."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value):
+        check_positive_number(value, "Rate")
+        self._rate = value
+
+    @abstractmethod
+    def _sample_jump_sums(self, counts):  # pragma: no cover
+        """Generate sums of ``counts`` log jump sizes, elementwise."""
+        pass
+
+    @abstractmethod
+    def _jump_compensator(self):  # pragma: no cover
+        """Expected relative jump size, :math:`E[e^J] - 1`."""
+        pass
+
+    def _log_drift(self):
+        """Drift of the logarithm of the process."""
+        return super()._log_drift() - self.rate * self._jump_compensator()
+
+    def _sample_log_increments(self, deltas, out):
+        """Fill ``out`` with zero drift log increments over ``deltas``."""
+        super()._sample_log_increments(deltas, out)
+        counts = self.rng.poisson(self.rate * deltas, size=out.shape)
+        out += self._sample_jump_sums(counts)
+        return out
+
+
+class MertonJumpDiffusion(JumpDiffusionProcess):
+    r"""Merton jump diffusion process.
+
+    A :py:class:`JumpDiffusionProcess` with normally distributed log jump
+    sizes :math:`J_i \sim N(\alpha, \delta^2)`. Given :math:`k` jumps in an
+    interval their sum is drawn as a single :math:`N(k\alpha, k\delta^2)`
+    variate.
+
+    * Merton, Robert C. "Option pricing when underlying stock returns are
+      discontinuous." Journal of Financial Economics 3, no. 1-2 (1976):
+      125-144.
+
+    :param float drift: the parameter :math:`\mu`
+    :param float volatility: the parameter :math:`\sigma`
+    :param float rate: the jump rate :math:`\lambda`
+    :param float jump_mean: the mean of the log jump sizes :math:`\alpha`
+    :param float jump_std: the standard deviation of the log jump sizes
+        :math:`\delta`
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(
+        self, drift=0, volatility=1, rate=1, jump_mean=0, jump_std=1, t=1, rng=None
+    ):
+        super().__init__(drift=drift, volatility=volatility, rate=rate, t=t, rng=rng)
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+
+    def __str__(self):
+        s = "Merton jump diffusion with drift {d}, volatility {v}, rate {r}, jump mean {jm} and jump std {js} on [0, {t}]."
+        return s.format(
+            t=str(self.t),
+            d=str(self.drift),
+            v=str(self.volatility),
+            r=str(self.rate),
+            jm=str(self.jump_mean),
+            js=str(self.jump_std),
+        )
+
+    def __repr__(self):
+        return "MertonJumpDiffusion(drift={d}, volatility={v}, rate={r}, jump_mean={jm}, jump_std={js}, t={t})".format(
+            t=str(self.t),
+            d=str(self.drift),
+            v=str(self.volatility),
+            r=str(self.rate),
+            jm=str(self.jump_mean),
+            js=str(self.jump_std),
+        )
+
+    @property
+    def jump_mean(self):
+        """Mean of the log jump sizes."""
+        return self._jump_mean
+
+    @jump_mean.setter
+    def jump_mean(self, value):
+        check_numeric(value, "Jump mean")
+        self._jump_mean = value
+
+    @property
+    def jump_std(self):
+        """Standard deviation of the log jump sizes."""
+        return self._jump_std
+
+    @jump_std.setter
+    def jump_std(self, value):
+        check_positive_number(value, "Jump std")
+        self._jump_std = value
+
+    def _sample_jump_sums(self, counts):
+        """Generate sums of ``counts`` normal log jump sizes, elementwise."""
+        sums = self.rng.normal(size=counts.shape)
+        sums *= self.jump_std * np.sqrt(counts)
+        sums += self.jump_mean * counts
+        return sums
+
+    def _jump_compensator(self):
+        """Expected relative jump size, :math:`E[e^J] - 1`."""
+        return np.exp(self.jump_mean + self.jump_std**2 / 2.0) - 1
+
+
+class KouJumpDiffusion(JumpDiffusionProcess):
+    r"""Kou jump diffusion process.
+
+    A :py:class:`JumpDiffusionProcess` with asymmetric double exponential
+    log jump sizes, which are upward with probability :math:`p` and
+    exponential with rate :math:`\eta_1`, and downward otherwise and
+    exponential with rate :math:`\eta_2`. Given :math:`k` jumps in an
+    interval the number of upward jumps is binomial, and the upward and
+    downward totals are gamma distributed.
+
+    * Kou, Steven G. "A jump-diffusion model for option pricing." Management
+      Science 48, no. 8 (2002): 1086-1101.
+
+    :param float drift: the parameter :math:`\mu`
+    :param float volatility: the parameter :math:`\sigma`
+    :param float rate: the jump rate :math:`\lambda`
+    :param float up_probability: the probability :math:`p` of an upward jump
+    :param float up_rate: the rate :math:`\eta_1 > 1` of upward jump sizes
+    :param float down_rate: the rate :math:`\eta_2` of downward jump sizes
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(
+        self,
+        drift=0,
+        volatility=1,
+        rate=1,
+        up_probability=0.5,
+        up_rate=2,
+        down_rate=2,
+        t=1,
+        rng=None,
+    ):
+        super().__init__(drift=drift, volatility=volatility, rate=rate, t=t, rng=rng)
+        self.up_probability = up_probability
+        self.up_rate = up_rate
+        self.down_rate = down_rate
+
+    def __str__(self):
+        s = "Kou jump diffusion with drift {d}, volatility {v}, rate {r}, up probability {p}, up rate {u} and down rate {w} on [0, {t}]."
+        return s.format(
+            t=str(self.t),
+            d=str(self.drift),
+            v=str(self.volatility),
+            r=str(self.rate),
+            p=str(self.up_probability),
+            u=str(self.up_rate),
+            w=str(self.down_rate),
+        )
+
+    def __repr__(self):
+        return "KouJumpDiffusion(drift={d}, volatility={v}, rate={r}, up_probability={p}, up_rate={u}, down_rate={w}, t={t})".format(
+            t=str(self.t),
+            d=str(self.drift),
+            v=str(self.volatility),
+            r=str(self.rate),
+            p=str(self.up_probability),
+            u=str(self.up_rate),
+            w=str(self.down_rate),
+        )
+
+    @property
+    def up_probability(self):
+        """Probability of an upward jump."""
+        return self._up_probability
+
+    @up_probability.setter
+    def up_probability(self, value):
+        check_numeric(value, "Up probability")
+        if value < 0 or value > 1:
+            raise ValueError("Up probability must be in [0, 1].")
+        self._up_probability = value
+
+    @property
+    def up_rate(self):
+        """Rate of upward jump sizes."""
+        return self._up_rate
+
+    @up_rate.setter
+    def up_rate(self, value):
+        check_numeric(value, "Up rate")
+        if value <= 1:
+            raise ValueError("Up rate must be greater than 1.")
+        self._up_rate = value
+
+    @property
+    def down_rate(self):
+        """Rate of downward jump sizes."""
+        return self._down_rate
+
+    @down_rate.setter
+    def down_rate(self, value):
+        check_positive_number(value, "Down rate")
+        self._down_rate = value
+
+    def _sample_jump_sums(self, counts):
+        """Generate sums of ``counts`` double exponential log jump sizes."""
+        ups = self.rng.binomial(counts, self.up_probability)
+        sums = self.rng.gamma(ups, 1.0 / self.up_rate)
+        sums -= self.rng.gamma(counts - ups, 1.0 / self.down_rate)
+        return sums
+
+    def _jump_compensator(self):
+        """Expected relative jump size, :math:`E[e^J] - 1`."""
+        p = self.up_probability
+        return (
+            p * self.up_rate / (self.up_rate - 1)
+            + (1 - p) * self.down_rate / (self.down_rate + 1)
+            - 1
+        )
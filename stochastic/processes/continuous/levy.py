@@ -0,0 +1,89 @@
+"""Levy subordinator."""
+import numpy as np
+
+from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import check_positive_number
+from stochastic.utils.validation import times_to_increments
+
+
+class LevySubordinator(BaseTimeProcess):
+    r"""Levy subordinator.
+
+    The stable subordinator with index :math:`1/2`, whose increments over an
+    interval of length :math:`\Delta t` follow a Levy distribution with
+    location parameter 0 and scale parameter :math:`c \Delta t^2`. It is the
+    first passage time process of a Brownian motion when :math:`c = 1`.
+
+    Levy variates are generated as :math:`c \Delta t^2 / Z^2` where :math:`Z`
+    is a standard normal random variable.
+
+    :param float scale: the scale coefficient, or :math:`c` above
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, scale=1, t=1, rng=None):
+        super().__init__(t=t, rng=rng)
+        self.scale = scale
+
+    def __str__(self):
+        return "Levy subordinator with scale {s} on [0, {t}].".format(
+            t=str(self.t), s=str(self.scale)
+        )
+
+    def __repr__(self):
+        return "LevySubordinator(scale={s}, t={t})".format(
+            t=str(self.t), s=str(self.scale)
+        )
+
+    @property
+    def scale(self):
+        """Scale parameter."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        check_positive_number(value, "Scale")
+        self._scale = value
+
+    def _sample_increments(self, deltas, size):
+        """Generate Levy increments over intervals of lengths ``deltas``."""
+        return self.scale * deltas**2 / self.rng.normal(size=size) ** 2
+
+    def _sample_levy_subordinator(self, n):
+        """Generate a realization of a Levy subordinator."""
+        check_positive_integer(n)
+
+        delta_t = 1.0 * self.t / n
+        samples = np.cumsum(self._sample_increments(delta_t, n))
+
+        return np.concatenate(([0], samples))
+
+    def _sample_levy_subordinator_at(self, times):
+        """Generate a realization of a Levy subordinator at times."""
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        samples = np.cumsum(self._sample_increments(deltas, len(deltas)))
+        if zero:
+            samples = np.insert(samples, 0, [0])
+        return samples
+
+    def sample(self, n):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        """
+        return self._sample_levy_subordinator(n)
+
+    def sample_at(self, times):
+        """Generate a realization using specified times.
+
+        :param times: a vector of increasing time values at which to generate
+            the realization
+        """
+        return self._sample_levy_subordinator_at(times)
@@ -5,6 +5,7 @@ import numpy as np
 from scipy.special import gamma
 
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils import single_arg_constant_function
 
 
 class MultifractionalBrownianMotion(BaseTimeProcess):
@@ -41,7 +42,9 @@ class MultifractionalBrownianMotion(BaseTimeProcess):
 
     def __init__(self, hurst=None, t=1, rng=None):
         super().__init__(t=t, rng=rng)
-        self.hurst = hurst if hurst is not None else lambda x: 0.5
+        if hurst is None:
+            hurst = single_arg_constant_function(0.5)
+        self.hurst = hurst
         self._n = None
 
     def __str__(self):
@@ -0,0 +1,208 @@
+"""Multivariate Brownian motion."""
+import numpy as np
+
+from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import times_to_increments
+
+
+class MultivariateBrownianMotion(BaseTimeProcess):
+    r"""Multivariate Brownian motion.
+
+    A :math:`d`-dimensional Brownian motion whose coordinates have drifts
+    :math:`\mu_i`, scales :math:`\sigma_i` and correlated increments with
+    correlation matrix :math:`\rho`:
+
+    .. math::
+
+        X_t = \mu t + \sigma L W_t
+
+    where :math:`W_t` is a standard :math:`d`-dimensional Wiener process and
+    :math:`L L^T = \rho`. The factor :math:`L` is computed once when the
+    correlation matrix is set, using a Cholesky decomposition, or an
+    eigendecomposition if the matrix is only positive semidefinite.
+
+    Realizations have shape ``(d, n + 1)`` and batches have shape
+    ``(m, d, n + 1)``; the increments of a batch are correlated with a single
+    matrix product.
+
+    :param drift: the drift of each coordinate, a number or a vector of
+        length :math:`d`
+    :param scale: the scale of each coordinate, a positive number or a vector
+        of length :math:`d`
+    :param correlation: a :math:`d \times d` correlation matrix. Default is
+        the 2-dimensional identity.
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, drift=0, scale=1, correlation=None, t=1, rng=None):
+        super().__init__(t=t, rng=rng)
+        self.correlation = correlation if correlation is not None else np.eye(2)
+        self.drift = drift
+        self.scale = scale
+
+    def __str__(self):
+        return "Multivariate Brownian motion of dimension {d} on [0, {t}].".format(
+            d=str(self.dim), t=str(self.t)
+        )
+
+    def __repr__(self):
+        return "MultivariateBrownianMotion(drift={d}, scale={s}, correlation={c}, t={t})".format(
+            d=str(self.drift),
+            s=str(self.scale),
+            c=str(self.correlation.tolist()),
+            t=str(self.t),
+        )
+
+    @property
+    def dim(self):
+        """Dimension, determined by the correlation matrix."""
+        return len(self.correlation)
+
+    @property
+    def correlation(self):
+        """Correlation matrix.
+
+        A new matrix must have the same dimension, which the per coordinate
+        parameters depend on.
+        """
+        return self._correlation
+
+    @correlation.setter
+    def correlation(self, value):
+        value = np.array(value, dtype=float)
+        if value.ndim != 2 or value.shape[0] != value.shape[1]:
+            raise ValueError("Correlation matrix must be a square matrix.")
+        if hasattr(self, "_correlation") and len(value) != self.dim:
+            raise ValueError(
+                f"Correlation matrix must keep dimension {self.dim}; "
+                "create a new process to change dimension."
+            )
+        if not np.allclose(value, value.T):
+            raise ValueError("Correlation matrix must be symmetric.")
+        if not np.allclose(np.diag(value), 1):
+            raise ValueError("Correlation matrix must have a unit diagonal.")
+        try:
+            factor = np.linalg.cholesky(value)
+        except np.linalg.LinAlgError:
+            eigenvalues, eigenvectors = np.linalg.eigh(value)
+            if eigenvalues[0] < -1e-10:
+                raise ValueError("Correlation matrix must be positive semidefinite.")
+            factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+        self._correlation = value
+        self._factor = factor
+
+    @property
+    def drift(self):
+        """Drift of each coordinate."""
+        return self._drift
+
+    @drift.setter
+    def drift(self, value):
+        self._drift = self._check_coordinates(value, "Drift")
+
+    @property
+    def scale(self):
+        """Scale of each coordinate."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        value = self._check_coordinates(value, "Scale")
+        if np.any(value <= 0):
+            raise ValueError("Scale values must be positive.")
+        self._scale = value
+
+    def _check_coordinates(self, value, name):
+        """Broadcast a per coordinate parameter to a vector of length dim."""
+        value = np.array(value, dtype=float)
+        if value.ndim == 0:
+            return np.full(self.dim, value)
+        if value.shape != (self.dim,):
+            raise ValueError(
+                f"{name} must be a number or a vector of length {self.dim}."
+            )
+        return value
+
+    def _sample_paths(self, times, m, drift, scale):
+        """Generate correlated Brownian paths of shape ``(m, d, len(times))``.
+
+        Prepends zero to times not starting from zero and drops it from the
+        result.
+        """
+        times = np.asarray(times, dtype=float)
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+        n = len(deltas)
+
+        # One matrix product correlates all m * n increments at once.
+        noise = self._factor @ self.rng.normal(size=(self.dim, m * n))
+        noise = noise.reshape(self.dim, m, n).transpose(1, 0, 2)
+        noise *= scale[:, np.newaxis] * np.sqrt(deltas)
+
+        paths = np.zeros((m, self.dim, n + 1))
+        np.cumsum(noise, axis=-1, out=paths[..., 1:])
+        paths += drift[:, np.newaxis] * times
+        if zero:
+            return paths
+        return paths[..., 1:]
+
+    def _sample_multivariate_brownian_motion(self, n):
+        """Generate a realization of multivariate Brownian motion."""
+        check_positive_integer(n)
+        return self._sample_paths(self.times(n), 1, self.drift, self.scale)[0]
+
+    def _sample_multivariate_brownian_motion_at(self, times):
+        """Generate a realization of multivariate Brownian motion at times."""
+        return self._sample_paths(times, 1, self.drift, self.scale)[0]
+
+    def _sample_multivariate_brownian_motion_batch(self, m, n):
+        """Generate m realizations of multivariate Brownian motion."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        return self._sample_paths(self.times(n), m, self.drift, self.scale)
+
+    def _sample_multivariate_brownian_motion_batch_at(self, m, times):
+        """Generate m realizations of multivariate Brownian motion at times."""
+        check_positive_integer(m, "Number of realizations")
+        return self._sample_paths(times, m, self.drift, self.scale)
+
+    def sample(self, n):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(d, n + 1)``
+        """
+        return self._sample_multivariate_brownian_motion(n)
+
+    def sample_at(self, times):
+        """Generate a realization using specified times.
+
+        :param times: a vector of increasing time values at which to generate
+            the realization
+        :returns: an array of shape ``(d, len(times))``
+        """
+        return self._sample_multivariate_brownian_motion_at(times)
+
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, d, n + 1)``
+        """
+        return self._sample_multivariate_brownian_motion_batch(m, n)
+
+    def sample_batch_at(self, m, times):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :returns: an array of shape ``(m, d, len(times))``
+        """
+        return self._sample_multivariate_brownian_motion_batch_at(m, times)
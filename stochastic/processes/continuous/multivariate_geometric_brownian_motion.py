@@ -0,0 +1,142 @@
+"""Multivariate geometric Brownian motion."""
+import numpy as np
+
+from stochastic.processes.continuous.multivariate_brownian_motion import (
+    MultivariateBrownianMotion,
+)
+from stochastic.utils.validation import check_positive_integer
+
+
+class MultivariateGeometricBrownianMotion(MultivariateBrownianMotion):
+    r"""Multivariate geometric Brownian motion.
+
+    A :math:`d`-dimensional geometric Brownian motion whose coordinates
+    :math:`S^i_t` have correlated driving Wiener processes:
+
+    .. math::
+
+        dS^i_t = \mu_i S^i_t dt + \sigma_i S^i_t dW^i_t, \quad
+        d\langle W^i, W^j \rangle_t = \rho_{ij} dt
+
+    Realizations are generated in log space as a
+    :py:class:`MultivariateBrownianMotion` with drifts
+    :math:`\mu_i - \sigma_i^2 / 2` and scales :math:`\sigma_i`, followed by a
+    single exponentiation.
+
+    :param drift: the drift of each coordinate, :math:`\mu`, a number or a
+        vector of length :math:`d`
+    :param volatility: the volatility of each coordinate, :math:`\sigma`, a
+        positive number or a vector of length :math:`d`
+    :param correlation: a :math:`d \times d` correlation matrix, :math:`\rho`.
+        Default is the 2-dimensional identity.
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, drift=0, volatility=1, correlation=None, t=1, rng=None):
+        super().__init__(
+            drift=drift, scale=volatility, correlation=correlation, t=t, rng=rng
+        )
+
+    def __str__(self):
+        return "Multivariate geometric Brownian motion of dimension {d} on [0, {t}].".format(
+            d=str(self.dim), t=str(self.t)
+        )
+
+    def __repr__(self):
+        return "MultivariateGeometricBrownianMotion(drift={d}, volatility={v}, correlation={c}, t={t})".format(
+            d=str(self.drift),
+            v=str(self.volatility),
+            c=str(self.correlation.tolist()),
+            t=str(self.t),
+        )
+
+    @property
+    def volatility(self):
+        """Volatility of each coordinate."""
+        return self.scale
+
+    @volatility.setter
+    def volatility(self, value):
+        self.scale = value
+
+    def _sample_geometric_paths(self, times, m, initial):
+        """Generate correlated geometric Brownian paths."""
+        initial = self._check_coordinates(initial, "Initial")
+        if np.any(initial <= 0):
+            raise ValueError("Initial values must be positive.")
+        paths = self._sample_paths(
+            times, m, self.drift - self.volatility**2 / 2.0, self.volatility
+        )
+        np.exp(paths, out=paths)
+        paths *= initial[:, np.newaxis]
+        return paths
+
+    def _sample_multivariate_geometric_brownian_motion(self, n, initial=1.0):
+        """Generate a realization of multivariate geometric Brownian motion."""
+        check_positive_integer(n)
+        return self._sample_geometric_paths(self.times(n), 1, initial)[0]
+
+    def _sample_multivariate_geometric_brownian_motion_at(self, times, initial=1.0):
+        """Generate a realization of multivariate geometric Brownian motion."""
+        return self._sample_geometric_paths(times, 1, initial)[0]
+
+    def _sample_multivariate_geometric_brownian_motion_batch(self, m, n, initial=1.0):
+        """Generate m realizations of multivariate geometric Brownian motion."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        return self._sample_geometric_paths(self.times(n), m, initial)
+
+    def _sample_multivariate_geometric_brownian_motion_batch_at(
+        self, m, times, initial=1.0
+    ):
+        """Generate m realizations of multivariate geometric Brownian motion."""
+        check_positive_integer(m, "Number of realizations")
+        return self._sample_geometric_paths(times, m, initial)
+
+    def sample(self, n, initial=1):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        :param initial: the initial value of each coordinate, a number or a
+            vector of length :math:`d`
+        :returns: an array of shape ``(d, n + 1)``
+        """
+        return self._sample_multivariate_geometric_brownian_motion(n, initial)
+
+    def sample_at(self, times, initial=1):
+        """Generate a realization using specified times.
+
+        :param times: a vector of increasing time values at which to generate
+            the realization
+        :param initial: the initial value of each coordinate, a number or a
+            vector of length :math:`d`
+        :returns: an array of shape ``(d, len(times))``
+        """
+        return self._sample_multivariate_geometric_brownian_motion_at(times, initial)
+
+    def sample_batch(self, m, n, initial=1):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :param initial: the initial value of each coordinate, a number or a
+            vector of length :math:`d`
+        :returns: an array of shape ``(m, d, n + 1)``
+        """
+        return self._sample_multivariate_geometric_brownian_motion_batch(m, n, initial)
+
+    def sample_batch_at(self, m, times, initial=1):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :param initial: the initial value of each coordinate, a number or a
+            vector of length :math:`d`
+        :returns: an array of shape ``(m, d, len(times))``
+        """
+        return self._sample_multivariate_geometric_brownian_motion_batch_at(
+            m, times, initial
+        )
@@ -0,0 +1,83 @@
+"""Normal inverse Gaussian process."""
+from stochastic.processes.continuous.brownian_motion import BrownianMotion
+from stochastic.processes.continuous.inverse_gaussian import InverseGaussianProcess
+from stochastic.processes.continuous.subordinated import SubordinatedProcess
+from stochastic.utils.validation import check_positive_number
+
+
+class NormalInverseGaussianProcess(SubordinatedProcess):
+    r"""Normal inverse Gaussian process.
+
+    A normal inverse Gaussian (NIG) process has independent increments which
+    follow the normal inverse Gaussian distribution. It can be represented as
+    a Brownian motion with drift subordinated by an inverse Gaussian process
+    :math:`I(t)` with mean :math:`t` and variance :math:`\nu t`:
+
+    .. math::
+
+        \theta I(t) + \sigma W(I(t))
+
+    The inverse Gaussian clock increments and the conditionally Gaussian
+    increments are each drawn in a single call.
+
+    * Barndorff-Nielsen, Ole E. "Processes of normal inverse Gaussian type."
+      Finance and Stochastics 2, no. 1 (1997): 41-68.
+
+    :param float drift: the drift parameter of the Brownian motion,
+        or :math:`\theta` above
+    :param float variance: the variance parameter of the inverse Gaussian
+        subordinator, or :math:`\nu` above
+    :param float scale: the scale parameter of the Brownian motion,
+        or :math:`\sigma` above
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, drift=0, variance=1, scale=1, t=1, rng=None):
+        check_positive_number(variance, "Variance")
+        super().__init__(
+            subordinator=InverseGaussianProcess(scale=1.0 / variance, t=t),
+            process=BrownianMotion(drift=drift, scale=scale, t=t),
+            t=t,
+            rng=rng,
+        )
+
+    def __str__(self):
+        s = "Normal inverse Gaussian process with drift {d}, variance {v} and scale {s} on [0, {t}]."
+        return s.format(
+            t=str(self.t), d=str(self.drift), v=str(self.variance), s=str(self.scale)
+        )
+
+    def __repr__(self):
+        return "NormalInverseGaussianProcess(drift={d}, variance={v}, scale={s}, t={t})".format(
+            t=str(self.t), d=str(self.drift), v=str(self.variance), s=str(self.scale)
+        )
+
+    @property
+    def drift(self):
+        """Drift parameter."""
+        return self.process.drift
+
+    @drift.setter
+    def drift(self, value):
+        self.process.drift = value
+
+    @property
+    def variance(self):
+        """Variance parameter."""
+        return 1.0 / self.subordinator.scale
+
+    @variance.setter
+    def variance(self, value):
+        check_positive_number(value, "Variance")
+        self.subordinator.scale = 1.0 / value
+
+    @property
+    def scale(self):
+        """Scale parameter."""
+        return self.process.scale
+
+    @scale.setter
+    def scale(self, value):
+        self.process.scale = value
@@ -81,3 +81,28 @@ class PoissonProcess(BaseProcess):
             arrivals until length is met or exceeded.
         """
         return self._sample_poisson_process(n, length)
+
+    def _continue_poisson_process(self, state, k):
+        """Generate k arrivals following the arrival time state."""
+        check_positive_integer(k)
+        time = 0 if state is None else state
+        check_nonnegative_number(time, "Time")
+
+        arrivals = np.cumsum(self.rng.exponential(scale=1.0 / self.rate, size=k))
+        arrivals += time
+        return arrivals, arrivals[-1]
+
+    def continue_from(self, state, k):
+        """Extend a realization by k arrivals from its last arrival time.
+
+        Only the new arrival times are generated, in O(k) work, and the
+        returned state can be passed back to keep extending the same
+        realization. Random numbers continue from the instance
+        :py:attr:`rng`.
+
+        :param float state: the last arrival time of the realization, or None
+            to start from 0
+        :param int k: the number of arrivals to generate
+        :returns: a tuple of the k new arrival times and the new state
+        """
+        return self._continue_poisson_process(state, k)
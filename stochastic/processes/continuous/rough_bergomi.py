@@ -0,0 +1,218 @@
+"""Rough Bergomi process."""
+from functools import lru_cache
+from numbers import Number
+
+import numpy as np
+
+from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import check_positive_number
+
+
+def _hybrid_kernel_fft(alpha, n, delta_t):
+    """Real FFT of the hybrid scheme kernel for the non-singular cells.
+
+    The kernel is zero padded to length ``2 * n`` so that products of
+    transforms give linear rather than circular convolutions.
+    """
+    k = np.arange(2, n + 1)
+    b = ((k ** (alpha + 1) - (k - 1) ** (alpha + 1)) / (alpha + 1)) ** (1 / alpha)
+    kernel = np.zeros(2 * n)
+    kernel[2 : n + 1] = (b * delta_t) ** alpha
+    return np.fft.rfft(kernel)
+
+
+class RoughBergomiProcess(BaseTimeProcess):
+    r"""Rough Bergomi process.
+
+    A stochastic volatility model for asset prices :math:`S_t` whose
+    variance :math:`V_t` is driven by a Riemann-Liouville fractional Brownian
+    motion :math:`Y_t` with Hurst parameter :math:`H`:
+
+    .. math::
+
+        Y_t = \sqrt{2H} \int_0^t (t - s)^{H - 1/2} dW_s
+
+        V_t = \xi \exp \left( \eta Y_t - \frac{\eta^2}{2} t^{2H} \right)
+
+        dS_t = \sqrt{V_t} S_t dB_t, \quad d\langle W, B \rangle_t = \rho dt
+
+    * Bayer, Christian, Peter Friz, and Jim Gatheral. "Pricing under rough
+      volatility." Quantitative Finance 16, no. 6 (2016): 887-904.
+
+    The Volterra process is generated with the hybrid scheme, treating the
+    kernel exactly in the most recent time step and with a step function
+    elsewhere. The step function part is a convolution which is computed with
+    FFTs across all realizations at once, in :math:`O(n \log n)` per
+    realization. The kernel transform is cached for the most recent ``n``.
+
+    * Bennedsen, Mikkel, Asger Lunde, and Mikko S. Pakkanen. "Hybrid scheme
+      for Brownian semistationary processes." Finance and Stochastics 21, no.
+      4 (2017): 931-965.
+
+    Realizations have shape ``(2, n + 1)``, with the price in the first row
+    and the variance in the second.
+
+    :param float hurst: the Hurst parameter :math:`H` in :math:`(0, 1)`,
+        excluding :math:`1/2`. At :math:`H = 1/2` the kernel is constant, so
+        :math:`Y_t` is the Wiener process itself and the hybrid scheme is
+        degenerate: its evaluation points depend on :math:`1 / (H - 1/2)`
+        and the covariance of the exact cell is singular.
+    :param float vol: the volatility of the variance, or :math:`\eta` above
+    :param float variance: the forward variance, or :math:`\xi` above
+    :param float correlation: the correlation between the price and variance
+        Wiener processes, or :math:`\rho` above
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, hurst=0.1, vol=1, variance=0.04, correlation=0, t=1, rng=None):
+        super().__init__(t=t, rng=rng)
+        self.hurst = hurst
+        self.vol = vol
+        self.variance = variance
+        self.correlation = correlation
+        self._kernel_fft = lru_cache(1)(_hybrid_kernel_fft)
+
+    def __str__(self):
+        return "Rough Bergomi process with hurst={h}, vol={v}, variance={x}, correlation={c} on [0, {t}]".format(
+            h=str(self.hurst),
+            v=str(self.vol),
+            x=str(self.variance),
+            c=str(self.correlation),
+            t=str(self.t),
+        )
+
+    def __repr__(self):
+        return "RoughBergomiProcess(hurst={h}, vol={v}, variance={x}, correlation={c}, t={t})".format(
+            h=str(self.hurst),
+            v=str(self.vol),
+            x=str(self.variance),
+            c=str(self.correlation),
+            t=str(self.t),
+        )
+
+    @property
+    def hurst(self):
+        """Hurst parameter, in :math:`(0, 1)` excluding :math:`1/2`."""
+        return self._hurst
+
+    @hurst.setter
+    def hurst(self, value):
+        if not isinstance(value, Number):
+            raise TypeError("Hurst value must be a number on interval (0,1).")
+        if value <= 0 or value >= 1 or value == 0.5:
+            raise ValueError("Hurst value must be in interval (0,1) excluding 0.5.")
+        self._hurst = value
+
+    @property
+    def vol(self):
+        r"""Volatility of the variance, or :math:`\eta`."""
+        return self._vol
+
+    @vol.setter
+    def vol(self, value):
+        check_positive_number(value, "Vol")
+        self._vol = value
+
+    @property
+    def variance(self):
+        r"""Forward variance, or :math:`\xi`."""
+        return self._variance
+
+    @variance.setter
+    def variance(self, value):
+        check_positive_number(value, "Variance")
+        self._variance = value
+
+    @property
+    def correlation(self):
+        r"""Correlation of the Wiener processes, or :math:`\rho`."""
+        return self._correlation
+
+    @correlation.setter
+    def correlation(self, value):
+        if not isinstance(value, Number):
+            raise TypeError("Correlation must be a number in [-1, 1].")
+        if value < -1 or value > 1:
+            raise ValueError("Correlation must be in [-1, 1].")
+        self._correlation = value
+
+    def _sample_volterra(self, m, n):
+        """Generate Wiener increments and a Volterra process by the hybrid scheme.
+
+        Returns the increments of shape ``(m, n)`` and the Volterra process
+        of shape ``(m, n + 1)``.
+        """
+        alpha = self.hurst - 0.5
+        delta_t = 1.0 * self.t / n
+
+        # Joint covariance of a Wiener increment and the exact kernel integral
+        # over the same step.
+        cross = delta_t ** (alpha + 1) / (alpha + 1)
+        covariance = [
+            [delta_t, cross],
+            [cross, delta_t ** (2 * alpha + 1) / (2 * alpha + 1)],
+        ]
+        pairs = self.rng.normal(size=(m, n, 2)) @ np.linalg.cholesky(covariance).T
+        increments = pairs[..., 0]
+
+        volterra = np.zeros((m, n + 1))
+        volterra[:, 1:] = pairs[..., 1]
+        convolution = np.fft.irfft(
+            np.fft.rfft(increments, n=2 * n) * self._kernel_fft(alpha, n, delta_t),
+            n=2 * n,
+        )
+        volterra += convolution[:, : n + 1]
+        volterra *= np.sqrt(2 * alpha + 1)
+        return increments, volterra
+
+    def _sample_rough_bergomi_batch(self, m, n, initial):
+        """Generate m realizations of a rough Bergomi process."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        check_positive_number(initial, "Initial")
+
+        delta_t = 1.0 * self.t / n
+        increments, volterra = self._sample_volterra(m, n)
+
+        samples = np.empty((m, 2, n + 1))
+        variances = samples[:, 1]
+        variances[:] = self.vol * volterra
+        variances -= self.vol**2 / 2 * self.times(n) ** (2 * self.hurst)
+        np.exp(variances, out=variances)
+        variances *= self.variance
+
+        rho = self.correlation
+        price_increments = self.rng.normal(scale=np.sqrt(delta_t), size=(m, n))
+        price_increments *= np.sqrt(1 - rho**2)
+        price_increments += rho * increments
+        price_increments *= np.sqrt(variances[:, :-1])
+        price_increments -= variances[:, :-1] / 2 * delta_t
+
+        prices = samples[:, 0]
+        prices[:, 0] = 0
+        np.cumsum(price_increments, axis=1, out=prices[:, 1:])
+        np.exp(prices, out=prices)
+        prices *= initial
+        return samples
+
+    def sample(self, n, initial=1.0):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        :param float initial: the initial price
+        :returns: an array of shape ``(2, n + 1)`` of prices and variances
+        """
+        return self._sample_rough_bergomi_batch(1, n, initial)[0]
+
+    def sample_batch(self, m, n, initial=1.0):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :param float initial: the initial price
+        :returns: an array of shape ``(m, 2, n + 1)`` of prices and variances
+        """
+        return self._sample_rough_bergomi_batch(m, n, initial)
@@ -16,37 +16,44 @@ class SquaredBesselProcess(BesselProcess):
     The Bessel process is the Euclidean norm of an :math:`n`-dimensional
     Wiener process, e.g. :math:`\|\mathbf{W}_t\|`
 
-    :param int dim: the number of underlying independent Brownian motions to
-        use
+    Realizations are generated from :py:attr:`dim` Brownian motions, or
+    using the exact noncentral chi-square transition distribution, which
+    supports real-valued dimensions.
+
+    :param float dim: the number of underlying independent Brownian motions to
+        use, or a positive real dimension
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     """
 
-    def _sample_squared_bessel_process(self, n):
+    def _sample_squared_bessel_process(self, n, algorithm=None):
         """Generate a realization of a squared Bessel process."""
         check_positive_integer(n)
+        deltas = np.full(n, 1.0 * self.t / n)
+        return self._sample_squared_bessel(deltas, algorithm)
 
-        samples = [self._sample_brownian_motion(n) for _ in range(self.dim)]
-
-        return np.array([sum(map(lambda x: x**2, coord)) for coord in zip(*samples)])
-
-    def _sample_squared_bessel_process_at(self, times):
+    def _sample_squared_bessel_process_at(self, times, algorithm=None):
         """Generate a realization of a squared Bessel process."""
-        samples = [self._sample_brownian_motion_at(times) for _ in range(self.dim)]
-
-        return np.array([sum(map(lambda x: x**2, coord)) for coord in zip(*samples)])
+        return self._sample_squared_bessel_at(times, algorithm)
 
-    def sample(self, n):
+    def sample(self, n, algorithm=None):
         """Generate a realization.
 
         :param int n: the number of increments to generate
+        :param str algorithm: either 'brownian' (sum of squares of
+            :py:attr:`dim` Brownian motions, integer dimensions only) or
+            'chisquare' (exact noncentral chi-square transitions, one draw per
+            increment). Defaults to 'brownian' for integer dimensions and
+            'chisquare' otherwise.
         """
-        return self._sample_squared_bessel_process(n)
+        return self._sample_squared_bessel_process(n, algorithm)
 
-    def sample_at(self, times):
+    def sample_at(self, times, algorithm=None):
         """Generate a realization using specified times.
 
         :param times: a vector of increasing time values at which to generate
             the realization
+        :param str algorithm: either 'brownian' or 'chisquare'; see
+            :py:meth:`sample`
         """
-        return self._sample_squared_bessel_process_at(times)
+        return self._sample_squared_bessel_process_at(times, algorithm)
@@ -0,0 +1,229 @@
+"""Stable processes."""
+from numbers import Number
+
+import numpy as np
+
+from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils.validation import check_numeric
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import check_positive_number
+from stochastic.utils.validation import times_to_increments
+
+
+def _sample_standard_stable(rng, alpha, beta, size):
+    """Generate standard stable variates using Chambers, Mallows and Stuck.
+
+    Variates follow :math:`S_\\alpha(1, \\beta, 0)` in the parametrization of
+    Samorodnitsky and Taqqu.
+    """
+    v = rng.uniform(-np.pi / 2, np.pi / 2, size=size)
+    w = rng.exponential(size=size)
+
+    if alpha == 1:
+        half_pi_beta_v = np.pi / 2 + beta * v
+        return (
+            half_pi_beta_v * np.tan(v)
+            - beta * np.log(np.pi / 2 * w * np.cos(v) / half_pi_beta_v)
+        ) * (2 / np.pi)
+
+    zeta = -beta * np.tan(np.pi * alpha / 2)
+    xi = np.arctan(-zeta) / alpha
+    return (
+        (1 + zeta**2) ** (1 / (2 * alpha))
+        * np.sin(alpha * (v + xi))
+        / np.cos(v) ** (1 / alpha)
+        * (np.cos(v - alpha * (v + xi)) / w) ** ((1 - alpha) / alpha)
+    )
+
+
+class StableProcess(BaseTimeProcess):
+    r"""Stable Levy process.
+
+    A stable (Levy) process has independent, stationary increments which
+    follow a stable distribution. Over an interval of length
+    :math:`\Delta t` the increments are distributed as
+    :math:`S_\alpha(\sigma \Delta t^{1/\alpha}, \beta, \mu \Delta t)`.
+    When :math:`\alpha = 2` the process is a Brownian motion with variance
+    :math:`2 \sigma^2` per unit time, and when :math:`\alpha = 1` and
+    :math:`\beta = 0` it is a symmetric Cauchy process.
+
+    Stable variates are generated using the method from:
+
+    * Chambers, John M., Colin L. Mallows, and B. W. Stuck. "A method for
+      simulating stable random variables." Journal of the American
+      Statistical Association 71, no. 354 (1976): 340-344.
+
+    :param float alpha: the stability index in :math:`(0, 2]`
+    :param float beta: the skewness parameter in :math:`[-1, 1]`
+    :param float scale: the scale per unit time, or :math:`\sigma` above
+    :param float drift: the location per unit time, or :math:`\mu` above
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, alpha=2, beta=0, scale=1, drift=0, t=1, rng=None):
+        super().__init__(t=t, rng=rng)
+        self.alpha = alpha
+        self.beta = beta
+        self.scale = scale
+        self.drift = drift
+
+    def __str__(self):
+        s = "Stable process with alpha {a}, beta {b}, scale {s} and drift {d} on [0, {t}]."
+        return s.format(
+            t=str(self.t),
+            a=str(self.alpha),
+            b=str(self.beta),
+            s=str(self.scale),
+            d=str(self.drift),
+        )
+
+    def __repr__(self):
+        return "StableProcess(alpha={a}, beta={b}, scale={s}, drift={d}, t={t})".format(
+            t=str(self.t),
+            a=str(self.alpha),
+            b=str(self.beta),
+            s=str(self.scale),
+            d=str(self.drift),
+        )
+
+    @property
+    def alpha(self):
+        """Stability index."""
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, value):
+        if not isinstance(value, Number):
+            raise TypeError("Alpha must be a number in (0, 2].")
+        if value <= 0 or value > 2:
+            raise ValueError("Alpha must be in (0, 2].")
+        self._alpha = value
+
+    @property
+    def beta(self):
+        """Skewness parameter."""
+        return self._beta
+
+    @beta.setter
+    def beta(self, value):
+        if not isinstance(value, Number):
+            raise TypeError("Beta must be a number in [-1, 1].")
+        if value < -1 or value > 1:
+            raise ValueError("Beta must be in [-1, 1].")
+        self._beta = value
+
+    @property
+    def scale(self):
+        """Scale parameter."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        check_positive_number(value, "Scale")
+        self._scale = value
+
+    @property
+    def drift(self):
+        """Drift parameter."""
+        return self._drift
+
+    @drift.setter
+    def drift(self, value):
+        check_numeric(value, "Drift")
+        self._drift = value
+
+    def _sample_increments(self, deltas, size):
+        """Generate stable increments over intervals of lengths ``deltas``."""
+        scales = self.scale * deltas ** (1 / self.alpha)
+        increments = scales * _sample_standard_stable(
+            self.rng, self.alpha, self.beta, size
+        )
+        increments += self.drift * deltas
+        if self.alpha == 1:
+            increments += 2 / np.pi * self.beta * scales * np.log(scales)
+        return increments
+
+    def _sample_stable_process(self, n):
+        """Generate a realization of a stable process."""
+        check_positive_integer(n)
+
+        delta_t = 1.0 * self.t / n
+        samples = np.cumsum(self._sample_increments(delta_t, n))
+
+        return np.concatenate(([0], samples))
+
+    def _sample_stable_process_at(self, times):
+        """Generate a realization of a stable process at times."""
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        samples = np.cumsum(self._sample_increments(deltas, len(deltas)))
+        if zero:
+            samples = np.insert(samples, 0, [0])
+        return samples
+
+    def _sample_stable_process_batch(self, m, n):
+        """Generate m realizations of a stable process."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+
+        delta_t = 1.0 * self.t / n
+        samples = np.zeros((m, n + 1))
+        np.cumsum(self._sample_increments(delta_t, (m, n)), axis=1, out=samples[:, 1:])
+        return samples
+
+    def _sample_stable_process_batch_at(self, m, times):
+        """Generate m realizations of a stable process at times."""
+        check_positive_integer(m, "Number of realizations")
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        samples = np.zeros((m, len(times)))
+        np.cumsum(
+            self._sample_increments(deltas, (m, len(deltas))),
+            axis=1,
+            out=samples[:, 1:],
+        )
+        if zero:
+            return samples
+        return samples[:, 1:]
+
+    def sample(self, n):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        """
+        return self._sample_stable_process(n)
+
+    def sample_at(self, times):
+        """Generate a realization using specified times.
+
+        :param times: a vector of increasing time values at which to generate
+            the realization
+        """
+        return self._sample_stable_process_at(times)
+
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_stable_process_batch(m, n)
+
+    def sample_batch_at(self, m, times):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_stable_process_batch_at(m, times)
@@ -0,0 +1,201 @@
+"""Subordinated processes."""
+import numpy as np
+
+from stochastic.processes.base import BaseTimeProcess
+from stochastic.processes.continuous.inverse_gaussian import InverseGaussianProcess
+from stochastic.processes.continuous.inverse_gaussian import _identity
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import times_to_increments
+
+
+class SubordinatedProcess(BaseTimeProcess):
+    r"""Subordinated (time-changed) process.
+
+    A process :math:`X` evaluated at a random clock :math:`T(t)`, called the
+    subordinator, which is itself a process with independent, stationary and
+    nonnegative increments:
+
+    .. math::
+
+        Y(t) = X(T(t))
+
+    When :math:`X` also has independent, stationary increments the
+    increments of :math:`Y` over an interval of length :math:`\Delta t` are
+    increments of :math:`X` over the random duration
+    :math:`T(t + \Delta t) - T(t)`. Realizations are generated by drawing all
+    clock increments in one call and then all conditional increments of
+    :math:`X` in one call.
+
+    Both processes must provide independent, stationary increments, e.g.
+    :py:class:`GammaProcess`, :py:class:`InverseGaussianProcess` or
+    :py:class:`LevySubordinator` for the subordinator and
+    :py:class:`BrownianMotion` for the process. Inverse Gaussian processes
+    must have the default identity mean function, since other mean functions
+    give increments which are not stationary.
+
+    :param subordinator: the process used as the random clock
+    :param process: the process evaluated at the random clock
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator,
+        which also replaces the generators of :py:attr:`subordinator` and
+        :py:attr:`process`. If not provided, they keep their own generators.
+        Setting :py:attr:`rng` after construction, including to None, sets
+        their generators too.
+    """
+
+    def __init__(self, subordinator, process, t=1, rng=None):
+        self.subordinator = subordinator
+        self.process = process
+        super().__init__(t=t, rng=rng)
+
+    def __str__(self):
+        return "Process {p} subordinated by {s} on [0, {t}].".format(
+            t=str(self.t), p=str(self.process), s=str(self.subordinator)
+        )
+
+    def __repr__(self):
+        return "SubordinatedProcess(subordinator={s}, process={p}, t={t})".format(
+            t=str(self.t), p=repr(self.process), s=repr(self.subordinator)
+        )
+
+    @property
+    def rng(self):
+        return BaseTimeProcess.rng.fget(self)
+
+    @rng.setter
+    def rng(self, value):
+        # No generator at construction leaves those of the children alone
+        constructed = "_rng" in self.__dict__
+        BaseTimeProcess.rng.fset(self, value)
+        if value is not None or constructed:
+            self.subordinator.rng = value
+            self.process.rng = value
+
+    @property
+    def subordinator(self):
+        """The random clock process."""
+        return self._subordinator
+
+    @subordinator.setter
+    def subordinator(self, value):
+        if not hasattr(value, "_sample_increments"):
+            raise TypeError(
+                "Subordinator must be a process with independent stationary increments."
+            )
+        self._check_stationary(value)
+        self._subordinator = value
+
+    @property
+    def process(self):
+        """The process evaluated at the random clock."""
+        return self._process
+
+    @process.setter
+    def process(self, value):
+        if not hasattr(value, "_sample_increments"):
+            raise TypeError(
+                "Process must be a process with independent stationary increments."
+            )
+        self._check_stationary(value)
+        self._process = value
+
+    def _check_stationary(self, process):
+        """Check that ``process`` has stationary increments."""
+        if (
+            isinstance(process, InverseGaussianProcess)
+            and process.mean is not _identity
+        ):
+            raise ValueError(
+                "Inverse Gaussian processes must have the identity mean function."
+            )
+
+    def _sample_increments(self, deltas, size):
+        """Generate increments over intervals of lengths ``deltas``."""
+        self._check_stationary(self.subordinator)
+        self._check_stationary(self.process)
+        clock = self.subordinator._sample_increments(deltas, size)
+        return self.process._sample_increments(clock, size)
+
+    def _sample_subordinated_process(self, n):
+        """Generate a realization of a subordinated process."""
+        check_positive_integer(n)
+
+        delta_t = 1.0 * self.t / n
+        samples = np.cumsum(self._sample_increments(delta_t, n))
+
+        return np.concatenate(([0], samples))
+
+    def _sample_subordinated_process_at(self, times):
+        """Generate a realization of a subordinated process at times."""
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        samples = np.cumsum(self._sample_increments(deltas, len(deltas)))
+        if zero:
+            samples = np.insert(samples, 0, [0])
+        return samples
+
+    def _sample_subordinated_process_batch(self, m, n):
+        """Generate m realizations of a subordinated process."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+
+        delta_t = 1.0 * self.t / n
+        samples = np.zeros((m, n + 1))
+        np.cumsum(self._sample_increments(delta_t, (m, n)), axis=1, out=samples[:, 1:])
+        return samples
+
+    def _sample_subordinated_process_batch_at(self, m, times):
+        """Generate m realizations of a subordinated process at times."""
+        check_positive_integer(m, "Number of realizations")
+        zero = times[0] == 0
+        if not zero:
+            times = np.concatenate(([0], times))
+        deltas = times_to_increments(times)
+
+        samples = np.zeros((m, len(times)))
+        np.cumsum(
+            self._sample_increments(deltas, (m, len(deltas))),
+            axis=1,
+            out=samples[:, 1:],
+        )
+        if zero:
+            return samples
+        return samples[:, 1:]
+
+    def sample(self, n):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        """
+        return self._sample_subordinated_process(n)
+
+    def sample_at(self, times):
+        """Generate a realization using specified times.
+
+        :param times: a vector of increasing time values at which to generate
+            the realization
+        """
+        return self._sample_subordinated_process_at(times)
+
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_subordinated_process_batch(m, n)
+
+    def sample_batch_at(self, m, times):
+        """Generate a batch of independent realizations using specified times.
+
+        :param int m: the number of realizations to generate
+        :param times: a vector of increasing time values at which to generate
+            the realizations
+        :returns: an array of shape ``(m, len(times))``
+        """
+        return self._sample_subordinated_process_batch_at(m, times)
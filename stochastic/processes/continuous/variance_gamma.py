@@ -1,14 +1,10 @@
 """Variance gamma process."""
-import numpy as np
+from stochastic.processes.continuous.brownian_motion import BrownianMotion
+from stochastic.processes.continuous.gamma import GammaProcess
+from stochastic.processes.continuous.subordinated import SubordinatedProcess
 
-from stochastic.processes.base import BaseTimeProcess
-from stochastic.processes.noise import GaussianNoise
-from stochastic.utils.validation import check_numeric
-from stochastic.utils.validation import check_positive_integer
-from stochastic.utils.validation import check_positive_number
 
-
-class VarianceGammaProcess(BaseTimeProcess):
+class VarianceGammaProcess(SubordinatedProcess):
     r"""Variance Gamma process.
 
     .. image:: _static/variance_gamma_process.png
@@ -34,93 +30,47 @@ class VarianceGammaProcess(BaseTimeProcess):
     """
 
     def __init__(self, drift=0, variance=1, scale=1, t=1, rng=None):
-        super().__init__(t=t, rng=rng)
-        self.drift = drift
-        self.variance = variance
-        self.scale = scale
-        self.gn = GaussianNoise(t)
+        super().__init__(
+            subordinator=GammaProcess(mean=1, variance=variance, t=t),
+            process=BrownianMotion(drift=drift, scale=scale, t=t),
+            t=t,
+            rng=rng,
+        )
+
+    def __str__(self):
+        s = "Variance gamma process with drift {d}, variance {v} and scale {s} on [0, {t}]."
+        return s.format(
+            t=str(self.t), d=str(self.drift), v=str(self.variance), s=str(self.scale)
+        )
+
+    def __repr__(self):
+        return "VarianceGammaProcess(drift={d}, variance={v}, scale={s}, t={t})".format(
+            t=str(self.t), d=str(self.drift), v=str(self.variance), s=str(self.scale)
+        )
 
     @property
     def drift(self):
         """Drift parameter."""
-        return self._drift
+        return self.process.drift
 
     @drift.setter
     def drift(self, value):
-        check_numeric(value, "Drift")
-        self._drift = value
+        self.process.drift = value
 
     @property
     def variance(self):
         """Variance parameter."""
-        return self._variance
+        return self.subordinator.variance
 
     @variance.setter
     def variance(self, value):
-        check_positive_number(value, "Variance")
-        self._variance = value
+        self.subordinator.variance = value
 
     @property
     def scale(self):
         """Scale parameter."""
-        return self._scale
+        return self.process.scale
 
     @scale.setter
     def scale(self, value):
-        check_positive_number(value, "Scale")
-        self._scale = value
-
-    def _sample_variance_gamma_process(self, n):
-        """Generate a realization of a variance gamma process."""
-        check_positive_integer(n)
-
-        delta_t = 1.0 * self.t / n
-        shape = delta_t / self.variance
-        scale = self.variance
-
-        gammas = self.rng.gamma(shape=shape, scale=scale, size=n)
-        gn = self.gn.sample(n)
-
-        increments = self.drift * gammas + self.scale * np.sqrt(gammas) * gn
-
-        samples = np.cumsum(increments)
-
-        return np.concatenate(([0], samples))
-
-    def _sample_variance_gamma_process_at(self, times):
-        """Generate a realization of a variance gamma process."""
-        if times[0] != 0:
-            zero = False
-            times = np.array([0] + list(times))
-        else:
-            zero = True
-
-        shapes = np.diff(times) / self.variance
-        scale = self.variance
-
-        gammas = np.array(
-            [self.rng.gamma(shape=shape, scale=scale, size=1)[0] for shape in shapes]
-        )
-        gn = self.gn.sample_at(times)
-
-        increments = self.drift * gammas + self.scale * np.sqrt(gammas) * gn
-
-        samples = np.cumsum(increments)
-        if zero:
-            samples = np.insert(samples, 0, [0])
-        return samples
-
-    def sample(self, n):
-        """Generate a realization.
-
-        :param int n: the number of increments to generate
-        """
-        return self._sample_variance_gamma_process(n)
-
-    def sample_at(self, times):
-        """Generate a realization using specified times.
-
-        :param times: a vector of increasing time values at which to generate
-            the realization
-        """
-        return self._sample_variance_gamma_process_at(times)
+        self.process.scale = value
@@ -11,10 +11,12 @@ class WienerProcess(BrownianMotion):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
-        super().__init__(drift=0, scale=1, t=t, rng=rng)
+    def __init__(self, t=1, rng=None, dtype=None):
+        super().__init__(drift=0, scale=1, t=t, rng=rng, dtype=dtype)
 
     def __str__(self):
         return "Wiener process on [0, {t}]".format(t=str(self.t))
@@ -2,6 +2,7 @@ import numpy as np
 
 from stochastic.processes.noise import GaussianNoise
 from stochastic.utils import ensure_single_arg_constant_function
+from stochastic.utils import unpack_continuation_state
 from stochastic.utils.validation import check_numeric
 from stochastic.utils.validation import check_numeric_or_single_arg_callable
 from stochastic.utils.validation import check_positive_integer
@@ -40,6 +41,8 @@ class DiffusionProcess(GaussianNoise):
     :param numpy.random.Generator rng: a custom random number generator
     """
 
+    _supports_dtype = False
+
     def __init__(self, speed=1, mean=0, vol=1, volexp=0, t=1, rng=None):
         super().__init__(t=t, rng=rng)
         self.speed = speed
@@ -113,17 +116,28 @@ class DiffusionProcess(GaussianNoise):
         delta_t = 1.0 * self.t / n
         gns = self._sample_gaussian_noise(n)
 
-        s = [initial]
-        t = 0
-        for k in range(n):
+        return np.concatenate(([initial], self._euler(initial, 0, delta_t, gns)))
+
+    def _euler(self, value, t, delta_t, gns):
+        """Apply Euler-Maruyama steps from value at time t."""
+        s = np.empty(len(gns))
+        for k in range(len(gns)):
             t += delta_t
-            initial += (
-                self._speed(t) * (self._mean(t) - initial) * delta_t
-                + self._vol(t) * initial ** self._volexp(initial) * gns[k]
+            value += (
+                self._speed(t) * (self._mean(t) - value) * delta_t
+                + self._vol(t) * value ** self._volexp(value) * gns[k]
             )
-            s.append(initial)
+            s[k] = value
+        return s
+
+    def _continue_diffusion(self, state, k, step):
+        """Extend a diffusion from a (time, value, step) state by k steps."""
+        check_positive_integer(k)
+        time, value, delta_t = unpack_continuation_state(state, 1.0, step, self.t, k)
 
-        return np.array(s)
+        gns = self.rng.normal(scale=np.sqrt(delta_t), size=k)
+        values = self._euler(value, time, delta_t, gns)
+        return values, (time + k * delta_t, values[-1], delta_t)
 
     def sample(self, n, initial=1.0):
         """Generate a realization.
@@ -132,3 +146,22 @@ class DiffusionProcess(GaussianNoise):
         :param float initial: the initial value of the process
         """
         return self._sample(n, initial)
+
+    def continue_from(self, state, k, step=None):
+        """Extend a realization by k steps from its last time and value.
+
+        Only the new values are generated, in O(k) work, and the returned
+        state can be passed back to keep extending the same path. Random
+        numbers continue from the instance :py:attr:`rng`.
+
+        :param tuple state: the ``(time, value, step)`` state returned by a
+            previous call, the ``(time, value)`` of the last point of a
+            realization, or None to start from ``(0, 1.0)``
+        :param int k: the number of increments to generate
+        :param float step: the length of each increment. Default is the step
+            of the state, so that continuations keep the same resolution, or
+            ``t / k`` for states without one.
+        :returns: a tuple of the k new values and the new
+            ``(time, value, step)`` state
+        """
+        return self._continue_diffusion(state, k, step)
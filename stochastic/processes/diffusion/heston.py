@@ -0,0 +1,272 @@
+"""Heston process."""
+from numbers import Number
+
+import numpy as np
+
+from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils.validation import check_nonnegative_number
+from stochastic.utils.validation import check_numeric
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import check_positive_number
+
+# Andersen's switching level between the quadratic and exponential branches
+PSI_CRITICAL = 1.5
+
+
+class HestonProcess(BaseTimeProcess):
+    r"""Heston stochastic volatility process.
+
+    A model for asset prices :math:`S_t` whose variance :math:`V_t` follows a
+    Cox-Ingersoll-Ross process, with correlated Wiener processes
+    :math:`W^S_t` and :math:`W^V_t`:
+
+    .. math::
+
+        dS_t = \mu S_t dt + \sqrt{V_t} S_t dW^S_t
+
+        dV_t = \kappa (\theta - V_t) dt + \xi \sqrt{V_t} dW^V_t
+
+        d\langle W^S, W^V \rangle_t = \rho dt
+
+    Realizations are generated for a batch of paths at a time, stepping all
+    paths together. The default ``"qe"`` algorithm is the quadratic
+    exponential scheme with Andersen's martingale correction, which keeps
+    the variance nonnegative and :math:`E[S_t] = S_0 e^{\mu t}` with coarse
+    time steps:
+
+    * Andersen, Leif. "Simple and efficient simulation of the Heston
+      stochastic volatility model." Journal of Computational Finance 11, no. 3
+      (2008): 1-42.
+
+    The correction exists when the variance moment it relies on is finite,
+    which can fail for strongly positive correlation with coarse steps. Paths
+    and steps where it fails use the uncorrected scheme, whose price drifts
+    from the martingale by a bias shrinking with the step size.
+
+    The ``"truncation"`` algorithm is the full truncation Euler scheme, which
+    uses the positive part of the variance in the drift and diffusion terms.
+
+    Realizations have shape ``(2, n + 1)``, with the price in the first row
+    and the variance in the second.
+
+    :param float drift: the drift of the price, or :math:`\mu` above
+    :param float speed: the speed of reversion of the variance, or
+        :math:`\kappa` above
+    :param float mean: the long run mean of the variance, or :math:`\theta`
+        above
+    :param float vol: the volatility of the variance, or :math:`\xi` above
+    :param float correlation: the correlation between the price and variance
+        Wiener processes, or :math:`\rho` above
+    :param float t: the right hand endpoint of the time interval :math:`[0,t]`
+        for the process
+    :param numpy.random.Generator rng: a custom random number generator
+    """
+
+    def __init__(self, drift=0, speed=1, mean=1, vol=1, correlation=0, t=1, rng=None):
+        super().__init__(t=t, rng=rng)
+        self.drift = drift
+        self.speed = speed
+        self.mean = mean
+        self.vol = vol
+        self.correlation = correlation
+
+    def __str__(self):
+        return "Heston process with drift={d}, speed={s}, mean={m}, vol={v}, correlation={c} on [0, {t}]".format(
+            d=str(self.drift),
+            s=str(self.speed),
+            m=str(self.mean),
+            v=str(self.vol),
+            c=str(self.correlation),
+            t=str(self.t),
+        )
+
+    def __repr__(self):
+        return "HestonProcess(drift={d}, speed={s}, mean={m}, vol={v}, correlation={c}, t={t})".format(
+            d=str(self.drift),
+            s=str(self.speed),
+            m=str(self.mean),
+            v=str(self.vol),
+            c=str(self.correlation),
+            t=str(self.t),
+        )
+
+    @property
+    def drift(self):
+        r"""Price drift, or :math:`\mu`."""
+        return self._drift
+
+    @drift.setter
+    def drift(self, value):
+        check_numeric(value, "Drift")
+        self._drift = value
+
+    @property
+    def speed(self):
+        r"""Variance speed of reversion, or :math:`\kappa`."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value):
+        check_positive_number(value, "Speed")
+        self._speed = value
+
+    @property
+    def mean(self):
+        r"""Variance long run mean, or :math:`\theta`."""
+        return self._mean
+
+    @mean.setter
+    def mean(self, value):
+        check_positive_number(value, "Mean")
+        self._mean = value
+
+    @property
+    def vol(self):
+        r"""Volatility of the variance, or :math:`\xi`."""
+        return self._vol
+
+    @vol.setter
+    def vol(self, value):
+        check_positive_number(value, "Vol")
+        self._vol = value
+
+    @property
+    def correlation(self):
+        r"""Correlation of the Wiener processes, or :math:`\rho`."""
+        return self._correlation
+
+    @correlation.setter
+    def correlation(self, value):
+        if not isinstance(value, Number):
+            raise TypeError("Correlation must be a number in [-1, 1].")
+        if value < -1 or value > 1:
+            raise ValueError("Correlation must be in [-1, 1].")
+        self._correlation = value
+
+    def _step_qe(self, log_prices, variances, delta_t, normals, uniforms):
+        """Advance log prices and variances one step with the QE scheme."""
+        kappa, theta, xi, rho = self.speed, self.mean, self.vol, self.correlation
+        decay = np.exp(-kappa * delta_t)
+
+        m = theta + (variances - theta) * decay
+        s2 = variances * xi**2 * decay * (1 - decay) / kappa
+        s2 += theta * xi**2 * (1 - decay) ** 2 / (2 * kappa)
+        psi = s2 / m**2
+
+        # Andersen's central discretization of the integrated variance
+        k1 = 0.5 * delta_t * (kappa * rho / xi - 0.5) - rho / xi
+        k2 = 0.5 * delta_t * (kappa * rho / xi - 0.5) + rho / xi
+        k3 = 0.5 * delta_t * (1 - rho**2)
+
+        # Martingale correction: k0 is chosen so that the discounted price is
+        # a martingale, which requires E[exp(A V')] to be finite. Where it is
+        # not, the uncorrected k0 is used.
+        big_a = k2 + 0.5 * k3
+        k0 = np.full_like(variances, -rho * kappa * theta * delta_t / xi)
+        compensator = (k1 + 0.5 * k3) * variances
+
+        new_variances = np.empty_like(variances)
+        quadratic = psi <= PSI_CRITICAL
+        inv_psi = 2 / psi[quadratic]
+        b2 = inv_psi - 1 + np.sqrt(inv_psi * (inv_psi - 1))
+        a = m[quadratic] / (1 + b2)
+        new_variances[quadratic] = a * (np.sqrt(b2) + normals[0][quadratic]) ** 2
+        valid = big_a * a < 0.5
+        k0_quadratic = k0[quadratic]
+        k0_quadratic[valid] = (
+            -big_a * b2[valid] * a[valid] / (1 - 2 * big_a * a[valid])
+            + 0.5 * np.log(1 - 2 * big_a * a[valid])
+            - compensator[quadratic][valid]
+        )
+        k0[quadratic] = k0_quadratic
+
+        exponential = ~quadratic
+        p = (psi[exponential] - 1) / (psi[exponential] + 1)
+        beta = (1 - p) / m[exponential]
+        u = uniforms[exponential]
+        new_variances[exponential] = np.where(
+            u <= p, 0, np.log((1 - p) / (1 - u)) / beta
+        )
+        valid = big_a < beta
+        k0_exponential = k0[exponential]
+        k0_exponential[valid] = (
+            -np.log(p[valid] + beta[valid] * (1 - p[valid]) / (beta[valid] - big_a))
+            - compensator[exponential][valid]
+        )
+        k0[exponential] = k0_exponential
+
+        log_prices += (
+            self.drift * delta_t
+            + k0
+            + k1 * variances
+            + k2 * new_variances
+            + np.sqrt(k3 * (variances + new_variances)) * normals[1]
+        )
+        variances[:] = new_variances
+
+    def _step_truncation(self, log_prices, variances, delta_t, normals, uniforms):
+        """Advance log prices and variances one full truncation Euler step."""
+        positive = np.maximum(variances, 0)
+        root = np.sqrt(positive * delta_t)
+        rho = self.correlation
+        log_prices += (self.drift - positive / 2) * delta_t + root * (
+            rho * normals[0] + np.sqrt(1 - rho**2) * normals[1]
+        )
+        variances += (
+            self.speed * (self.mean - positive) * delta_t + self.vol * root * normals[0]
+        )
+
+    def _sample_heston_process_batch(self, m, n, initial, variance, algorithm):
+        """Generate m realizations of a Heston process."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        check_positive_number(initial, "Initial")
+        if variance is None:
+            variance = self.mean
+        check_nonnegative_number(variance, "Variance")
+        if algorithm not in ["qe", "truncation"]:
+            raise ValueError("Algorithm must be one of 'qe' or 'truncation'.")
+        step = self._step_qe if algorithm == "qe" else self._step_truncation
+
+        delta_t = 1.0 * self.t / n
+        normals = self.rng.normal(size=(n, 2, m))
+        uniforms = self.rng.uniform(size=(n, m)) if algorithm == "qe" else [None] * n
+
+        samples = np.empty((m, 2, n + 1))
+        log_prices = np.full(m, np.log(initial))
+        variances = np.full(m, float(variance))
+        samples[:, 0, 0] = log_prices
+        samples[:, 1, 0] = variances
+        for k in range(n):
+            step(log_prices, variances, delta_t, normals[k], uniforms[k])
+            samples[:, 0, k + 1] = log_prices
+            samples[:, 1, k + 1] = variances
+
+        np.exp(samples[:, 0], out=samples[:, 0])
+        np.maximum(samples[:, 1], 0, out=samples[:, 1])
+        return samples
+
+    def sample(self, n, initial=1.0, variance=None, algorithm="qe"):
+        """Generate a realization.
+
+        :param int n: the number of increments to generate
+        :param float initial: the initial price
+        :param float variance: the initial variance. Default is the long run
+            mean.
+        :param str algorithm: either ``"qe"`` or ``"truncation"``
+        :returns: an array of shape ``(2, n + 1)`` of prices and variances
+        """
+        return self._sample_heston_process_batch(1, n, initial, variance, algorithm)[0]
+
+    def sample_batch(self, m, n, initial=1.0, variance=None, algorithm="qe"):
+        """Generate a batch of independent realizations.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :param float initial: the initial price
+        :param float variance: the initial variance. Default is the long run
+            mean.
+        :param str algorithm: either ``"qe"`` or ``"truncation"``
+        :returns: an array of shape ``(m, 2, n + 1)`` of prices and variances
+        """
+        return self._sample_heston_process_batch(m, n, initial, variance, algorithm)
@@ -2,6 +2,7 @@
 import numpy as np
 
 from stochastic.processes.base import BaseSequenceProcess
+from stochastic.utils import resolve_integer_dtype
 from stochastic.utils.validation import check_positive_integer
 
 
@@ -17,6 +18,9 @@ class BernoulliProcess(BaseSequenceProcess):
     * 1 with probability :math:`p`
     * 0 with probaiility :math:`1-p`
 
+    Realizations are arrays of 0s and 1s in the default integer type, or
+    with ``dtype=bool`` boolean arrays of trial successes.
+
     :param p: in :math:`[0,1]`, the probability of success of each Bernoulli
         random variable
     :param numpy.random.Generator rng: a custom random number generator
@@ -45,17 +49,22 @@ class BernoulliProcess(BaseSequenceProcess):
             raise ValueError("Probability of success p must be between 0 and 1.")
         self._p = value
 
-    def _sample_bernoulli(self, n):
+    def _sample_bernoulli(self, n, dtype=None):
         """Generate a Bernoulli process realization."""
         check_positive_integer(n)
 
-        return np.array(
-            [1 if trial < self.p else 0 for trial in self.rng.uniform(size=n)]
-        )
+        trials = self.rng.uniform(size=n) < self.p
+        if dtype is not None and not isinstance(dtype, str) and np.dtype(dtype) == bool:
+            return trials
+        return trials.astype(resolve_integer_dtype(dtype, 0, 1))
 
-    def sample(self, n):
+    def sample(self, n, dtype=None):
         """Generate a Bernoulli process realization.
 
         :param int n: the number of steps to simulate.
+        :param dtype: the type of the trials. Default is the default integer
+            type, ``bool`` gives boolean trial successes, ``"smallest"`` gives
+            the smallest unsigned integer type, and an explicit integer type
+            is also accepted.
         """
-        return self._sample_bernoulli(n)
+        return self._sample_bernoulli(n, dtype)
@@ -2,6 +2,7 @@
 import numpy as np
 
 from stochastic.processes.base import BaseSequenceProcess
+from stochastic.utils import resolve_integer_dtype
 from stochastic.utils.validation import check_numeric
 from stochastic.utils.validation import check_positive_integer
 
@@ -88,44 +89,45 @@ class ChineseRestaurantProcess(BaseSequenceProcess):
                 )
         self._strength = value
 
-    def _sample_chinese_restaurant(self, n, partition=False):
+    def _sample_chinese_restaurant(self, n, partition=False, dtype=None):
         """Generate a Chinese restaurant process with n customers."""
         check_positive_integer(n)
 
-        c = [[1]]
-        s = [0]
+        s = np.empty(n, dtype=resolve_integer_dtype(dtype, 0, n - 1))
+        counts = np.zeros(n)
+        s[0] = 0
+        counts[0] = 1
         num_tables = 1
-        table_range = [0, 1]
 
         for k in range(2, n + 1):
-            p = [
-                1.0 * (len(c[t]) - self.discount) / (k - 1 + self.strength)
-                for t in table_range[:-1]
-            ]
-            p.append(
+            p = np.empty(num_tables + 1)
+            p[:-1] = (counts[:num_tables] - self.discount) / (k - 1 + self.strength)
+            p[-1] = (
                 1.0
                 * (self.strength + num_tables * self.discount)
                 / (k - 1 + self.strength)
             )
-            table = self.rng.choice(table_range, p=p)
+            table = self.rng.choice(num_tables + 1, p=p)
             if table == num_tables:
                 num_tables += 1
-                table_range.append(num_tables)
-                c.append([])
-            c[table].append(k - 1)
-            s.append(table)
+            counts[table] += 1
+            s[k - 1] = table
 
         if partition:
-            return np.array([np.array(t) for t in c], dtype=object)
+            return self.sequence_to_partition(s)
         else:
-            return np.array(s)
+            return s
 
-    def sample(self, n):
+    def sample(self, n, dtype=None):
         """Generate a Chinese restaurant process with :math:`n` customers.
 
         :param n: the number of customers to simulate.
+        :param dtype: the integer type of the tables. Default is the default
+            integer type, ``"smallest"`` gives the smallest unsigned type which
+            can hold every table index, and an explicit type must be able to
+            hold them.
         """
-        return self._sample_chinese_restaurant(n)
+        return self._sample_chinese_restaurant(n, dtype=dtype)
 
     def sample_partition(self, n):
         """Generate a Chinese restaurant process partition.
@@ -149,17 +151,18 @@ class ChineseRestaurantProcess(BaseSequenceProcess):
 
         return np.array([np.array(t) for t in partition], dtype=object)
 
-    def partition_to_sequence(self, partition):
+    def partition_to_sequence(self, partition, dtype=None):
         """Create a sequence from a partition.
 
         :param partition: a Chinese restaurant partition.
+        :param dtype: the integer type of the tables, as for :py:meth:`sample`
         """
         length = 0
         for table in partition:
             length += len(table)
-        sequence = [0] * length
+        dtype = resolve_integer_dtype(dtype, 0, max(len(partition) - 1, 0))
+        sequence = np.zeros(length, dtype=dtype)
         for idx, table in enumerate(partition):
-            for c in table:
-                sequence[c] = idx
+            sequence[np.asarray(table, dtype=int)] = idx
 
-        return np.array(sequence)
+        return sequence
@@ -2,6 +2,7 @@
 import numpy as np
 
 from stochastic.processes.base import BaseSequenceProcess
+from stochastic.utils import resolve_integer_dtype
 from stochastic.utils.validation import check_positive_integer
 
 
@@ -12,7 +13,9 @@ class MarkovChain(BaseSequenceProcess):
         :scale: 50%
 
     A Markov Chain which changes between states according to the transition
-    matrix.
+    matrix. States are generated in the default integer type, or with
+    ``dtype="smallest"`` in the smallest unsigned integer type which can hold
+    them.
 
     :param 2darray transition: a square matrix representing the transition
         probabilities between states.
@@ -72,19 +75,64 @@ class MarkovChain(BaseSequenceProcess):
             raise ValueError("Initial state probabilities must sum to 1.")
         self._initial = values
 
-    def sample(self, n):
-        """Generate a realization of the Markov chain.
+    def _transitions(self, state, uniforms, out):
+        """Fill ``out`` with the states following ``state``.
 
-        :param int n: the number of steps of the Markov chain to generate.
+        Uses inverse transform sampling from the cumulative transition rows.
         """
+        last = self.num_states - 1
+        cumulative = np.cumsum(self.transition, axis=1)
+        for i, uniform in enumerate(uniforms):
+            state = min(np.searchsorted(cumulative[state], uniform, side="right"), last)
+            out[i] = state
+
+    def _sample_markov_chain(self, n, dtype=None):
+        """Generate a Markov chain of n states from an initial state."""
         check_positive_integer(n)
+        last = self.num_states - 1
+        chain = np.empty(n, dtype=resolve_integer_dtype(dtype, 0, last))
+        uniforms = self.rng.uniform(size=n)
+        cumulative = np.cumsum(self.initial)
+        chain[0] = min(np.searchsorted(cumulative, uniforms[0], side="right"), last)
+        self._transitions(chain[0], uniforms[1:], chain[1:])
+        return chain
+
+    def sample(self, n, dtype=None):
+        """Generate a realization of the Markov chain.
 
-        states = range(self.num_states)
-
-        markov_chain = [self.rng.choice(states, p=self.initial)]
-        for _ in range(n - 1):
-            markov_chain.append(
-                self.rng.choice(states, p=self.transition[markov_chain[-1]])
-            )
-
-        return np.array(markov_chain)
+        :param int n: the number of steps of the Markov chain to generate.
+        :param dtype: the integer type of the states. Default is the default
+            integer type, ``"smallest"`` gives the smallest unsigned type
+            which can hold every state, and an explicit type must be able to
+            hold them.
+        """
+        return self._sample_markov_chain(n, dtype)
+
+    def _continue_markov_chain(self, state, k, dtype=None):
+        """Extend a Markov chain from a state by k transitions."""
+        check_positive_integer(k)
+        if state is None:
+            state = self._sample_markov_chain(1)[0]
+        elif state not in range(self.num_states):
+            raise ValueError("State must be one of the chain states.")
+        chain = np.empty(k, dtype=resolve_integer_dtype(dtype, 0, self.num_states - 1))
+        self._transitions(state, self.rng.uniform(size=k), chain)
+        return chain, chain[-1]
+
+    def continue_from(self, state, k, dtype=None):
+        """Extend a realization by k steps from its last state.
+
+        Only the new states are generated, in O(k) work, and the returned
+        state can be passed back to keep extending the same chain. Random
+        numbers continue from the instance :py:attr:`rng`.
+
+        :param int state: the last state of the chain, or None to start from
+            a state drawn from the initial probabilities, which is not
+            included in the new states
+        :param int k: the number of transitions to generate
+        :param dtype: the integer type of the new states, as for
+            :py:meth:`sample`
+        :returns: a tuple of the k states following the last state and the
+            new state
+        """
+        return self._continue_markov_chain(state, k, dtype)
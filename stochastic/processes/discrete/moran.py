@@ -2,6 +2,7 @@
 import numpy as np
 
 from stochastic.processes.base import BaseSequenceProcess
+from stochastic.utils import resolve_integer_dtype
 
 
 class MoranProcess(BaseSequenceProcess):
@@ -14,7 +15,9 @@ class MoranProcess(BaseSequenceProcess):
     each step this process will increase by one, decrease by one, or remain
     at the same value between values of zero and the number of
     states, :math:`n`. The process ends when its value reaches zero or the
-    maximum valued state.
+    maximum valued state. Values are generated in the default integer type,
+    or with ``dtype="smallest"`` in the smallest unsigned integer type which
+    can hold the maximum.
 
     :param int maximum: the maximum possible value for the process.
     :param numpy.random.Generator rng: a custom random number generator
@@ -59,7 +62,7 @@ class MoranProcess(BaseSequenceProcess):
 
         return probabilities
 
-    def _sample_moran_process(self, n, start):
+    def _sample_moran_process(self, n, start, dtype=None):
         """Generate a realization of the Moran process.
 
         Generate a Moran process until absorption occurs (state 0 or n) or
@@ -75,17 +78,18 @@ class MoranProcess(BaseSequenceProcess):
         if n < 1:
             raise ValueError("Sample length must be at least 1.")
 
-        s = [start]
+        s = np.empty(n, dtype=resolve_integer_dtype(dtype, 0, self.maximum))
+        s[0] = start
         increments = [-1, 0, 1]
-        for k in range(n - 1):
-            if start in [0, self.maximum]:
-                break
+        length = 1
+        while length < n and start not in [0, self.maximum]:
             start += self.rng.choice(increments, p=self.p[start - 1])
-            s.append(start)
+            s[length] = start
+            length += 1
 
-        return np.array(s)
+        return s[:length]
 
-    def sample(self, n, start):
+    def sample(self, n, start, dtype=None):
         """Generate a realization of the Moran process.
 
         Generate a Moran process until absorption occurs (state 0
@@ -94,5 +98,8 @@ class MoranProcess(BaseSequenceProcess):
         :param int n: the maximum number of steps to generate assuming
             absorption does not occur.
         :param int start: the initial state of the process.
+        :param dtype: the integer type of the values. Default is the default
+            integer type, ``"smallest"`` gives the smallest unsigned type which
+            can hold the maximum, and an explicit type must be able to hold it.
         """
-        return self._sample_moran_process(n, start)
+        return self._sample_moran_process(n, start, dtype)
@@ -2,8 +2,15 @@
 import numpy as np
 
 from stochastic.processes.base import BaseSequenceProcess
+from stochastic.utils import ensure_output
+from stochastic.utils import resolve_integer_dtype
+from stochastic.utils import write_chunked_path
+from stochastic.utils.validation import check_numeric
 from stochastic.utils.validation import check_positive_integer
 
+# Number of increments drawn at a time, bounding temporary memory
+CHUNK_SIZE = 2**20
+
 
 class RandomWalk(BaseSequenceProcess):
     """Random walk.
@@ -15,6 +22,10 @@ class RandomWalk(BaseSequenceProcess):
     with a probability distribution. By default this object defines the steps
     to be [-1, 1] with probability 1/2 for each possibility.
 
+    Walks with integer steps are generated in the default integer type, or
+    with ``dtype="smallest"`` in the smallest integer type which can hold
+    every position the walk could reach.
+
     :param steps: a vector of possible deltas to apply at each step.
     :param weights: a corresponding vector of weights associated with each
         step value. If not provided each step has equal weight/probability.
@@ -22,13 +33,13 @@ class RandomWalk(BaseSequenceProcess):
 
     def __init__(self, steps=None, weights=None, rng=None):
         super().__init__(rng=rng)
-        self.steps = steps or [-1, 1]
-        length = len(steps)
+        self.steps = [-1, 1] if steps is None else steps
+        length = len(self.steps)
         if length < 1:
             raise ValueError("Steps must have at least one element.")
         if weights is None:
-            self.weights = [1 for _ in steps]
-            self.p = [1.0 / length for _ in steps]
+            self.weights = [1 for _ in self.steps]
+            self.p = [1.0 / length for _ in self.steps]
         else:
             if len(weights) != length:
                 raise ValueError("Steps and probabilities must have same length.")
@@ -84,25 +95,114 @@ class RandomWalk(BaseSequenceProcess):
             s=str(self.steps), w=str(self.weights)
         )
 
-    def _sample_random_walk(self, n):
-        """Generate a random walk."""
-        return np.array([0] + list(np.cumsum(self._sample_random_walk_increments(n))))
+    def _dtypes(self, start, n, dtype):
+        """Types of increments, and of positions within n steps of start."""
+        steps = self.steps
+        if steps.dtype.kind != "i" or not isinstance(start, (int, np.integer)):
+            if dtype is not None:
+                raise TypeError("Integer types require integer steps and positions.")
+            return steps.dtype, np.result_type(steps.dtype, np.asarray(start).dtype)
+        low = min(start, 0) + n * min(steps.min(), 0)
+        high = max(start, 0) + n * max(steps.max(), 0)
+        return (
+            resolve_integer_dtype(dtype, steps.min(), steps.max()),
+            resolve_integer_dtype(dtype, low, high),
+        )
 
-    def sample(self, n):
+    def _sample_random_walk(self, n, out=None, dtype=None):
+        """Generate a random walk."""
+        increment_dtype, position_dtype = self._dtypes(0, n, dtype)
+        increments = self._sample_random_walk_increments(n, increment_dtype)
+        walk = ensure_output(out, (n + 1,), position_dtype)
+        walk[0] = 0
+        np.cumsum(increments, dtype=walk.dtype, out=walk[1:])
+        return walk
+
+    def sample(self, n, out=None, dtype=None):
         """Generate a sample random walk.
 
         :param int n: the number of steps to generate
+        :param out: an optional array of shape ``(n + 1,)`` to write the walk
+            into
+        :param dtype: the integer type of walks with integer steps. Default
+            is the default integer type, ``"smallest"`` gives the smallest
+            type which can hold every position the walk could reach, and an
+            explicit type must be able to hold them.
+        """
+        return self._sample_random_walk(n, out, dtype)
+
+    def _continue_random_walk(self, state, k, dtype=None):
+        """Extend a random walk from a position by k steps."""
+        position = 0 if state is None else state
+        check_numeric(position, "Position")
+        increment_dtype, position_dtype = self._dtypes(position, k, dtype)
+        increments = self._sample_random_walk_increments(k, increment_dtype)
+        walk = np.cumsum(increments, dtype=position_dtype)
+        walk += position
+        return walk, walk[-1]
+
+    def continue_from(self, state, k, dtype=None):
+        """Extend a realization by k steps from its last position.
+
+        Only the new positions are generated, in O(k) work, and the returned
+        state can be passed back to keep extending the same walk. Random
+        numbers continue from the instance :py:attr:`rng`.
+
+        :param state: the last position of the walk, or None to start from 0
+        :param int k: the number of steps to generate
+        :param dtype: the integer type of the new positions, as for
+            :py:meth:`sample`
+        :returns: a tuple of the k new positions and the new state
         """
-        return self._sample_random_walk(n)
+        return self._continue_random_walk(state, k, dtype)
+
+    def sample_to_file(self, filename, n, chunk_size=2**20, dtype=None):
+        """Generate a random walk chunk by chunk into a ``.npy`` file.
+
+        For walks too large to hold in memory. Steps are generated
+        ``chunk_size`` at a time, continuing from the last position of the
+        previous chunk, and written directly to the file, so memory use is
+        bounded by the chunk size.
 
-    def _sample_random_walk_increments(self, n):
-        """Generate a sample of random walk increments."""
+        :param filename: the path of the ``.npy`` file to write
+        :param int n: the number of steps to generate
+        :param int chunk_size: the number of steps per chunk
+        :param dtype: the integer type of the walk, as for :py:meth:`sample`
+        :returns: a memory map of the walk in the file
+        """
         check_positive_integer(n)
-        return self.rng.choice(self.steps, p=self.p, size=n)
+        _, position_dtype = self._dtypes(0, n, dtype)
+        return write_chunked_path(
+            filename,
+            n,
+            chunk_size,
+            lambda state, k: self._continue_random_walk(state, k, dtype),
+            0,
+            0,
+            dtype=position_dtype,
+        )
 
-    def sample_increments(self, n):
+    def _sample_random_walk_increments(self, n, dtype=None):
+        """Generate a sample of random walk increments.
+
+        Increments are drawn in chunks directly into an array of ``dtype``.
+        """
+        check_positive_integer(n)
+        steps = self.steps if dtype is None else self.steps.astype(dtype)
+        increments = np.empty(n, steps.dtype)
+        for start in range(0, n, CHUNK_SIZE):
+            chunk = increments[start : start + CHUNK_SIZE]
+            chunk[:] = self.rng.choice(steps, p=self.p, size=len(chunk))
+        return increments
+
+    def sample_increments(self, n, dtype=None):
         """Generate a sample of random walk increments.
 
         :param int n: the number of increments to generate.
+        :param dtype: the integer type of increments with integer steps.
+            Default is the default integer type, ``"smallest"`` gives the
+            smallest type which can hold the steps, and an explicit type must
+            be able to hold them.
         """
-        return self._sample_random_walk_increments(n)
+        increment_dtype, _ = self._dtypes(0, 0, dtype)
+        return self._sample_random_walk_increments(n, increment_dtype)
@@ -1,11 +1,29 @@
 """Colored noise."""
 import numpy as np
+from scipy import fft
 
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils import fill_standard_normal
 from stochastic.utils.validation import check_numeric
 from stochastic.utils.validation import check_positive_integer
 
 
+def _power_law_filter(beta, order):
+    """Truncated power law impulse response, normalized to unit energy.
+
+    Coefficients of the fractional differencing filter
+    :math:`(1 - z^{-1})^{-\\beta/2}` from:
+
+    * Kasdin, N. Jeremy. "Discrete simulation of colored noise and stochastic
+      processes and 1/f^alpha power law noise generation." Proceedings of the
+      IEEE 83, no. 5 (1995): 802-827.
+    """
+    k = np.arange(1, order)
+    coefficients = np.ones(order)
+    coefficients[1:] = np.cumprod((k - 1 + beta / 2) / k)
+    return coefficients / np.sqrt(np.sum(coefficients**2))
+
+
 class ColoredNoise(BaseTimeProcess):
     r"""Colored noise processes.
 
@@ -31,15 +49,19 @@ class ColoredNoise(BaseTimeProcess):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, beta=0, t=1, rng=None):
+    _supports_dtype = True
+
+    def __init__(self, beta=0, t=1, rng=None, dtype=None):
         super().__init__(t=t, rng=rng)
         self.beta = beta
-        self._n = None
-        self._half = None
-        self._frequencies = None
+        self.dtype = dtype
+        self._key = None
         self._scale = None
+        self._weights = None
 
     def __str__(self):
         return (
@@ -62,40 +84,57 @@ class ColoredNoise(BaseTimeProcess):
         check_numeric(value, "beta")
         self._beta = value
 
-    def _sample_colored_noise(self, n):
-        """Generate colored noise increments at specified times from zero."""
-        check_positive_integer(n)
+    def _spectrum_scale(self, n):
+        """Spectral amplitudes and Hermitian weights of the rfft bins.
+
+        Cached for the most recent ``n``, ``beta``, ``t`` and ``dtype``.
+        """
+        key = (n, self.beta, self.t, self.dtype)
+        if self._key != key:
+            self._key = key
+            frequencies = np.fft.rfftfreq(n, self.t)
+            self._scale = np.zeros(len(frequencies), self.dtype)
+            self._scale[1:] = np.sqrt(0.5 * (1 / frequencies[1:]) ** self.beta)
+            # Number of times each bin appears in the full Hermitian spectrum
+            self._weights = np.full(len(frequencies), 2.0, self.dtype)
+            self._weights[0] = 1
+            if n % 2 == 0:
+                self._weights[-1] = 1
+        return self._scale, self._weights
+
+    def _sample_spectral_noise(self, size, n):
+        """Generate colored noise realizations of shape ``size + (n + 1,)``."""
         n = n + 1
-        if self._n != n:
-            self._n = n
+        scale, weights = self._spectrum_scale(n)
+
+        gns = np.empty((2,) + size + (len(scale),), self.dtype)
+        fill_standard_normal(self.rng, gns)
+        if n % 2 == 0:
+            # The Nyquist frequency is its own conjugate, so is real
+            gns[1, ..., -1] = 0
+        spectrum = scale * (gns[0] + 1j * gns[1])
 
-            self._half = (n + 1) // 2
-            self._frequencies = np.fft.fftfreq(n, self.t)
-            self._scale = [
-                np.sqrt(0.5 * (1 / w) ** self.beta)
-                for w in self._frequencies[1 : self._half]
-            ]
+        # Standard deviation of the full Hermitian spectrum from its
+        # nonnegative frequency half.
+        mean = np.sum(weights * spectrum.real, axis=-1) / n
+        power = np.sum(weights * np.abs(spectrum) ** 2, axis=-1) / n
+        std = np.sqrt(power - mean**2)
 
-        gn_real = np.random.normal(size=self._half - 1)
-        gn_imag = np.random.normal(size=self._half - 1)
-        fft = self._scale * (gn_real + 1j * gn_imag)
+        # The scipy FFT keeps single precision inputs in single precision.
+        noise = fft.irfft(spectrum, n)
+        noise /= std[..., np.newaxis]
+        return noise
 
-        if n % 2 == 0:
-            f = np.concatenate(
-                (
-                    [0],
-                    fft,
-                    [
-                        np.sqrt(0.5 * (1 / -self._frequencies[self._half]) ** self.beta)
-                        * np.random.normal()
-                    ],
-                    np.conj(fft)[::-1],
-                )
-            )
-        else:
-            f = np.concatenate(([0], fft, np.conj(fft)[::-1]))
-
-        return np.fft.ifft(f).real / np.std(f)
+    def _sample_colored_noise(self, n):
+        """Generate colored noise increments at specified times from zero."""
+        check_positive_integer(n)
+        return self._sample_spectral_noise((), n)
+
+    def _sample_colored_noise_batch(self, m, n):
+        """Generate m realizations of colored noise."""
+        check_positive_integer(m, "Number of realizations")
+        check_positive_integer(n)
+        return self._sample_spectral_noise((m,), n)
 
     def sample(self, n):
         """Generate a realization of colored noise.
@@ -106,6 +145,49 @@ class ColoredNoise(BaseTimeProcess):
         """
         return self._sample_colored_noise(n)
 
+    def sample_batch(self, m, n):
+        """Generate a batch of independent realizations of colored noise.
+
+        All realizations are transformed with a single real inverse FFT.
+
+        :param int m: the number of realizations to generate
+        :param int n: the number of increments to generate
+        :returns: an array of shape ``(m, n + 1)``
+        """
+        return self._sample_colored_noise_batch(m, n)
+
+    def _stream_colored_noise(self, block_size, order):
+        """Yield blocks of colored noise by overlap-save filtering."""
+        fft_size = block_size + order - 1
+        filter_ = _power_law_filter(self.beta, order).astype(self.dtype)
+        response = fft.rfft(filter_, fft_size)
+
+        # Start from stationarity by filling the filter memory with noise.
+        white = np.empty(fft_size, self.dtype)
+        fill_standard_normal(self.rng, white[: order - 1])
+        while True:
+            fill_standard_normal(self.rng, white[order - 1 :])
+            block = fft.irfft(fft.rfft(white) * response, fft_size)
+            white[: order - 1] = white[block_size:]
+            yield block[order - 1 :]
+
+    def stream(self, block_size, order=1024):
+        """Generate an unbounded stream of colored noise in blocks.
+
+        White noise is filtered with a power law impulse response truncated
+        to ``order`` coefficients, by overlap-save FFT convolution. Memory
+        and the cost per block are constant, and consecutive blocks are
+        continuous. Frequencies below about ``1 / order`` of the sampling
+        rate are flattened by the truncation. The stream has unit variance.
+
+        :param int block_size: the number of values in each block
+        :param int order: the length of the impulse response
+        :returns: a generator yielding arrays of length ``block_size``
+        """
+        check_positive_integer(block_size, "Block size")
+        check_positive_integer(order, "Order")
+        return self._stream_colored_noise(block_size, order)
+
 
 class PinkNoise(ColoredNoise):
     r"""Pink (flicker) noise.
@@ -119,10 +201,12 @@ class PinkNoise(ColoredNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
-        super().__init__(beta=1, t=t, rng=rng)
+    def __init__(self, t=1, rng=None, dtype=None):
+        super().__init__(beta=1, t=t, rng=rng, dtype=dtype)
 
 
 class WhiteNoise(ColoredNoise):
@@ -137,10 +221,12 @@ class WhiteNoise(ColoredNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
-        super().__init__(beta=0, t=t, rng=rng)
+    def __init__(self, t=1, rng=None, dtype=None):
+        super().__init__(beta=0, t=t, rng=rng, dtype=dtype)
 
 
 class RedNoise(ColoredNoise):
@@ -155,10 +241,12 @@ class RedNoise(ColoredNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
-        super().__init__(beta=2, t=t, rng=rng)
+    def __init__(self, t=1, rng=None, dtype=None):
+        super().__init__(beta=2, t=t, rng=rng, dtype=dtype)
 
 
 class BrownianNoise(RedNoise):
@@ -173,6 +261,8 @@ class BrownianNoise(RedNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
     pass
 
@@ -189,10 +279,12 @@ class BlueNoise(ColoredNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
-        super().__init__(beta=-1, t=t, rng=rng)
+    def __init__(self, t=1, rng=None, dtype=None):
+        super().__init__(beta=-1, t=t, rng=rng, dtype=dtype)
 
 
 class VioletNoise(ColoredNoise):
@@ -207,7 +299,9 @@ class VioletNoise(ColoredNoise):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
-        super().__init__(beta=-2, t=t, rng=rng)
+    def __init__(self, t=1, rng=None, dtype=None):
+        super().__init__(beta=-2, t=t, rng=rng, dtype=dtype)
@@ -2,9 +2,12 @@
 from functools import lru_cache
 
 import numpy as np
+from scipy import fft
 
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils import fill_standard_normal
 from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import check_positive_number
 
 
 def _fgn_autocovariance(hurst, n):
@@ -13,9 +16,9 @@ def _fgn_autocovariance(hurst, n):
     return np.insert((ns_2h[:-2] - 2 * ns_2h[1:-1] + ns_2h[2:]) / 2, 0, 1)
 
 
-def _fgn_dh_sqrt_eigenvals(hurst, n):
+def _fgn_dh_sqrt_eigenvals(hurst, n, dtype=np.float64):
     """Square-roots of normalized circulant matrix eigenvalues for fGn."""
-    return np.fft.irfft(_fgn_autocovariance(hurst, n))[:n] ** (1 / 2)
+    return (np.fft.irfft(_fgn_autocovariance(hurst, n))[:n] ** (1 / 2)).astype(dtype)
 
 
 class FractionalGaussianNoise(BaseTimeProcess):
@@ -40,11 +43,16 @@ class FractionalGaussianNoise(BaseTimeProcess):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, hurst=0.5, t=1, rng=None):
+    _supports_dtype = True
+
+    def __init__(self, hurst=0.5, t=1, rng=None, dtype=None):
         super().__init__(t=t, rng=rng)
         self.hurst = hurst
+        self.dtype = dtype
         self._autocovariance = lru_cache(1)(_fgn_autocovariance)
         self._dh_sqrt_eigenvals = lru_cache(1)(_fgn_dh_sqrt_eigenvals)
 
@@ -87,23 +95,28 @@ class FractionalGaussianNoise(BaseTimeProcess):
         # If H = 0.5 then just generate a standard Brownian motion, otherwise
         # proceed with the Davies Harte method
         if self.hurst == 0.5:
-            return self.rng.normal(scale=scale, size=n)
+            noise = fill_standard_normal(self.rng, np.empty(n, self.dtype))
+            noise *= scale
+            return noise
 
         else:
             # Generate some more fGns to use power-of-two FFTs for speed.
             m = 2 ** (n - 2).bit_length() + 1
-            sqrt_eigenvals = self._dh_sqrt_eigenvals(self.hurst, m)
+            sqrt_eigenvals = self._dh_sqrt_eigenvals(self.hurst, m, self.dtype)
 
             # irfft results will be normalized by (2(m-1))**(3/2) but we only
             # want to normalize by 2(m-1)**(1/2).
             scale *= 2 ** (1 / 2) * (m - 1)
 
-            w = self.rng.normal(scale=scale, size=2 * m).view(complex)
+            w = fill_standard_normal(self.rng, np.empty(2 * m, self.dtype))
+            w = w.view(np.result_type(self.dtype, np.complex64))
+            w *= scale
             w[0] = w[0].real * 2 ** (1 / 2)
             w[-1] = w[-1].real * 2 ** (1 / 2)
 
-            # Resulting z is fft of sequence w.
-            return np.fft.irfft(sqrt_eigenvals * w)[:n]
+            # Resulting z is fft of sequence w. The scipy FFT keeps single
+            # precision inputs in single precision.
+            return fft.irfft(sqrt_eigenvals * w)[:n]
 
     def _hosking(self, n):
         """Generate fractional Gaussian noise using Hosking's method.
@@ -120,7 +133,7 @@ class FractionalGaussianNoise(BaseTimeProcess):
         increment = self.t / n
         scale = increment**self.hurst
 
-        gn = self.rng.normal(0.0, 1.0, n)
+        gn = fill_standard_normal(self.rng, np.empty(n, self.dtype))
 
         # If H = 0.5 then just generate a standard Brownian motion, otherwise
         # proceed with Hosking's method
@@ -128,7 +141,7 @@ class FractionalGaussianNoise(BaseTimeProcess):
             fgn = gn
         else:
             # Initializations
-            fgn = np.zeros(n)
+            fgn = np.zeros(n, self.dtype)
             phi = np.zeros(n)
             psi = np.zeros(n)
             cov = self._autocovariance(self.hurst, n)
@@ -157,6 +170,75 @@ class FractionalGaussianNoise(BaseTimeProcess):
 
         return fgn
 
+    def _stream_fractional_gaussian_noise(self, block_size, path, step):
+        """Yield blocks of fGn by Durbin-Levinson recursion."""
+        scale = step**self.hurst
+        dtype = self.dtype
+
+        # If H = 0.5 then values are independent, otherwise each value is
+        # generated conditionally on all of those before it.
+        if self.hurst == 0.5:
+            while True:
+                block = fill_standard_normal(self.rng, np.empty(block_size, dtype))
+                block *= scale
+                yield block
+
+        # Work with unit step fGn, growing buffers as the history grows.
+        start = 0 if path is None else len(path)
+        capacity = 2 * (start + block_size)
+        fgn = np.empty(capacity)
+        if start:
+            fgn[:start] = np.asarray(path) / scale
+        phi = np.empty(capacity)
+        cov = _fgn_autocovariance(self.hurst, capacity)
+        v = 1.0
+
+        def levinson(i, v):
+            """Extend the prediction coefficients in phi to order i."""
+            kappa = (cov[i] - np.dot(phi[: i - 1], cov[i - 1 : 0 : -1])) / v
+            phi[: i - 1] -= kappa * phi[: i - 1][::-1]
+            phi[i - 1] = kappa
+            return v * (1 - kappa * kappa)
+
+        # Prediction coefficients for conditioning on the existing path
+        for i in range(1, start):
+            v = levinson(i, v)
+
+        i = start
+        while True:
+            if i + block_size > capacity:
+                capacity *= 2
+                fgn = np.resize(fgn, capacity)
+                phi = np.resize(phi, capacity)
+                cov = _fgn_autocovariance(self.hurst, capacity)
+            for z in self.rng.normal(size=block_size):
+                if i:
+                    v = levinson(i, v)
+                    fgn[i] = np.dot(phi[:i], fgn[:i][::-1]) + np.sqrt(v) * z
+                else:
+                    fgn[i] = z
+                i += 1
+            yield (fgn[i - block_size : i] * scale).astype(dtype)
+
+    def stream(self, block_size=1, path=None, step=1):
+        """Generate an unbounded stream of exact fractional Gaussian noise.
+
+        Values are generated one after another conditionally on all
+        previous values using the Durbin-Levinson recursion, so the horizon
+        need not be known in advance. The recursion state is kept between
+        blocks, and the cost of each value is linear in the number of
+        values before it.
+
+        :param int block_size: the number of values in each block
+        :param path: previously generated fGn values with the same ``step``
+            to continue conditionally. Default is to start a new path.
+        :param float step: the length of the time increment of each value
+        :returns: a generator yielding arrays of length ``block_size``
+        """
+        check_positive_integer(block_size, "Block size")
+        check_positive_number(step, "Step")
+        return self._stream_fractional_gaussian_noise(block_size, path, step)
+
     def _sample_fractional_gaussian_noise(self, n, algorithm="daviesharte"):
         """Generate a realization of fractional Gaussian noise."""
         if algorithm == "daviesharte":
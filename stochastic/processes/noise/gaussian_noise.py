@@ -2,6 +2,8 @@
 import numpy as np
 
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.utils import ensure_output
+from stochastic.utils import fill_standard_normal
 from stochastic.utils.validation import check_positive_integer
 from stochastic.utils.validation import times_to_increments
 
@@ -17,10 +19,15 @@ class GaussianNoise(BaseTimeProcess):
     :param float t: the right hand endpoint of the time interval :math:`[0,t]`
         for the process
     :param numpy.random.Generator rng: a custom random number generator
+    :param dtype: the floating point type of realizations, ``numpy.float32``
+        or ``numpy.float64``. Default is :py:attr:`stochastic.random.dtype`.
     """
 
-    def __init__(self, t=1, rng=None):
+    _supports_dtype = True
+
+    def __init__(self, t=1, rng=None, dtype=None):
         super().__init__(t=t, rng=rng)
+        self.dtype = dtype
 
     def __str__(self):
         return "Gaussian noise generator on interval [0, {t}]".format(t=str(self.t))
@@ -28,7 +35,7 @@ class GaussianNoise(BaseTimeProcess):
     def __repr__(self):
         return "GaussianNoise(t={t})".format(t=str(self.t))
 
-    def _sample_gaussian_noise(self, n):
+    def _sample_gaussian_noise(self, n, out=None):
         """Generate a realization of Gaussian noise.
 
         Generate a Gaussian noise realization with n increments.
@@ -36,7 +43,8 @@ class GaussianNoise(BaseTimeProcess):
         check_positive_integer(n)
         delta_t = 1.0 * self.t / n
 
-        noise = self.rng.normal(scale=np.sqrt(delta_t), size=n)
+        noise = fill_standard_normal(self.rng, ensure_output(out, (n,), self.dtype))
+        noise *= np.sqrt(delta_t)
 
         return noise
 
@@ -46,18 +54,21 @@ class GaussianNoise(BaseTimeProcess):
             times = np.concatenate(([0], times))
         increments = times_to_increments(times)
 
-        noise = np.array([self.rng.normal(scale=np.sqrt(inc)) for inc in increments])
+        noise = fill_standard_normal(self.rng, np.empty(len(increments), self.dtype))
+        noise *= np.sqrt(increments)
 
         return noise
 
-    def sample(self, n):
+    def sample(self, n, out=None):
         """Generate a realization of Gaussian noise.
 
         Generate a Gaussian noise realization with n increments.
 
         :param int n: the number of increments to generate.
+        :param out: an optional array of shape ``(n,)`` to write the
+            realization into
         """
-        return self._sample_gaussian_noise(n)
+        return self._sample_gaussian_noise(n, out)
 
     def sample_at(self, times):
         """Generate Gaussian noise increments at specified times from zero.
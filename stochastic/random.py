@@ -1,10 +1,15 @@
 import numpy as np
 
+from stochastic.utils.validation import check_float_dtype
+
 _default_rng = np.random.default_rng()
 
 #: The default random number generator for the stochastic package
 generator = _default_rng
 
+#: The default floating point type of Gaussian noise driven realizations
+dtype = np.dtype(np.float64)
+
 
 def use_randomstate(rng=None):
     """Use the legacy numpy RandomState generator as default for stochastic.
@@ -42,6 +47,29 @@ def use_generator(rng=None):
     generator = rng or _default_rng
 
 
+def use_dtype(value=None):
+    """Set the default floating point type for stochastic.
+
+    Sets the floating point type of realizations of
+    :py:class:`~stochastic.processes.noise.GaussianNoise`,
+    :py:class:`~stochastic.processes.continuous.BrownianMotion`,
+    :py:class:`~stochastic.processes.noise.FractionalGaussianNoise` and
+    :py:class:`~stochastic.processes.noise.ColoredNoise` instances without
+    their own ``dtype``. Subclasses which generate double precision only,
+    such as :py:class:`~stochastic.processes.continuous.BrownianBridge`,
+    :py:class:`~stochastic.processes.continuous.BesselProcess` and
+    :py:class:`~stochastic.processes.diffusion.DiffusionProcess`, are
+    unaffected. Single precision halves memory use and uses single
+    precision normal variates and FFTs throughout. The legacy ``np.random``
+    generator draws in double precision before converting.
+
+    :param value: either ``numpy.float32`` or ``numpy.float64``. Default is
+        to return to ``numpy.float64``.
+    """
+    global dtype
+    dtype = np.dtype(np.float64) if value is None else check_float_dtype(value)
+
+
 def seed(value):
     """Sets the seed for numpy legacy or ``default_rng`` generators.
 
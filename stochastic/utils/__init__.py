@@ -1,14 +1,34 @@
 import numpy as np
 
+from stochastic.utils.validation import check_numeric
+from stochastic.utils.validation import check_positive_integer
+from stochastic.utils.validation import check_positive_number
+from stochastic.utils.validation import times_to_increments
+
 
 def generate_times(end, n):
     """Generate a linspace from 0 to end for n increments."""
     return np.linspace(0, end, n + 1)
 
 
+class _ConstantFunction:
+    """Single argument function returning a constant value.
+
+    Unlike a lambda, instances can be pickled, e.g. to send processes to
+    worker processes.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.__name__ = "constant {v}".format(v=value)
+
+    def __call__(self, x):
+        return self.value
+
+
 def single_arg_constant_function(value):
     """Generate a single argument function which returns a constant value."""
-    return lambda x: value
+    return _ConstantFunction(value)
 
 
 def ensure_single_arg_constant_function(value):
@@ -16,3 +36,137 @@ def ensure_single_arg_constant_function(value):
     if not callable(value):
         return single_arg_constant_function(value)
     return value
+
+
+def merge_times(times, new_times):
+    """Merge new times into the interior of an increasing sequence of times.
+
+    Returns the merged times, the positions of ``times`` and ``new_times``
+    within them, and for each new time the index of the interval of
+    ``times`` which contains it. ``new_times`` are sorted first.
+    """
+    times = np.asarray(times, dtype=float)
+    times_to_increments(times)
+    new_times = np.sort(np.asarray(new_times, dtype=float).ravel())
+    if len(new_times) == 0:
+        raise ValueError("New times must not be empty.")
+    if np.any(np.diff(new_times) == 0):
+        raise ValueError("New times must be distinct.")
+    if new_times[0] <= times[0] or new_times[-1] >= times[-1]:
+        raise ValueError(
+            "New times must lie strictly between the first and last times."
+        )
+
+    intervals = np.searchsorted(times, new_times, side="right") - 1
+    if np.any(times[intervals] == new_times):
+        raise ValueError("New times must not coincide with existing times.")
+
+    merged = np.concatenate((times, new_times))
+    order = np.argsort(merged, kind="stable")
+    positions = np.empty_like(order)
+    positions[order] = np.arange(len(order))
+
+    return merged[order], positions[: len(times)], positions[len(times) :], intervals
+
+
+def unpack_continuation_state(state, initial, step, t, k):
+    """Return the time, value and step to continue a path from.
+
+    ``state`` is None to start from ``(0, initial)``, a ``(time, value)``
+    pair, or a ``(time, value, step)`` state as returned by the
+    ``continue_from`` methods. An explicit ``step`` takes precedence over the
+    step of the state, and without either the step is ``t / k``.
+    """
+    if state is None:
+        state = (0, initial)
+    if len(state) not in (2, 3):
+        raise ValueError("State must be a (time, value) or (time, value, step).")
+    time, value = state[:2]
+    check_numeric(time, "Time")
+    check_numeric(value, "Value")
+    if step is None:
+        step = state[2] if len(state) == 3 else 1.0 * t / k
+    check_positive_number(step, "Step")
+    return time, value, step
+
+
+def write_chunked_path(filename, n, chunk_size, extend, state, initial, dtype=float):
+    """Write a path of n increments to a ``.npy`` file chunk by chunk.
+
+    ``extend(state, k)`` must return the next k values of the path and the
+    state to continue from, as the ``continue_from`` methods do. Only one
+    chunk of values is held in memory at a time. Returns the path as a
+    read-write memory map of the file.
+    """
+    check_positive_integer(n)
+    check_positive_integer(chunk_size, "Chunk size")
+    path = np.lib.format.open_memmap(filename, mode="w+", dtype=dtype, shape=(n + 1,))
+    path[0] = initial
+    for start in range(1, n + 1, chunk_size):
+        k = min(chunk_size, n + 1 - start)
+        path[start : start + k], state = extend(state, k)
+    path.flush()
+    return path
+
+
+def ensure_output(out, shape, dtype=float):
+    """Return ``out`` after checking its shape, or a new array of ``shape``."""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if not isinstance(out, np.ndarray):
+        raise TypeError("Output must be a numpy array.")
+    if out.shape != shape:
+        raise ValueError(f"Output must have shape {shape}.")
+    return out
+
+
+def fill_standard_normal(rng, out):
+    """Fill ``out`` with standard normal variates from ``rng`` in place.
+
+    Draws directly into contiguous arrays when ``rng`` is a
+    :py:class:`numpy.random.Generator`, and otherwise assigns.
+    """
+    if (
+        isinstance(rng, np.random.Generator)
+        and out.flags.c_contiguous
+        and out.dtype in (np.float64, np.float32)
+    ):
+        rng.standard_normal(dtype=out.dtype, out=out)
+    else:
+        out[...] = rng.standard_normal(size=out.shape)
+    return out
+
+
+def integer_dtype(low, high):
+    """Return the smallest integer type holding all values in [low, high].
+
+    Unsigned types are used when ``low`` is nonnegative.
+    """
+    low, high = int(low), int(high)
+    if low >= 0:
+        dtypes = (np.uint8, np.uint16, np.uint32, np.uint64)
+    else:
+        dtypes = (np.int8, np.int16, np.int32, np.int64)
+    for dtype in dtypes:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    raise OverflowError("Values exceed the range of 64 bit integers.")
+
+
+def resolve_integer_dtype(dtype, low, high):
+    """Return the integer type to generate values in [low, high] in.
+
+    ``dtype`` may be None for the default integer type, ``"smallest"`` for
+    the smallest type holding the values, or an integer type, which must
+    hold the values.
+    """
+    if isinstance(dtype, str) and dtype == "smallest":
+        return integer_dtype(low, high)
+    dtype = np.dtype(int if dtype is None else dtype)
+    if dtype.kind not in "iu":
+        raise TypeError("Dtype must be an integer type.")
+    info = np.iinfo(dtype)
+    if int(low) < info.min or int(high) > info.max:
+        raise ValueError(f"Values from {low} to {high} exceed the range of {dtype}.")
+    return dtype
@@ -32,11 +32,23 @@ def check_nonnegative_number(value, name=""):
         raise ValueError(f"{name} value must be nonnegative.")
 
 
+def check_float_dtype(value):
+    """Ensure that the value is a 32 or 64 bit floating point type."""
+    try:
+        dtype = np.dtype(value)
+    except TypeError:
+        raise TypeError("Dtype must be a floating point type.")
+    if dtype not in (np.float32, np.float64):
+        raise TypeError("Dtype must be float32 or float64.")
+    return dtype
+
+
 def check_increments(times):
+    times = np.asarray(times)
     increments = np.diff(times)
-    if np.any([t < 0 for t in times]):
+    if np.any(times < 0):
         raise ValueError("Times must be nonnegative.")
-    if np.any([t <= 0 for t in increments]):
+    if np.any(increments <= 0):
         raise ValueError("Times must be strictly increasing.")
     return increments
 
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from stochastic.ensemble import sample_ensemble
+from stochastic.processes.continuous import BrownianMotion
+from stochastic.processes.continuous import GeometricBrownianMotion
+from stochastic.processes.continuous import MultifractionalBrownianMotion
+from stochastic.processes.continuous import VarianceGammaProcess
+from stochastic.processes.diffusion import OrnsteinUhlenbeckProcess
+from stochastic.processes.noise import ColoredNoise
+from stochastic.processes.noise import FractionalGaussianNoise
+
+
+@pytest.mark.parametrize(
+    "process,kwargs,shape",
+    [
+        (GeometricBrownianMotion(), {"initial": 2}, (10, 17)),
+        (FractionalGaussianNoise(0.7), {}, (10, 16)),
+        (OrnsteinUhlenbeckProcess(), {}, (10, 17)),
+        (MultifractionalBrownianMotion(), {}, (10, 17)),
+    ],
+)
+def test_sample_ensemble(process, kwargs, shape):
+    s = sample_ensemble(process, 10, 16, workers=1, chunk_size=3, seed=42, **kwargs)
+    assert s.shape == shape
+    parallel = sample_ensemble(
+        process, 10, 16, workers=2, chunk_size=3, seed=42, **kwargs
+    )
+    assert (s == parallel).all()
+
+
+def test_sample_ensemble_composite_rng():
+    generator = np.random.default_rng(1)
+    process = VarianceGammaProcess(rng=generator)
+    sample_ensemble(process, 10, 16, workers=2, chunk_size=3, seed=42)
+    assert process.rng is generator
+    assert process.subordinator.rng is generator
+    assert process.process.rng is generator
+
+
+@pytest.mark.parametrize(
+    "process",
+    [
+        BrownianMotion(),
+        FractionalGaussianNoise(0.7),
+        ColoredNoise(1),
+        VarianceGammaProcess(),
+    ],
+)
+def test_sample_ensemble_threads(process):
+    s = sample_ensemble(process, 64, 256, workers=1, chunk_size=2, seed=42)
+    threaded = sample_ensemble(
+        process, 64, 256, workers=8, chunk_size=2, seed=42, backend="threads"
+    )
+    assert (s == threaded).all()
+
+
+def test_sample_ensemble_seed():
+    process = FractionalGaussianNoise(0.7)
+    s1 = sample_ensemble(process, 4, 16, workers=1, seed=np.random.SeedSequence(1))
+    s2 = sample_ensemble(process, 4, 16, workers=1, chunk_size=1, seed=1)
+    assert (s1 == s2).all()
+
+
+def test_sample_ensemble_invalid():
+    process = FractionalGaussianNoise(0.7)
+    with pytest.raises(ValueError):
+        sample_ensemble(process, 4, 16, workers=0)
+    with pytest.raises(TypeError):
+        sample_ensemble(process, 4, 16, chunk_size=1.5)
+    with pytest.raises(ValueError):
+        sample_ensemble(process, 4, 16, backend="cluster")
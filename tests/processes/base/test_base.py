@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pytest
 
@@ -5,6 +7,7 @@ from stochastic import random
 from stochastic.processes.base import BaseProcess
 from stochastic.processes.base import BaseSequenceProcess
 from stochastic.processes.base import BaseTimeProcess
+from stochastic.processes.noise import FractionalGaussianNoise
 
 
 def test_base_process(end, n):
@@ -35,6 +38,48 @@ def test_base_process_rng():
         _ = SubBaseProcess(rng="bad")
 
 
+def test_base_process_dtype():
+    class SubBaseProcess(BaseProcess):
+        _supports_dtype = True
+
+        def sample(self, n):
+            return np.zeros(n, self.dtype)
+
+    sub = SubBaseProcess()
+    assert sub.dtype == random.dtype
+
+    sub.dtype = np.float32
+    assert sub.sample(1).dtype == np.float32
+
+    with pytest.raises(TypeError):
+        sub.dtype = "bad"
+
+
+def test_base_process_dtype_unsupported():
+    class SubBaseProcess(BaseProcess):
+        def sample(self, n):
+            return np.zeros(n, self.dtype)
+
+    sub = SubBaseProcess()
+    random.use_dtype(np.float32)
+    try:
+        assert sub.dtype == np.float64
+    finally:
+        random.use_dtype()
+
+    sub.dtype = np.float64
+    with pytest.raises(ValueError):
+        sub.dtype = np.float32
+
+
+def test_base_process_pickle(n):
+    instance = FractionalGaussianNoise(0.7)
+    instance.sample(n)
+    copy = pickle.loads(pickle.dumps(instance))
+    assert copy.hurst == instance.hurst
+    assert len(copy.sample(n)) == n
+
+
 def test_base_sequence_process(end, n):
     with pytest.raises(TypeError):
         _ = BaseSequenceProcess()
@@ -22,6 +22,11 @@ def n(request):
     return request.param
 
 
+@pytest.fixture(params=[4])
+def m(request):
+    return request.param
+
+
 # Generate some random times for the sample_at() method
 times_random = np.cumsum(np.abs(np.random.normal(size=16)))
 times_random_zero = np.cumsum([0] + list(np.abs(np.random.normal(size=16))))
@@ -33,11 +38,16 @@ def times(request):
 
 
 # Bessel
-@pytest.fixture(params=[0, 1, 1.1])
+@pytest.fixture(params=[0, 1, 1.1, "1", True, np.int64(2)])
 def dim_fixture(request):
     return request.param
 
 
+@pytest.fixture(params=["brownian", "chisquare", None])
+def bessel_algorithm(request):
+    return request.param
+
+
 @pytest.fixture(params=[3])
 def dim(request):
     return request.param
@@ -131,6 +141,22 @@ def mean_func_invalid(request):
     return request.param
 
 
+# StableProcess
+@pytest.fixture(params=[0.5, 1, 1.5, 2])
+def alpha(request):
+    return request.param
+
+
+@pytest.fixture(params=[-1, 0, 0.5])
+def beta(request):
+    return request.param
+
+
+@pytest.fixture(params=[0, 2.1, "1"])
+def alpha_invalid(request):
+    return request.param
+
+
 # MultifractionalBrownianMotion
 def hurst_const(t):
     return 0.5
@@ -203,3 +229,69 @@ def rate_args_invalid(request):
 @pytest.fixture(params=[0])
 def rate_kwargs_invalid(request):
     return request.param
+
+
+# multivariate
+@pytest.fixture(params=[None, [[1, 0.5], [0.5, 1]], [[1, 1], [1, 1]]])
+def correlation(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=[[[1, 2], [2, 1]], [[1, 0.5], [0.4, 1]], [[2, 0], [0, 2]], [1, 0]]
+)
+def correlation_invalid(request):
+    return request.param
+
+
+# jump diffusions
+@pytest.fixture(params=[-0.1])
+def jump_mean(request):
+    return request.param
+
+
+@pytest.fixture(params=[0.2])
+def jump_std(request):
+    return request.param
+
+
+@pytest.fixture(params=[0, 0.4, 1])
+def up_probability(request):
+    return request.param
+
+
+@pytest.fixture(params=[10])
+def up_rate(request):
+    return request.param
+
+
+@pytest.fixture(params=[5])
+def down_rate(request):
+    return request.param
+
+
+# rough Bergomi
+@pytest.fixture(params=[0.1, 0.7])
+def rough_hurst(request):
+    return request.param
+
+
+@pytest.fixture(params=[-0.9, 0])
+def correlation_scalar(request):
+    return request.param
+
+
+# path continuation
+@pytest.fixture(params=[None, (1, 2.0)])
+def state(request):
+    return request.param
+
+
+@pytest.fixture(params=[None, 0.1])
+def step(request):
+    return request.param
+
+
+@pytest.fixture(params=[np.float32, np.float64])
+def dtype(request):
+    return request.param
@@ -1,6 +1,8 @@
 """Test BesselProcess."""
+import numpy as np
 import pytest
 
+from stochastic import random
 from stochastic.processes.continuous import BesselProcess
 
 
@@ -11,10 +13,10 @@ def test_bessel_str_repr(dim, t):
 
 
 def test_bessel_init(dim_fixture, t):
-    if not isinstance(dim_fixture, int):
+    if isinstance(dim_fixture, (str, bool)):
         with pytest.raises(TypeError):
             _ = BesselProcess(dim_fixture, t)
-    elif dim_fixture < 1:
+    elif dim_fixture <= 0:
         with pytest.raises(ValueError):
             _ = BesselProcess(dim_fixture, t)
     else:
@@ -31,3 +33,45 @@ def test_bessel_sample_at(dim, t, times):
     instance = BesselProcess(dim, t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_bessel_sample_algorithm(dim, t, n, bessel_algorithm):
+    instance = BesselProcess(dim, t)
+    s = instance.sample(n, algorithm=bessel_algorithm)
+    assert len(s) == n + 1
+    s = instance.sample_at(instance.times(n), algorithm=bessel_algorithm)
+    assert len(s) == n + 1
+
+
+def test_bessel_sample_numpy_integer_dim(t, n):
+    instance = BesselProcess(np.int64(2), t, rng=np.random.default_rng(3))
+    s = instance.sample(n)
+    instance.rng = np.random.default_rng(3)
+    assert np.array_equal(s, instance.sample(n, algorithm="brownian"))
+
+
+def test_bessel_sample_real_dim(t, n):
+    instance = BesselProcess(1.5, t)
+    s = instance.sample(n)
+    assert len(s) == n + 1
+    assert (s >= 0).all()
+    with pytest.raises(ValueError):
+        _ = instance.sample(n, algorithm="brownian")
+    with pytest.raises(ValueError):
+        _ = instance.sample(n, algorithm="badalgorithm")
+
+
+def test_bessel_use_dtype(dim, t, n):
+    instance = BesselProcess(dim, t)
+    instance.rng = np.random.default_rng(7)
+    expected = instance.sample(n)
+    random.use_dtype(np.float32)
+    try:
+        instance.rng = np.random.default_rng(7)
+        s = instance.sample(n)
+    finally:
+        random.use_dtype()
+    assert s.dtype == np.float64
+    assert np.array_equal(s, expected)
+    with pytest.raises(ValueError):
+        instance.dtype = np.float32
@@ -1,6 +1,8 @@
 """Test BrownianBridge."""
+import numpy as np
 import pytest
 
+from stochastic import random
 from stochastic.processes.continuous import BrownianBridge
 
 
@@ -31,3 +33,19 @@ def test_brownian_bridge_sample_at(b, t, times, threshold):
     s = instance.sample_at(times)
     assert len(s) == len(times)
     assert s[-1] == pytest.approx(instance.b, threshold)
+
+
+def test_brownian_bridge_use_dtype(t, n):
+    instance = BrownianBridge(t=t)
+    instance.rng = np.random.default_rng(7)
+    expected = instance.sample(n)
+    random.use_dtype(np.float32)
+    try:
+        instance.rng = np.random.default_rng(7)
+        s = instance.sample(n)
+    finally:
+        random.use_dtype()
+    assert s.dtype == np.float64
+    assert np.array_equal(s, expected)
+    with pytest.raises(ValueError):
+        instance.dtype = np.float32
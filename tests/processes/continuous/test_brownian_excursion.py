@@ -27,3 +27,16 @@ def test_brownian_excursion_sample_at(t, times, threshold):
     if times[0] == 0:
         assert s[0] == pytest.approx(0, threshold)
     assert s[-1] == pytest.approx(0, threshold)
+
+
+def test_brownian_excursion_sample_batch(t, m, n):
+    instance = BrownianExcursion(t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+    assert (s >= 0).all()
+
+
+def test_brownian_excursion_sample_batch_at(t, m, times):
+    instance = BrownianExcursion(t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, len(times))
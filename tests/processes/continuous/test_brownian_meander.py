@@ -25,3 +25,30 @@ def test_brownian_meander_sample_at(t, times, b, threshold):
     assert (s >= 0).all()
     if times[0] == 0:
         assert s[0] == pytest.approx(0, threshold)
+
+
+def test_brownian_meander_sample_batch(t, m, n, b):
+    instance = BrownianMeander(t)
+    s = instance.sample_batch(m, n, b)
+    assert s.shape == (m, n + 1)
+    assert (s >= 0).all()
+
+
+def test_brownian_meander_sample_batch_invalid(t, m):
+    instance = BrownianMeander(t)
+    with pytest.raises(ValueError):
+        instance.sample_batch(m, 0)
+
+
+def test_brownian_meander_sample_invalid(t):
+    instance = BrownianMeander(t)
+    with pytest.raises(ValueError):
+        instance.sample(0)
+    with pytest.raises(TypeError):
+        instance.sample(2.5)
+
+
+def test_brownian_meander_sample_batch_at(t, m, times, b):
+    instance = BrownianMeander(t)
+    s = instance.sample_batch_at(m, times, b)
+    assert s.shape == (m, len(times))
@@ -1,4 +1,6 @@
 """Test BrownianMotion."""
+import numpy as np
+import pytest
 
 from stochastic.processes.continuous import BrownianMotion
 
@@ -19,3 +21,65 @@ def test_brownian_motion_sample_at(drift, scale, t, times, threshold):
     instance = BrownianMotion(drift, scale, t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_brownian_motion_refine(drift, scale, t, n):
+    instance = BrownianMotion(drift, scale, t)
+    times = instance.times(n)
+    new_times = (times[1:] + times[:-1]) / 2
+    path = np.array([instance.sample(n) for _ in range(4)])
+    merged, refined = instance.refine(times, path, new_times)
+    assert refined.shape == (4, 2 * n + 1)
+    assert (refined[:, ::2] == path).all()
+    merged, refined = instance.refine(times, path[0], new_times[:1])
+    assert len(merged) == len(refined) == n + 2
+
+
+def test_brownian_motion_continue_from(drift, scale, t, n, state, step):
+    instance = BrownianMotion(drift, scale, t)
+    s, new_state = instance.continue_from(state, n, step)
+    assert len(s) == n
+    s, _ = instance.continue_from(new_state, n, step)
+    assert len(s) == n
+
+
+def test_brownian_motion_continue_from_step(drift, scale, t, n):
+    instance = BrownianMotion(drift, scale, t)
+    s, state = instance.continue_from(None, n)
+    assert state[2] == t / n
+    s, state = instance.continue_from(state, 2 * n)
+    assert state[0] == pytest.approx(3 * t)
+    assert state[2] == t / n
+    with pytest.raises(ValueError):
+        instance.continue_from((0, 0, 0, 0), n)
+
+
+def test_brownian_motion_sample_to_file(drift, scale, t, n, tmp_path):
+    instance = BrownianMotion(drift, scale, t)
+    s = instance.sample_to_file(tmp_path / "path.npy", n, chunk_size=5)
+    assert len(s) == n + 1
+    assert len(np.load(tmp_path / "path.npy")) == n + 1
+
+
+def test_brownian_motion_sample_out(drift, scale, t, n):
+    instance = BrownianMotion(drift, scale, t)
+    out = np.empty(n + 1)
+    assert instance.sample(n, out=out) is out
+    assert out[0] == 0
+    with pytest.raises(ValueError):
+        instance.sample(n, out=np.empty(n))
+
+
+def test_brownian_motion_dtype(drift, scale, t, n, times, dtype):
+    instance = BrownianMotion(drift, scale, t, dtype=dtype)
+    assert instance.sample(n).dtype == dtype
+    assert instance.sample_at(times).dtype == dtype
+    s, _ = instance.continue_from(None, n)
+    assert s.dtype == dtype
+
+
+def test_brownian_motion_sample_to_file_dtype(t, n, dtype, tmp_path):
+    instance = BrownianMotion(t=t, dtype=dtype)
+    s = instance.sample_to_file(tmp_path / "path.npy", n, chunk_size=5)
+    assert s.dtype == dtype
+    assert np.load(tmp_path / "path.npy").dtype == dtype
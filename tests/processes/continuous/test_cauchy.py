@@ -1,4 +1,5 @@
 """Test CauchyProcess."""
+import numpy as np
 
 from stochastic.processes.continuous import CauchyProcess
 
@@ -19,3 +20,25 @@ def test_cauchy_process_sample_at(t, times, threshold):
     instance = CauchyProcess(t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_cauchy_process_sample_batch(t, m, n):
+    instance = CauchyProcess(t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+
+
+def test_cauchy_process_rng(t, n):
+    s1 = CauchyProcess(t, rng=np.random.default_rng(42)).sample(n)
+    s2 = CauchyProcess(t, rng=np.random.default_rng(42)).sample(n)
+    assert (s1 == s2).all()
+
+
+def test_cauchy_process_drift_scale(t):
+    instance = CauchyProcess(t)
+    assert instance.drift == 0
+    assert instance.scale == 1
+    instance.drift = 1
+    instance.scale = 2
+    assert instance.process.drift == 1
+    assert instance.process.scale == 2
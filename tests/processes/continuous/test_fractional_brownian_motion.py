@@ -1,4 +1,5 @@
 """Test FractionalBrownianMotion."""
+import numpy as np
 
 from stochastic.processes.continuous import FractionalBrownianMotion
 
@@ -13,3 +14,15 @@ def test_fractional_brownian_motion_sample(hurst, t, n, threshold):
     instance = FractionalBrownianMotion(hurst, t)
     s = instance.sample(n)
     assert len(s) == n + 1
+
+
+def test_fractional_brownian_motion_sample_out(hurst, t, n):
+    instance = FractionalBrownianMotion(hurst, t)
+    out = np.empty(n + 1)
+    assert instance.sample(n, out=out) is out
+    assert out[0] == 0
+
+
+def test_fractional_brownian_motion_dtype(hurst, t, n, dtype):
+    instance = FractionalBrownianMotion(hurst, t, dtype=dtype)
+    assert instance.sample(n).dtype == dtype
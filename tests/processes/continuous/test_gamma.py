@@ -1,4 +1,5 @@
 """Test GammaProcess."""
+import numpy as np
 import pytest
 
 from stochastic.processes.continuous import GammaProcess
@@ -39,3 +40,28 @@ def test_gamma_process_sample_at(mean, variance, t, times, threshold):
     instance = GammaProcess(mean, variance, t=t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_gamma_process_sample_batch(mean, variance, t, m, n):
+    instance = GammaProcess(mean, variance, t=t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+
+
+def test_gamma_process_sample_batch_at(mean, variance, t, m, times):
+    instance = GammaProcess(mean, variance, t=t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, len(times))
+
+
+def test_gamma_process_refine(mean, variance, t, m, n):
+    instance = GammaProcess(mean, variance, t=t)
+    times = instance.times(n)
+    new_times = (times[1:] + times[:-1]) / 2
+    path = instance.sample_batch(m, n)
+    merged, refined = instance.refine(times, path, new_times)
+    assert refined.shape == (m, 2 * n + 1)
+    assert (refined[:, ::2] == path).all()
+    assert (np.diff(refined, axis=1) >= 0).all()
+    merged, refined = instance.refine(times, path[0], new_times[:1])
+    assert len(merged) == len(refined) == n + 2
@@ -1,4 +1,6 @@
 """Test GeometricBrownianMotion."""
+import numpy as np
+import pytest
 
 from stochastic.processes.continuous import GeometricBrownianMotion
 
@@ -21,3 +23,45 @@ def test_geometric_brownian_motion_sample_at(
     instance = GeometricBrownianMotion(drift, volatility, t)
     s = instance.sample_at(times, initial)
     assert len(s) == len(times)
+
+
+def test_geometric_brownian_motion_sample_batch(drift, volatility, t, m, n, initial):
+    instance = GeometricBrownianMotion(drift, volatility, t)
+    s = instance.sample_batch(m, n, initial)
+    assert s.shape == (m, n + 1)
+    assert (s[:, 0] == initial).all()
+
+
+def test_geometric_brownian_motion_sample_batch_at(
+    drift, volatility, t, m, times, initial
+):
+    instance = GeometricBrownianMotion(drift, volatility, t)
+    s = instance.sample_batch_at(m, times, initial)
+    assert s.shape == (m, len(times))
+
+
+def test_geometric_brownian_motion_sample_terminal(drift, volatility, t, m, initial):
+    instance = GeometricBrownianMotion(drift, volatility, t)
+    s = instance.sample_terminal(m, initial)
+    assert s.shape == (m,)
+    assert (s > 0).all()
+
+
+def test_geometric_brownian_motion_continue_from(drift, volatility, t, n, state, step):
+    instance = GeometricBrownianMotion(drift, volatility, t)
+    s, new_state = instance.continue_from(state, n, step)
+    assert len(s) == n
+    assert new_state[1] == s[-1]
+    s, newer_state = instance.continue_from(new_state, 2 * n)
+    assert newer_state[2] == new_state[2]
+
+
+def test_geometric_brownian_motion_sample_out(drift, volatility, t, m, n, initial):
+    instance = GeometricBrownianMotion(drift, volatility, t)
+    out = np.empty(n + 1)
+    assert instance.sample(n, initial, out=out) is out
+    assert out[0] == initial
+    out = np.empty((m, n + 1))
+    assert instance.sample_batch(m, n, initial, out=out) is out
+    with pytest.raises(ValueError):
+        instance.sample_batch(m, n, initial, out=np.empty(n + 1))
@@ -26,3 +26,17 @@ def test_inverse_gaussian_process_sample_at(mean_func, scale, t, times):
     instance = InverseGaussianProcess(mean_func, scale, t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_inverse_gaussian_process_sample_batch(mean_func, scale, t, m, n):
+    instance = InverseGaussianProcess(mean_func, scale, t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+    assert (s[:, 0] == 0).all()
+    assert (s[:, 1:] > 0).all()
+
+
+def test_inverse_gaussian_process_sample_batch_at(mean_func, scale, t, m, times):
+    instance = InverseGaussianProcess(mean_func, scale, t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, len(times))
@@ -0,0 +1,89 @@
+"""Test jump diffusions."""
+import pytest
+
+from stochastic.processes.continuous import JumpDiffusionProcess
+from stochastic.processes.continuous import KouJumpDiffusion
+from stochastic.processes.continuous import MertonJumpDiffusion
+
+
+def test_merton_jump_diffusion_str_repr(
+    drift, volatility, rate, jump_mean, jump_std, t
+):
+    instance = MertonJumpDiffusion(drift, volatility, rate, jump_mean, jump_std, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_merton_jump_diffusion_sample(
+    drift, volatility, rate, jump_mean, jump_std, t, n, initial
+):
+    instance = MertonJumpDiffusion(drift, volatility, rate, jump_mean, jump_std, t)
+    s = instance.sample(n, initial)
+    assert len(s) == n + 1
+
+
+def test_merton_jump_diffusion_sample_at(
+    drift, volatility, rate, jump_mean, jump_std, t, times, initial
+):
+    instance = MertonJumpDiffusion(drift, volatility, rate, jump_mean, jump_std, t)
+    s = instance.sample_at(times, initial)
+    assert len(s) == len(times)
+
+
+def test_merton_jump_diffusion_sample_batch(
+    drift, volatility, rate, jump_mean, jump_std, t, m, n, initial
+):
+    instance = MertonJumpDiffusion(drift, volatility, rate, jump_mean, jump_std, t)
+    s = instance.sample_batch(m, n, initial)
+    assert s.shape == (m, n + 1)
+    assert (s[:, 0] == initial).all()
+
+
+def test_merton_jump_diffusion_sample_terminal(
+    drift, volatility, rate, jump_mean, jump_std, t, m, initial
+):
+    instance = MertonJumpDiffusion(drift, volatility, rate, jump_mean, jump_std, t)
+    s = instance.sample_terminal(m, initial)
+    assert s.shape == (m,)
+
+
+def test_kou_jump_diffusion_str_repr(
+    drift, volatility, rate, up_probability, up_rate, down_rate, t
+):
+    instance = KouJumpDiffusion(
+        drift, volatility, rate, up_probability, up_rate, down_rate, t
+    )
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_kou_jump_diffusion_invalid():
+    with pytest.raises(ValueError):
+        KouJumpDiffusion(up_probability=1.5)
+    with pytest.raises(ValueError):
+        KouJumpDiffusion(up_rate=1)
+
+
+def test_kou_jump_diffusion_sample(
+    drift, volatility, rate, up_probability, up_rate, down_rate, t, n, initial
+):
+    instance = KouJumpDiffusion(
+        drift, volatility, rate, up_probability, up_rate, down_rate, t
+    )
+    s = instance.sample(n, initial)
+    assert len(s) == n + 1
+
+
+def test_kou_jump_diffusion_sample_batch_at(
+    drift, volatility, rate, up_probability, up_rate, down_rate, t, m, times, initial
+):
+    instance = KouJumpDiffusion(
+        drift, volatility, rate, up_probability, up_rate, down_rate, t
+    )
+    s = instance.sample_batch_at(m, times, initial)
+    assert s.shape == (m, len(times))
+
+
+def test_jump_diffusion_process_abstract():
+    with pytest.raises(TypeError):
+        _ = JumpDiffusionProcess()
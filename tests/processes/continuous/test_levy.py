@@ -0,0 +1,21 @@
+"""Test LevySubordinator."""
+
+from stochastic.processes.continuous import LevySubordinator
+
+
+def test_levy_subordinator_str_repr(scale, t):
+    instance = LevySubordinator(scale, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_levy_subordinator_sample(scale, t, n):
+    instance = LevySubordinator(scale, t)
+    s = instance.sample(n)
+    assert len(s) == n + 1
+
+
+def test_levy_subordinator_sample_at(scale, t, times):
+    instance = LevySubordinator(scale, t)
+    s = instance.sample_at(times)
+    assert len(s) == len(times)
@@ -0,0 +1,57 @@
+"""Test MultivariateBrownianMotion."""
+import numpy as np
+import pytest
+
+from stochastic.processes.continuous import MultivariateBrownianMotion
+
+
+def test_multivariate_brownian_motion_str_repr(drift, scale, correlation, t):
+    instance = MultivariateBrownianMotion(drift, scale, correlation, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_multivariate_brownian_motion_correlation_invalid(correlation_invalid):
+    with pytest.raises(ValueError):
+        MultivariateBrownianMotion(correlation=correlation_invalid)
+
+
+def test_multivariate_brownian_motion_correlation_dimension():
+    instance = MultivariateBrownianMotion(drift=[0, 1], correlation=np.eye(2))
+    instance.correlation = [[1, 0.5], [0.5, 1]]
+    with pytest.raises(ValueError):
+        instance.correlation = np.eye(3)
+    assert instance.dim == 2
+    assert instance.sample(4).shape == (2, 5)
+
+
+def test_multivariate_brownian_motion_drift_invalid():
+    with pytest.raises(ValueError):
+        MultivariateBrownianMotion(drift=[0, 1, 2])
+
+
+def test_multivariate_brownian_motion_sample(drift, scale, correlation, t, n):
+    instance = MultivariateBrownianMotion(drift, scale, correlation, t)
+    s = instance.sample(n)
+    assert s.shape == (instance.dim, n + 1)
+
+
+def test_multivariate_brownian_motion_sample_at(drift, scale, correlation, t, times):
+    instance = MultivariateBrownianMotion(drift, scale, correlation, t)
+    s = instance.sample_at(times)
+    assert s.shape == (instance.dim, len(times))
+
+
+def test_multivariate_brownian_motion_sample_batch(drift, scale, correlation, t, m, n):
+    instance = MultivariateBrownianMotion(drift, scale, correlation, t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, instance.dim, n + 1)
+    assert (s[:, :, 0] == 0).all()
+
+
+def test_multivariate_brownian_motion_sample_batch_at(
+    drift, scale, correlation, t, m, times
+):
+    instance = MultivariateBrownianMotion(drift, scale, correlation, t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, instance.dim, len(times))
@@ -0,0 +1,43 @@
+"""Test MultivariateGeometricBrownianMotion."""
+from stochastic.processes.continuous import MultivariateGeometricBrownianMotion
+
+
+def test_multivariate_geometric_brownian_motion_str_repr(
+    drift, volatility, correlation, t
+):
+    instance = MultivariateGeometricBrownianMotion(drift, volatility, correlation, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_multivariate_geometric_brownian_motion_sample(
+    drift, volatility, correlation, t, n, initial
+):
+    instance = MultivariateGeometricBrownianMotion(drift, volatility, correlation, t)
+    s = instance.sample(n, initial)
+    assert s.shape == (instance.dim, n + 1)
+
+
+def test_multivariate_geometric_brownian_motion_sample_at(
+    drift, volatility, correlation, t, times, initial
+):
+    instance = MultivariateGeometricBrownianMotion(drift, volatility, correlation, t)
+    s = instance.sample_at(times, initial)
+    assert s.shape == (instance.dim, len(times))
+
+
+def test_multivariate_geometric_brownian_motion_sample_batch(
+    drift, volatility, correlation, t, m, n, initial
+):
+    instance = MultivariateGeometricBrownianMotion(drift, volatility, correlation, t)
+    s = instance.sample_batch(m, n, initial)
+    assert s.shape == (m, instance.dim, n + 1)
+    assert (s[:, :, 0] == initial).all()
+
+
+def test_multivariate_geometric_brownian_motion_sample_batch_at(
+    drift, volatility, correlation, t, m, times, initial
+):
+    instance = MultivariateGeometricBrownianMotion(drift, volatility, correlation, t)
+    s = instance.sample_batch_at(m, times, initial)
+    assert s.shape == (m, instance.dim, len(times))
@@ -0,0 +1,33 @@
+"""Test NormalInverseGaussianProcess."""
+
+from stochastic.processes.continuous import NormalInverseGaussianProcess
+
+
+def test_normal_inverse_gaussian_str_repr(drift, variance, scale, t):
+    instance = NormalInverseGaussianProcess(drift, variance, scale, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_normal_inverse_gaussian_sample(drift, variance, scale, t, n):
+    instance = NormalInverseGaussianProcess(drift, variance, scale, t)
+    s = instance.sample(n)
+    assert len(s) == n + 1
+
+
+def test_normal_inverse_gaussian_sample_at(drift, variance, scale, t, times):
+    instance = NormalInverseGaussianProcess(drift, variance, scale, t)
+    s = instance.sample_at(times)
+    assert len(s) == len(times)
+
+
+def test_normal_inverse_gaussian_sample_batch(drift, variance, scale, t, m, n):
+    instance = NormalInverseGaussianProcess(drift, variance, scale, t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+
+
+def test_normal_inverse_gaussian_sample_batch_at(drift, variance, scale, t, m, times):
+    instance = NormalInverseGaussianProcess(drift, variance, scale, t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, len(times))
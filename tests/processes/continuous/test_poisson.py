@@ -27,3 +27,11 @@ def test_poisson_process_times(rate, n):
     instance = PoissonProcess(rate)
     with pytest.raises(AttributeError):
         _ = instance.times(n)
+
+
+def test_poisson_process_continue_from(rate, n):
+    instance = PoissonProcess(rate)
+    s, state = instance.continue_from(None, n)
+    assert len(s) == n
+    s, _ = instance.continue_from(state, n)
+    assert (s > state).all()
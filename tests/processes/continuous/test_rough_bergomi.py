@@ -0,0 +1,35 @@
+"""Test RoughBergomiProcess."""
+import pytest
+
+from stochastic.processes.continuous import RoughBergomiProcess
+
+
+def test_rough_bergomi_str_repr(rough_hurst, volatility, correlation_scalar, t):
+    instance = RoughBergomiProcess(rough_hurst, volatility, 0.04, correlation_scalar, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_rough_bergomi_hurst_invalid():
+    with pytest.raises(ValueError):
+        RoughBergomiProcess(hurst=0.5)
+    with pytest.raises(TypeError):
+        RoughBergomiProcess(hurst="0.1")
+
+
+def test_rough_bergomi_sample(
+    rough_hurst, volatility, correlation_scalar, t, n, initial
+):
+    instance = RoughBergomiProcess(rough_hurst, volatility, 0.04, correlation_scalar, t)
+    s = instance.sample(n, initial)
+    assert s.shape == (2, n + 1)
+    assert s[0, 0] == initial
+    assert (s[1] > 0).all()
+
+
+def test_rough_bergomi_sample_batch(
+    rough_hurst, volatility, correlation_scalar, t, m, n, initial
+):
+    instance = RoughBergomiProcess(rough_hurst, volatility, 0.04, correlation_scalar, t)
+    s = instance.sample_batch(m, n, initial)
+    assert s.shape == (m, 2, n + 1)
@@ -11,10 +11,10 @@ def test_squared_bessel_str_repr(dim, t):
 
 
 def test_squared_bessel_init(dim_fixture, t):
-    if not isinstance(dim_fixture, int):
+    if isinstance(dim_fixture, (str, bool)):
         with pytest.raises(TypeError):
             _ = SquaredBesselProcess(dim_fixture, t)
-    elif dim_fixture < 1:
+    elif dim_fixture <= 0:
         with pytest.raises(ValueError):
             _ = SquaredBesselProcess(dim_fixture, t)
     else:
@@ -31,3 +31,22 @@ def test_squared_bessel_sample_at(dim, t, times):
     instance = SquaredBesselProcess(dim, t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_squared_bessel_sample_algorithm(dim, t, n, bessel_algorithm):
+    instance = SquaredBesselProcess(dim, t)
+    s = instance.sample(n, algorithm=bessel_algorithm)
+    assert len(s) == n + 1
+    s = instance.sample_at(instance.times(n), algorithm=bessel_algorithm)
+    assert len(s) == n + 1
+
+
+def test_squared_bessel_sample_real_dim(t, n):
+    instance = SquaredBesselProcess(1.5, t)
+    s = instance.sample(n)
+    assert len(s) == n + 1
+    assert (s >= 0).all()
+    with pytest.raises(ValueError):
+        _ = instance.sample(n, algorithm="brownian")
+    with pytest.raises(ValueError):
+        _ = instance.sample(n, algorithm="badalgorithm")
@@ -0,0 +1,41 @@
+"""Test StableProcess."""
+import pytest
+
+from stochastic.processes.continuous import StableProcess
+
+
+def test_stable_process_str_repr(alpha, beta, scale, drift, t):
+    instance = StableProcess(alpha, beta, scale, drift, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_stable_process_init_invalid(alpha_invalid, t):
+    with pytest.raises((TypeError, ValueError)):
+        _ = StableProcess(alpha_invalid, t=t)
+    with pytest.raises(ValueError):
+        _ = StableProcess(beta=1.1, t=t)
+
+
+def test_stable_process_sample(alpha, beta, scale, drift, t, n):
+    instance = StableProcess(alpha, beta, scale, drift, t)
+    s = instance.sample(n)
+    assert len(s) == n + 1
+
+
+def test_stable_process_sample_at(alpha, beta, scale, drift, t, times):
+    instance = StableProcess(alpha, beta, scale, drift, t)
+    s = instance.sample_at(times)
+    assert len(s) == len(times)
+
+
+def test_stable_process_sample_batch(alpha, beta, scale, drift, t, m, n):
+    instance = StableProcess(alpha, beta, scale, drift, t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+
+
+def test_stable_process_sample_batch_at(alpha, beta, scale, drift, t, m, times):
+    instance = StableProcess(alpha, beta, scale, drift, t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, len(times))
@@ -0,0 +1,87 @@
+"""Test SubordinatedProcess."""
+import numpy as np
+import pytest
+
+from stochastic.processes.continuous import BrownianMotion
+from stochastic.processes.continuous import GammaProcess
+from stochastic.processes.continuous import InverseGaussianProcess
+from stochastic.processes.continuous import LevySubordinator
+from stochastic.processes.continuous import SubordinatedProcess
+
+
+@pytest.fixture(
+    params=[
+        GammaProcess(mean=1, variance=1),
+        InverseGaussianProcess(),
+        LevySubordinator(),
+    ]
+)
+def subordinator(request):
+    return request.param
+
+
+def test_subordinated_process_str_repr(subordinator, t):
+    instance = SubordinatedProcess(subordinator, BrownianMotion(), t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+def test_subordinated_process_invalid(t):
+    with pytest.raises(TypeError):
+        _ = SubordinatedProcess(None, BrownianMotion(), t)
+    with pytest.raises(TypeError):
+        _ = SubordinatedProcess(LevySubordinator(), None, t)
+
+
+def test_subordinated_process_rng(subordinator, t):
+    generator = np.random.default_rng()
+    instance = SubordinatedProcess(subordinator, BrownianMotion(), t, rng=generator)
+    assert instance.subordinator.rng is generator
+    assert instance.process.rng is generator
+    instance.rng = None
+    assert instance.subordinator.rng is not generator
+    assert instance.process.rng is not generator
+
+
+def test_subordinated_process_child_rng(t):
+    g1 = np.random.default_rng(1)
+    g2 = np.random.default_rng(2)
+    instance = SubordinatedProcess(
+        GammaProcess(1, 1, rng=g1), BrownianMotion(rng=g2), t
+    )
+    assert instance.subordinator.rng is g1
+    assert instance.process.rng is g2
+
+
+def test_subordinated_process_inverse_gaussian_mean(t):
+    subordinator = InverseGaussianProcess(mean=lambda x: x**2)
+    with pytest.raises(ValueError):
+        _ = SubordinatedProcess(subordinator, BrownianMotion(), t)
+    instance = SubordinatedProcess(InverseGaussianProcess(), BrownianMotion(), t)
+    instance.subordinator.mean = lambda x: 2 * x
+    with pytest.raises(ValueError):
+        instance.sample(10)
+
+
+def test_subordinated_process_sample(subordinator, t, n):
+    instance = SubordinatedProcess(subordinator, BrownianMotion(), t)
+    s = instance.sample(n)
+    assert len(s) == n + 1
+
+
+def test_subordinated_process_sample_at(subordinator, t, times):
+    instance = SubordinatedProcess(subordinator, BrownianMotion(), t)
+    s = instance.sample_at(times)
+    assert len(s) == len(times)
+
+
+def test_subordinated_process_sample_batch(subordinator, t, m, n):
+    instance = SubordinatedProcess(subordinator, BrownianMotion(), t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+
+
+def test_subordinated_process_sample_batch_at(subordinator, t, m, times):
+    instance = SubordinatedProcess(subordinator, BrownianMotion(), t)
+    s = instance.sample_batch_at(m, times)
+    assert s.shape == (m, len(times))
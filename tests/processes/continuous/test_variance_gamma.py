@@ -25,3 +25,9 @@ def test_variance_gamma_sample_at(drift, variance, scale, t, times, threshold):
     instance = VarianceGammaProcess(drift, variance, scale, t)
     s = instance.sample_at(times)
     assert len(s) == len(times)
+
+
+def test_variance_gamma_sample_batch(drift, variance, scale, t, m, n):
+    instance = VarianceGammaProcess(drift, variance, scale, t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
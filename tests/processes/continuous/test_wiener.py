@@ -7,3 +7,9 @@ def test_wiener_str_repr(t):
     instance = WienerProcess(t)
     assert isinstance(repr(instance), str)
     assert isinstance(str(instance), str)
+
+
+def test_wiener_dtype(t, n, dtype):
+    instance = WienerProcess(t, dtype=dtype)
+    assert instance.dtype == dtype
+    assert instance.sample(n).dtype == dtype
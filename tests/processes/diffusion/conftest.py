@@ -46,3 +46,33 @@ def vol(request):
 @pytest.fixture(params=[1])
 def volexp(request):
     return request.param
+
+
+@pytest.fixture(params=[4])
+def m(request):
+    return request.param
+
+
+@pytest.fixture(params=[-0.7, 0, 1])
+def correlation(request):
+    return request.param
+
+
+@pytest.fixture(params=[None, 0, 0.5])
+def variance(request):
+    return request.param
+
+
+@pytest.fixture(params=["qe", "truncation"])
+def heston_algorithm(request):
+    return request.param
+
+
+@pytest.fixture(params=[None, (1, 2.0)])
+def state(request):
+    return request.param
+
+
+@pytest.fixture(params=[None, 0.1])
+def step(request):
+    return request.param
@@ -1,4 +1,8 @@
 """Diffusion process tests."""
+import numpy as np
+import pytest
+
+from stochastic import random
 from stochastic.processes.diffusion import DiffusionProcess
 
 
@@ -12,3 +16,28 @@ def test_diffusion_process_sample(speed, mean, vol, volexp, t, n, initial, thres
     instance = DiffusionProcess(speed, mean, vol, volexp, t)
     s = instance.sample(n, initial)
     assert len(s) == n + 1
+
+
+def test_diffusion_process_continue_from(speed, mean, vol, volexp, t, n, state, step):
+    instance = DiffusionProcess(speed, mean, vol, volexp, t)
+    s, new_state = instance.continue_from(state, n, step)
+    assert len(s) == n
+    assert new_state[1] == s[-1]
+    s, newer_state = instance.continue_from(new_state, 2 * n)
+    assert newer_state[2] == new_state[2]
+
+
+def test_diffusion_process_use_dtype(speed, mean, vol, volexp, t, n):
+    instance = DiffusionProcess(speed, mean, vol, volexp, t)
+    instance.rng = np.random.default_rng(7)
+    expected = instance.sample(n)
+    random.use_dtype(np.float32)
+    try:
+        instance.rng = np.random.default_rng(7)
+        s = instance.sample(n)
+    finally:
+        random.use_dtype()
+    assert s.dtype == np.float64
+    assert np.array_equal(s, expected)
+    with pytest.raises(ValueError):
+        instance.dtype = np.float32
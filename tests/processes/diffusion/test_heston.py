@@ -0,0 +1,48 @@
+"""Heston tests."""
+import numpy as np
+import pytest
+
+from stochastic.processes.diffusion import HestonProcess
+
+
+def test_heston_str_repr(drift, speed, mean, vol, correlation, t):
+    instance = HestonProcess(drift, speed, mean, vol, correlation, t)
+    assert isinstance(repr(instance), str)
+    assert isinstance(str(instance), str)
+
+
+@pytest.mark.parametrize("correlation_invalid", [-1.1, 2, "0"])
+def test_heston_correlation_invalid(correlation_invalid):
+    with pytest.raises((TypeError, ValueError)):
+        HestonProcess(correlation=correlation_invalid)
+
+
+def test_heston_sample(
+    drift, speed, mean, vol, correlation, t, n, initial, variance, heston_algorithm
+):
+    instance = HestonProcess(drift, speed, mean, vol, correlation, t)
+    s = instance.sample(n, initial, variance, heston_algorithm)
+    assert s.shape == (2, n + 1)
+    assert (s[1] >= 0).all()
+
+
+def test_heston_sample_batch(
+    drift, speed, mean, vol, correlation, t, m, n, initial, variance, heston_algorithm
+):
+    instance = HestonProcess(drift, speed, mean, vol, correlation, t)
+    s = instance.sample_batch(m, n, initial, variance, heston_algorithm)
+    assert s.shape == (m, 2, n + 1)
+    assert (s[:, 0, 0] == initial).all()
+
+
+def test_heston_sample_algorithm_invalid(n):
+    instance = HestonProcess()
+    with pytest.raises(ValueError):
+        instance.sample(n, algorithm="euler")
+
+
+def test_heston_qe_martingale():
+    instance = HestonProcess(0.05, 0.5, 0.04, 1, -0.9, rng=np.random.default_rng(1))
+    prices = instance.sample_batch(200000, 4, 100, 0.04)[:, 0, -1]
+    error = prices.std() / np.sqrt(len(prices))
+    assert abs(prices.mean() - 100 * np.exp(0.05)) < 4 * error
@@ -1,4 +1,5 @@
 """Bernoulli tests."""
+import numpy as np
 import pytest
 
 from stochastic.processes.discrete import BernoulliProcess
@@ -28,3 +29,13 @@ def test_bernoulli_probability(p_fixture):
     else:
         instance = BernoulliProcess(p_fixture)
         assert True
+
+
+def test_bernoulli_dtype(p, n):
+    instance = BernoulliProcess(p)
+    s = instance.sample(n)
+    assert s.dtype == int
+    assert (-s <= 0).all()
+    assert instance.sample(n, dtype=bool).dtype == bool
+    assert instance.sample(n, dtype="smallest").dtype == np.uint8
+    assert instance.sample(n, dtype=np.int16).dtype == np.int16
@@ -1,4 +1,5 @@
 """Chinese restaurant tests."""
+import numpy as np
 import pytest
 
 from stochastic.processes.discrete import ChineseRestaurantProcess
@@ -18,6 +19,7 @@ def test_chinese_restaurant_sample_partition(discount, strength, n):
     for table in s:
         for customer in table:
             assert customer in customers
+    assert sorted(np.concatenate(list(s))) == customers
 
 
 def test_chinese_restaurant_sample(discount, strength, n):
@@ -60,3 +62,15 @@ def test_chinese_restaurant_partition_to_sequence(discount, strength, n):
 def test_chinese_restaurant_probability(discount, strength):
     with pytest.raises(ValueError):
         instance = ChineseRestaurantProcess(discount, strength)
+
+
+def test_chinese_restaurant_dtype(discount, strength, n):
+    instance = ChineseRestaurantProcess(discount, strength)
+    assert instance.sample(n).dtype == int
+    s = instance.sample(n, dtype="smallest")
+    assert s.dtype == np.uint8
+    partition = instance.sequence_to_partition(s)
+    assert instance.partition_to_sequence(partition).dtype == int
+    sequence = instance.partition_to_sequence(partition, dtype="smallest")
+    assert sequence.dtype == np.uint8
+    assert np.array_equal(sequence, s)
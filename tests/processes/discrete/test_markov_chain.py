@@ -1,4 +1,5 @@
 """Markov chain tests."""
+import numpy as np
 import pytest
 
 from stochastic.processes.discrete import MarkovChain
@@ -31,3 +32,33 @@ def test_markov_chain_sample(transition, initial, n):
 def test_markov_chain_probability(transition, initial):
     with pytest.raises(ValueError):
         instance = MarkovChain(transition, initial)
+
+
+def test_markov_chain_continue_from(transition, initial, n):
+    instance = MarkovChain(transition, initial)
+    s, state = instance.continue_from(None, n)
+    assert len(s) == n
+    s, _ = instance.continue_from(state, n)
+    states = list(range(len(instance.initial)))
+    for state in s:
+        assert state in states
+
+
+def test_markov_chain_continue_from_initial(transition, initial, n):
+    instance = MarkovChain(transition, initial, rng=np.random.default_rng(5))
+    s, _ = instance.continue_from(None, n)
+    instance.rng = np.random.default_rng(5)
+    assert np.array_equal(s, instance.sample(n + 1)[1:])
+
+
+def test_markov_chain_continue_from_invalid(transition, n):
+    instance = MarkovChain(transition)
+    with pytest.raises(ValueError):
+        instance.continue_from(5, n)
+
+
+def test_markov_chain_dtype(transition, initial, n):
+    instance = MarkovChain(transition, initial)
+    assert instance.sample(n).dtype == int
+    assert instance.sample(n, dtype="smallest").dtype == np.uint8
+    assert instance.continue_from(0, n, dtype=np.int16)[0].dtype == np.int16
@@ -1,4 +1,5 @@
 """Moran process tests."""
+import numpy as np
 import pytest
 
 from stochastic.processes.discrete import MoranProcess
@@ -34,3 +35,9 @@ def test_moran_process_(n, start_fixture):
     instance = MoranProcess(20)
     with pytest.raises((ValueError, TypeError)):
         s = instance.sample(20, start_fixture)
+
+
+def test_moran_process_dtype(maximum, n, start):
+    instance = MoranProcess(maximum)
+    assert instance.sample(n, start).dtype == int
+    assert instance.sample(n, start, dtype="smallest").dtype == np.uint8
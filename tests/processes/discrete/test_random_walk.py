@@ -1,4 +1,5 @@
 """Random walk tests."""
+import numpy as np
 import pytest
 
 from stochastic.processes.discrete import RandomWalk
@@ -30,3 +31,45 @@ def test_random_walk_bad_steps(steps_fixture, weights):
 def test_random_walk_bad_weights(steps, weights_fixture):
     with pytest.raises((ValueError, TypeError)):
         instance = RandomWalk(steps, weights_fixture)
+
+
+def test_random_walk_continue_from(steps, weights, n):
+    instance = RandomWalk(steps, weights)
+    s, state = instance.continue_from(None, n)
+    assert len(s) == n
+    s, _ = instance.continue_from(state, n)
+    assert len(s) == n
+
+
+def test_random_walk_sample_to_file(steps, weights, n, tmp_path):
+    instance = RandomWalk(steps, weights)
+    s = instance.sample_to_file(tmp_path / "walk.npy", n, chunk_size=5)
+    assert len(s) == n + 1
+    assert s[0] == 0
+
+
+def test_random_walk_sample_out(steps, weights, n):
+    instance = RandomWalk(steps, weights)
+    out = np.empty(n + 1)
+    assert instance.sample(n, out=out) is out
+    assert out[0] == 0
+
+
+def test_random_walk_dtype(steps, weights, n, tmp_path):
+    instance = RandomWalk(steps, weights)
+    assert instance.sample_increments(n).dtype == int
+    assert instance.sample(n).dtype == int
+    assert instance.sample_increments(n, dtype="smallest").dtype == np.int8
+    assert instance.sample(n, dtype="smallest").dtype == np.int8
+    assert instance.sample(1000, dtype="smallest").dtype == np.int16
+    assert instance.sample(n, dtype=np.int32).dtype == np.int32
+    assert instance.continue_from(None, n, dtype="smallest")[0].dtype == np.int8
+    s = instance.sample_to_file(tmp_path / "walk.npy", 1000, 10, dtype="smallest")
+    assert s.dtype == np.int16
+    assert RandomWalk([-0.5, 1.0]).sample(n).dtype == np.float64
+    with pytest.raises(ValueError):
+        instance.sample(1000, dtype=np.int8)
+    with pytest.raises(TypeError):
+        instance.sample(n, dtype=float)
+    with pytest.raises(TypeError):
+        RandomWalk([-0.5, 1.0]).sample(n, dtype="smallest")
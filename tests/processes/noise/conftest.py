@@ -78,3 +78,18 @@ def beta(request):
 )
 def colored_noise_class(request):
     return request.param
+
+
+@pytest.fixture(params=[4])
+def m(request):
+    return request.param
+
+
+@pytest.fixture(params=[1, 64])
+def order(request):
+    return request.param
+
+
+@pytest.fixture(params=[np.float32, np.float64])
+def dtype(request):
+    return request.param
@@ -1,4 +1,8 @@
 """Test ColoredNoise."""
+import numpy as np
+import pytest
+
+from stochastic.processes.noise import ColoredNoise
 
 
 def test_colored_noise_str_repr(t, colored_noise_class):
@@ -11,3 +15,41 @@ def test_colored_noise_sample(t, n, beta, colored_noise_class):
     instance = colored_noise_class(t)
     s = instance.sample(n)
     assert len(s) == n + 1
+
+
+def test_colored_noise_sample_batch(t, m, n, colored_noise_class):
+    instance = colored_noise_class(t)
+    s = instance.sample_batch(m, n)
+    assert s.shape == (m, n + 1)
+
+
+def test_colored_noise_rng(t, n, beta):
+    s1 = ColoredNoise(beta, t, rng=np.random.default_rng(42)).sample(n)
+    s2 = ColoredNoise(beta, t, rng=np.random.default_rng(42)).sample(n)
+    assert (s1 == s2).all()
+
+
+def test_colored_noise_stream(t, n, order, colored_noise_class):
+    instance = colored_noise_class(t)
+    stream = instance.stream(n, order)
+    for _ in range(3):
+        assert len(next(stream)) == n
+
+
+def test_colored_noise_stream_invalid(t):
+    instance = ColoredNoise(1, t)
+    with pytest.raises(ValueError):
+        instance.stream(0)
+
+
+def test_colored_noise_dtype(t, m, n, beta, dtype):
+    instance = ColoredNoise(beta, t, dtype=dtype)
+    assert instance.sample(n).dtype == dtype
+    assert instance.sample_batch(m, n).dtype == dtype
+    assert next(instance.stream(n, 4)).dtype == dtype
+
+
+def test_colored_noise_class_dtype(t, n, colored_noise_class, dtype):
+    instance = colored_noise_class(t=t, dtype=dtype)
+    assert instance.dtype == dtype
+    assert instance.sample(n).dtype == dtype
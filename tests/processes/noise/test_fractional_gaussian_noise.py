@@ -25,3 +25,23 @@ def test_fractional_gaussian_noise_sample(hurst, t, algorithm, n):
     instance = FractionalGaussianNoise(hurst, t)
     s = instance.sample(n, algorithm)
     assert len(s) == n
+
+
+def test_fractional_gaussian_noise_stream(hurst, t, n):
+    instance = FractionalGaussianNoise(hurst, t)
+    stream = instance.stream(n, step=t / n)
+    for _ in range(3):
+        assert len(next(stream)) == n
+
+
+def test_fractional_gaussian_noise_stream_path(hurst, t, n):
+    instance = FractionalGaussianNoise(hurst, t)
+    path = instance.sample(n)
+    stream = instance.stream(n, path=path, step=t / n)
+    assert len(next(stream)) == n
+
+
+def test_fractional_gaussian_noise_dtype(hurst, t, algorithm, n, dtype):
+    instance = FractionalGaussianNoise(hurst, t, dtype=dtype)
+    assert instance.sample(n, algorithm).dtype == dtype
+    assert next(instance.stream(n)).dtype == dtype
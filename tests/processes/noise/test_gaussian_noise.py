@@ -1,4 +1,7 @@
 """Test GaussianNoise."""
+import numpy as np
+import pytest
+
 from stochastic.processes.noise import GaussianNoise
 
 
@@ -21,3 +24,17 @@ def test_gaussian_noise_sample_at(t, times):
         assert len(s) == len(times) - 1
     else:
         assert len(s) == len(times)
+
+
+def test_gaussian_noise_sample_out(t, n):
+    instance = GaussianNoise(t)
+    out = np.empty(n)
+    assert instance.sample(n, out=out) is out
+    with pytest.raises(ValueError):
+        instance.sample(n, out=np.empty(n + 1))
+
+
+def test_gaussian_noise_dtype(t, n, times, dtype):
+    instance = GaussianNoise(t, dtype=dtype)
+    assert instance.sample(n).dtype == dtype
+    assert instance.sample_at(times).dtype == dtype
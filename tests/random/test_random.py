@@ -41,3 +41,12 @@ def test_random_seed():
     random.seed(42)
     after = random.generator.uniform()
     assert before == after
+
+
+def test_random_use_dtype():
+    random.use_dtype(np.float32)
+    assert random.dtype == np.float32
+    with pytest.raises(TypeError):
+        random.use_dtype(int)
+    random.use_dtype()
+    assert random.dtype == np.float64
@@ -1,8 +1,18 @@
+import pickle
+
 import numpy as np
+import pytest
 
+from stochastic.utils import ensure_output
 from stochastic.utils import ensure_single_arg_constant_function
+from stochastic.utils import fill_standard_normal
 from stochastic.utils import generate_times
+from stochastic.utils import integer_dtype
+from stochastic.utils import merge_times
+from stochastic.utils import resolve_integer_dtype
 from stochastic.utils import single_arg_constant_function
+from stochastic.utils import unpack_continuation_state
+from stochastic.utils import write_chunked_path
 
 
 def test_generate_times(end, n):
@@ -14,6 +24,7 @@ def test_single_arg_constant_function():
     const = single_arg_constant_function(4)
     assert callable(const)
     assert const(1) == 4
+    assert pickle.loads(pickle.dumps(const))(1) == 4
 
 
 def test_ensure_single_arg_constant_function():
@@ -23,3 +34,71 @@ def test_ensure_single_arg_constant_function():
     func = ensure_single_arg_constant_function(lambda x: 5)
     assert callable(func)
     assert func(1) == 5
+
+
+def test_merge_times():
+    merged, old, new, intervals = merge_times([0, 1, 2], [1.5, 0.5, 0.7])
+    assert (merged == [0, 0.5, 0.7, 1, 1.5, 2]).all()
+    assert (merged[old] == [0, 1, 2]).all()
+    assert (merged[new] == [0.5, 0.7, 1.5]).all()
+    assert (intervals == [0, 0, 1]).all()
+    for new_times in ([], [1], [0.5, 0.5], [2.5]):
+        with pytest.raises(ValueError):
+            merge_times([0, 1, 2], new_times)
+
+
+def test_write_chunked_path(tmp_path):
+    def extend(state, k):
+        values = state + np.arange(1, k + 1)
+        return values, values[-1]
+
+    path = write_chunked_path(tmp_path / "path.npy", 10, 3, extend, 0, 0)
+    assert (np.load(tmp_path / "path.npy") == np.arange(11)).all()
+    assert (path == np.arange(11)).all()
+
+
+def test_ensure_output():
+    out = np.empty(3)
+    assert ensure_output(out, (3,)) is out
+    assert ensure_output(None, (2, 3)).shape == (2, 3)
+    with pytest.raises(ValueError):
+        ensure_output(out, (4,))
+    with pytest.raises(TypeError):
+        ensure_output([0, 0, 0], (3,))
+
+
+@pytest.mark.parametrize("rng", [np.random.default_rng(), np.random])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_fill_standard_normal(rng, dtype):
+    out = np.zeros(8, dtype=dtype)
+    assert fill_standard_normal(rng, out) is out
+    assert (out != 0).all()
+    fill_standard_normal(rng, out[::2])
+
+
+def test_integer_dtype():
+    assert integer_dtype(0, 1) == np.uint8
+    assert integer_dtype(-1, 1) == np.int8
+    assert integer_dtype(0, 256) == np.uint16
+    assert integer_dtype(-(2**40), 0) == np.int64
+    with pytest.raises(OverflowError):
+        integer_dtype(-1, 2**63)
+
+
+def test_resolve_integer_dtype():
+    assert resolve_integer_dtype(None, -1, 1) == int
+    assert resolve_integer_dtype("smallest", -1, 1) == np.int8
+    assert resolve_integer_dtype(np.uint16, 0, 256) == np.uint16
+    with pytest.raises(ValueError):
+        resolve_integer_dtype(np.uint8, -1, 1)
+    with pytest.raises(TypeError):
+        resolve_integer_dtype(float, 0, 1)
+
+
+def test_unpack_continuation_state():
+    assert unpack_continuation_state(None, 1, None, 2, 4) == (0, 1, 0.5)
+    assert unpack_continuation_state((1, 2), 1, 0.1, 2, 4) == (1, 2, 0.1)
+    assert unpack_continuation_state((1, 2, 0.2), 1, None, 2, 4) == (1, 2, 0.2)
+    assert unpack_continuation_state((1, 2, 0.2), 1, 0.1, 2, 4) == (1, 2, 0.1)
+    with pytest.raises(ValueError):
+        unpack_continuation_state((1,), 1, None, 2, 4)